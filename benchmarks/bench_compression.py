@@ -0,0 +1,76 @@
+"""
+compares bytes on the wire and latency of posting large events with and without request compression against the
+in-process fake flyte server.
+
+    python -m benchmarks.bench_compression --size 2000000 --events 20
+"""
+import argparse
+import asyncio
+import random
+import string
+import time
+
+from flyte.client.classes import Event, Pack
+from flyte.client.client import Client
+from flyte.testing import FakeFlyteServer
+
+
+def log_extract(size: int) -> str:
+    """builds a log-like payload, repetitive but not trivially compressible"""
+    lines = []
+    length = 0
+    while length < size:
+        line = (
+            f"2020-08-25T13:30:07Z INFO request {random.randint(0, 10 ** 6)} "
+            + "".join(random.choices(string.ascii_lowercase, k=40))
+        )
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
+
+async def run(
+    server: FakeFlyteServer, client: Client, payload: str, events: int
+) -> (int, float):
+    await client.create_pack(Pack(name="bench"))
+    before = server.bytes_received
+    start = time.perf_counter()
+    for _ in range(events):
+        await client.post_event(Event(event="LogExtracted", payload=payload))
+    elapsed = time.perf_counter() - start
+    return (server.bytes_received - before) // events, elapsed / events
+
+
+async def main(args):
+    server = FakeFlyteServer()
+    await server.start()
+    payload = log_extract(args.size)
+    bandwidth = args.bandwidth_mbit * 10 ** 6 / 8
+    try:
+        print(
+            f"{'compression':<12}{'bytes/event':>14}{'latency ms':>12}{'at ' + str(args.bandwidth_mbit) + 'Mbit ms':>16}"
+        )
+        for compression in (None, "deflate", "gzip"):
+            async with Client(url=server.url, compression=compression) as client:
+                sent, latency = await run(server, client, payload, args.events)
+            on_link = (latency + sent / bandwidth) * 1000
+            print(
+                f"{str(compression):<12}{sent:>14}{latency * 1000:>12.2f}{on_link:>16.2f}"
+            )
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--size", type=int, default=2 * 1024 * 1024, help="payload size in bytes"
+    )
+    parser.add_argument("--events", type=int, default=10, help="events posted per mode")
+    parser.add_argument(
+        "--bandwidth-mbit",
+        type=int,
+        default=100,
+        help="link speed used to estimate transfer time",
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,85 @@
+"""
+compares a pack run by flyte.run on a default event loop against a tuned one (uvloop when installed, a larger default
+executor and higher gc thresholds), with the fake flyte server listening on localhost in another thread.
+
+    python -m benchmarks.bench_event_loop --actions 5000
+"""
+import argparse
+import asyncio
+import threading
+import time
+
+import flyte
+from flyte import Client, Pack
+from flyte.pack.classes import PackDef, Command, CommandHandler, Event, EventDef
+from flyte.testing import FakeFlyteServer
+
+ECHOED = EventDef(name="Echoed")
+
+
+class EchoCommandHandler(CommandHandler):
+    async def handle(self, request) -> Event:
+        return Event(
+            eventDef=ECHOED, payload={"echo": request, "items": list(range(50))}
+        )
+
+
+def start_server() -> (FakeFlyteServer, asyncio.AbstractEventLoop):
+    loop = asyncio.new_event_loop()
+    server = FakeFlyteServer()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+    return server, loop
+
+
+def measure(server: FakeFlyteServer, actions: int, **options) -> float:
+    """returns the actions completed per second"""
+    server.completed.clear()
+    for i in range(actions):
+        server.add_action("echo", f"input-{i}")
+    pack = Pack(
+        pack_def=PackDef(
+            name="bench",
+            labels={},
+            event_defs=[],
+            help_url="",
+            commands=[
+                Command(
+                    name="echo", handler=EchoCommandHandler(), output_events=[ECHOED]
+                )
+            ],
+        ),
+        client=Client(url=server.url),
+        polling_frequency_in_seconds=0.001,
+        max_concurrency=32,
+    )
+    pack.continue_running = lambda: server.pending_actions > 0
+    start = time.perf_counter()
+    flyte.run(pack, **options)
+    return len(server.completed) / (time.perf_counter() - start)
+
+
+def main(args):
+    server, loop = start_server()
+    try:
+        default = measure(server, args.actions, use_uvloop=False)
+        tuned = measure(
+            server, args.actions, executor_workers=32, gc_thresholds=(50_000, 20, 20),
+        )
+        uvloop = flyte.runner.new_event_loop()
+        tuned_name = f"tuned ({type(uvloop).__module__.split('.')[0]})"
+        uvloop.close()
+        print(f"{'loop':<24}{'actions/s':>12}")
+        print(f"{'default':<24}{default:>12.0f}")
+        print(f"{tuned_name:<24}{tuned:>12.0f}")
+    finally:
+        asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--actions", type=int, default=5000, help="actions completed per loop"
+    )
+    main(parser.parse_args())
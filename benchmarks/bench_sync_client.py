@@ -0,0 +1,76 @@
+"""
+compares posting events from synchronous code by running asyncio.run with a new client per call against a SyncClient
+that keeps one event loop and connection pool in a background thread, with the fake flyte server listening on
+localhost.
+
+    python -m benchmarks.bench_sync_client --events 500 --threads 4
+"""
+import argparse
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from flyte.client.classes import Event, Pack
+from flyte.client.client import Client
+from flyte.client.sync import SyncClient
+from flyte.testing import FakeFlyteServer
+
+
+def start_server() -> (FakeFlyteServer, asyncio.AbstractEventLoop):
+    """runs the fake server on its own loop thread so that both modes go through real sockets"""
+    loop = asyncio.new_event_loop()
+    server = FakeFlyteServer()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+    return server, loop
+
+
+def post_with_asyncio_run(url: str, event: Event):
+    async def post():
+        async with Client(url=url) as client:
+            await client.create_pack(Pack(name="bench"))
+            await client.post_event(event)
+
+    asyncio.run(post())
+
+
+def measure(post, events: int, threads: int) -> float:
+    """returns the events posted per second"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        list(
+            executor.map(
+                lambda i: post(Event(event="Observed", payload=str(i))), range(events)
+            )
+        )
+    return events / (time.perf_counter() - start)
+
+
+def main(args):
+    server, loop = start_server()
+    try:
+        # asyncio.run has to register the pack on every call as each call gets a new client
+        per_call = measure(
+            lambda e: post_with_asyncio_run(server.url, e), args.events, args.threads
+        )
+        with SyncClient(url=server.url) as client:
+            client.create_pack(Pack(name="bench"))
+            shared = measure(client.post_event, args.events, args.threads)
+        print(f"{'mode':<24}{'events/s':>12}")
+        print(f"{'asyncio.run per call':<24}{per_call:>12.0f}")
+        print(f"{'SyncClient':<24}{shared:>12.0f}")
+    finally:
+        asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--events", type=int, default=500, help="events posted per mode"
+    )
+    parser.add_argument(
+        "--threads", type=int, default=4, help="threads posting events concurrently"
+    )
+    main(parser.parse_args())
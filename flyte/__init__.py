@@ -3,6 +3,7 @@ from logging import NullHandler
 
 from flyte.client.client import Client  # noqa
 from flyte.pack.pack import Pack  # noqa
+from flyte.runner import run  # noqa
 
 # Set default logging handler to avoid "No handler found" warnings.
 logging.getLogger(__name__).addHandler(NullHandler())
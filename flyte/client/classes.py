@@ -1,5 +1,7 @@
+import json
+import uuid
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
 
 from dataclasses_json import dataclass_json
 
@@ -33,6 +35,30 @@ class Action:
         return find_url_by_relative_name(self.links, "actionResult")
 
 
+class RawPayload:
+    """
+    event payload that is already serialized as json, for packs that receive payloads as json text. It is written
+    into the request body as it is, without being decoded, re-encoded or escaped. The json is not validated.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Union[str, bytes]) -> None:
+        """
+        :param data json text, bytes must be utf-8 encoded
+        """
+        self.data = data.encode("utf-8") if isinstance(data, str) else data
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, RawPayload) and self.data == other.data
+
+    def __hash__(self) -> int:
+        return hash(self.data)
+
+    def __repr__(self) -> str:
+        return f"RawPayload({self.data[:64]!r})"
+
+
 @dataclass
 @dataclass_json
 class Event:
@@ -44,6 +70,52 @@ class Event:
     payload: str = None
 
 
+def encode_event(e: Event) -> Union[str, bytes]:
+    """serializes an event, splicing raw payloads into the body without encoding them again
+    :param e event
+    :return json, as bytes when the payload is a RawPayload
+    """
+    if not isinstance(e.payload, RawPayload):
+        try:
+            return e.to_json()
+        except TypeError:
+            # raw payloads nested in the payload, e.g. by a count coalesce policy
+            return _encode_nested_raw_payloads(e)
+    return b"".join(
+        (
+            json.dumps({"event": e.event})[:-1].encode("utf-8"),
+            b', "payload": ',
+            e.payload.data,
+            b"}",
+        )
+    )
+
+
+def _encode_nested_raw_payloads(e: Event) -> bytes:
+    """encodes the event with a placeholder string for each raw payload, then splices the raw payloads in place of
+    the placeholders"""
+    raw = []
+    # unique per call so that strings of the payload can't be mistaken for a placeholder
+    token = uuid.uuid4().hex
+
+    def placeholder(o):
+        if not isinstance(o, RawPayload):
+            raise TypeError(
+                f"Object of type {type(o).__name__} is not JSON serializable"
+            )
+        raw.append(o.data)
+        return f"\0{token}-{len(raw) - 1}\0"
+
+    body = json.dumps({"event": e.event, "payload": e.payload}, default=placeholder)
+    parts = body.encode("utf-8").split(f'"\\u0000{token}-'.encode("utf-8"))
+    spliced = [parts[0]]
+    for part in parts[1:]:
+        index, _, rest = part.partition(b'\\u0000"')
+        spliced.append(raw[int(index)])
+        spliced.append(rest)
+    return b"".join(spliced)
+
+
 @dataclass
 @dataclass_json
 class Command:
@@ -86,6 +158,20 @@ class Pack:
         :raises ValueError if link not found"""
         return find_url_by_relative_name(self.links, "event")
 
+    def get_action_stream_url(self) -> Optional[str]:
+        """returns the url to subscribe to pushed actions, None if the server only supports polling"""
+        try:
+            return find_url_by_relative_name(self.links, "actionStream")
+        except ValueError:
+            return None
+
+    def get_action_results_url(self) -> Optional[str]:
+        """returns the url to complete several actions in one request, None if the server has no batch endpoint"""
+        try:
+            return find_url_by_relative_name(self.links, "actionResults")
+        except ValueError:
+            return None
+
 
 def find_url_by_relative_name(links: List[Link], rel_name: str) -> str:
     """
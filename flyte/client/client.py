@@ -1,11 +1,42 @@
+import asyncio
 import json
 import logging
-from typing import Optional
+import time
+import uuid
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-import aiohttp
+from flyte.client import deadline
+from flyte.client.compression import compress, supported_encodings
+from flyte.client.errors import (
+    FlyteClientError,
+    FlyteDeadlineExceededError,
+    FlyteRequestError,
+)
+from flyte.client.classes import (
+    Link,
+    Event,
+    Action,
+    Pack,
+    encode_event,
+    find_url_by_relative_name,
+)
+from flyte.client.endpoints import EndpointPool
+from flyte.client.hedging import LatencyTracker
+from flyte.client.logs import SummarizedLog
+from flyte.client.polling import AdaptivePollInterval
+from flyte.client.tracing import Tracer
+from flyte.client.transport import Transport, AiohttpTransport
 
-from flyte.client.errors import FlyteClientError, FlyteRequestError
-from flyte.client.classes import Link, Event, Action, Pack, find_url_by_relative_name
+_TEXT_CONTENT_TYPE = "text/plain; charset=utf-8"
 
 
 class Client:
@@ -14,17 +45,66 @@ class Client:
     """
 
     __BASE_URL = "http://localhost:8080"
+    _FAILOVER_STATUSES = (502, 503, 504)
 
     def __init__(
-        self, url=__BASE_URL, timeout=5, insecure_skip_verify=False, version="v1"
+        self,
+        url: Union[str, List[str]] = __BASE_URL,
+        timeout=5,
+        insecure_skip_verify=False,
+        version="v1",
+        compression=None,
+        compression_threshold_in_bytes=64 * 1024,
+        compression_level=6,
+        transport: Transport = None,
+        tracer: Tracer = None,
+        hedge_quantile: float = None,
+        hedge_take_action=False,
     ) -> None:
+        """
+        :param url base url of the flyte api, or the base urls of several flyte api nodes. With several nodes each
+        request goes to the healthy node with the lowest recent latency and fails over to the next one on connection
+        errors, timeouts and 502, 503 or 504 responses
+        :param transport sends the http requests, defaults to a pooled aiohttp transport
+        :param tracer reports spans for each request and propagates the trace context in request headers,
+        defaults to a tracer that does nothing
+        :param compression content encoding (gzip or deflate) used to compress request bodies, None disables it.
+        Responses are always decompressed according to their Content-Encoding.
+        :param compression_threshold_in_bytes request bodies smaller than this are sent uncompressed
+        :param compression_level compression level from 1 (fastest) to 9 (smallest)
+        :param hedge_quantile when set, an idempotent request still unanswered after this quantile (e.g. 0.95) of the
+        recent latencies of its url is sent a second time and the first response wins. None disables hedging.
+        Only fetching the api links is hedged unless hedge_take_action is set
+        :param hedge_take_action hedge take action requests too. Both requests carry the same Idempotency-Key
+        header, only enable it if the flyte server hands out a single action per key
+        """
+        if compression is not None and compression not in supported_encodings():
+            raise ValueError(f"unsupported compression {compression}")
         self._logger = logging.getLogger(__name__)
-        self._url = f"{url}/{version}"
+        self._empty_polls = SummarizedLog(
+            self._logger, logging.INFO, "no actions available yet"
+        )
+        self._take_action_errors = SummarizedLog(
+            self._logger, logging.ERROR, "there was an error fetching actions: %s"
+        )
+        urls = [url] if isinstance(url, str) else list(url)
+        self._url = f"{urls[0]}/{version}"
+        self._endpoints = EndpointPool(urls) if len(urls) > 1 else None
         self._insecure_skip_verify = insecure_skip_verify
         self._timeout = timeout
+        self._compression = compression
+        self._compression_threshold_in_bytes = compression_threshold_in_bytes
+        self._compression_level = compression_level
+        self._transport = transport or AiohttpTransport(insecure_skip_verify)
+        self._tracer = tracer or Tracer()
         self._links = None
         self._take_action_url = None
         self._events_url = None
+        self._action_stream_url = None
+        self._action_results_url = None
+        self._hedge_quantile = hedge_quantile
+        self._hedge_take_action = hedge_take_action
+        self._latencies: Dict[str, LatencyTracker] = {}
 
     async def create_pack(self, p: Pack) -> Pack:
         """registers pack definition and return packs metadata
@@ -39,6 +119,8 @@ class Client:
 
         self._take_action_url = registered_pack.get_take_action_url()
         self._events_url = registered_pack.get_events_url()
+        self._action_stream_url = registered_pack.get_action_stream_url()
+        self._action_results_url = registered_pack.get_action_results_url()
 
         return registered_pack
 
@@ -53,18 +135,16 @@ class Client:
                 f"hateoas links not found. You must register your pack first"
             )
 
-        async with aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(ssl=self._insecure_skip_verify)
-        ) as session:
-            content, status_code = await self._post(
-                session, self._events_url, e.to_json()
-            )
-            self._raise_error(status_code, f"error posting {e} : {content}")
+        with self._tracer.start_as_current_span("flyte.post_event"):
+            with self._tracer.start_as_current_span("flyte.serialize_event"):
+                data = encode_event(e)
+            content, status_code = await self._post(self._events_url, data)
+        self._raise_error(status_code, f"error posting {e} : {content}")
 
-            if status_code != 202:
-                raise FlyteClientError(
-                    f"event {e} not accepted, response was: {status_code}"
-                )
+        if status_code != 202:
+            raise FlyteClientError(
+                f"event {e} not accepted, response was: {status_code}"
+            )
 
     async def take_action(self) -> Optional[Action]:
         """retrieves all the actions pending to be processed by a pack
@@ -77,26 +157,158 @@ class Client:
                 "hateoas links not found. You must register your pack first"
             )
 
-        async with aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(ssl=self._insecure_skip_verify)
-        ) as session:
+        with self._tracer.start_as_current_span("flyte.take_action") as span:
             content, status_code = await self._post(
-                session, self._take_action_url, None
+                self._take_action_url, None, hedge=self._hedge_take_action
             )
+            span.set_attribute("http.status_code", status_code)
 
-            if status_code == 204:
-                self._logger.info("no actions available yet")
-                return None
-            elif status_code == 200:
+        if status_code == 204:
+            self._empty_polls()
+            return None
+        elif status_code == 200:
+            with self._tracer.start_as_current_span("flyte.decode_action"):
                 return Action.from_json(content)
-            elif status_code == 404:
-                self._logger.error(f"resource not found at url {self._take_action_url}")
-                return None
-            else:
-                self._raise_error(
-                    status_code, f"error taking action - {content} : {status_code}"
+        elif status_code == 404:
+            self._logger.error("resource not found at url %s", self._take_action_url)
+            return None
+        else:
+            self._raise_error(
+                status_code, f"error taking action - {content} : {status_code}"
+            )
+            return None
+
+    async def actions(
+        self,
+        prefetch=0,
+        min_poll_interval_in_seconds=0.1,
+        max_poll_interval_in_seconds=5,
+        push=True,
+        push_retry_in_seconds=30,
+    ) -> AsyncIterator[Action]:
+        """yields actions as they become available. When the server advertises an action stream and push is
+        enabled actions are received as soon as they are created, otherwise (or while the stream is unavailable)
+        they are polled. Polling backs off exponentially while there are no actions and resets as soon as one
+        arrives. Errors taking actions are logged and retried after the backoff.
+        Closing or cancelling the iterator stops polling; prefetched actions not yet yielded are dropped.
+        :param prefetch number of actions taken in the background ahead of the consumer, 0 takes an action only
+        when the consumer asks for the next one
+        :param min_poll_interval_in_seconds wait after the first empty poll
+        :param max_poll_interval_in_seconds longest wait between empty polls
+        :param push subscribe to the action stream when the server offers one
+        :param push_retry_in_seconds longest time spent polling before subscribing again after the stream failed
+        :raises FlyteClientError if the pack has not been registered
+        """
+        if self._take_action_url is None:
+            raise FlyteClientError(
+                "hateoas links not found. You must register your pack first"
+            )
+        interval = AdaptivePollInterval(
+            min_poll_interval_in_seconds, max_poll_interval_in_seconds
+        )
+        if push and self._action_stream_url is not None:
+            source = self._pushed_actions(interval, push_retry_in_seconds)
+        else:
+            source = self._polled_actions(interval)
+
+        if prefetch <= 0:
+            try:
+                async for action in source:
+                    yield action
+            finally:
+                await source.aclose()
+            return
+
+        queue = asyncio.Queue()
+        slots = asyncio.Semaphore(prefetch)
+        prefetcher = asyncio.ensure_future(self._prefetch(queue, slots, source))
+        try:
+            while True:
+                action = await queue.get()
+                if isinstance(action, Exception):
+                    raise action
+                slots.release()
+                yield action
+        finally:
+            prefetcher.cancel()
+            # the source can't be closed while the prefetcher is still taking an action from it
+            await asyncio.gather(prefetcher, return_exceptions=True)
+            await source.aclose()
+
+    async def _prefetch(
+        self,
+        queue: asyncio.Queue,
+        slots: asyncio.Semaphore,
+        source: AsyncIterator[Action],
+    ):
+        """takes actions ahead of the consumer while there are free slots. Unexpected errors are handed to the
+        consumer through the queue"""
+        try:
+            while True:
+                await slots.acquire()
+                queue.put_nowait(await source.__anext__())
+        except Exception as err:
+            queue.put_nowait(err)
+
+    async def _polled_actions(
+        self, interval: AdaptivePollInterval
+    ) -> AsyncIterator[Action]:
+        while True:
+            yield await self._next_action(interval)
+
+    async def _pushed_actions(
+        self, interval: AdaptivePollInterval, retry_in_seconds: float
+    ) -> AsyncIterator[Action]:
+        """yields actions pushed through the action stream, falling back to polling while it is unavailable"""
+        loop = asyncio.get_event_loop()
+        retry = AdaptivePollInterval(
+            min(1, retry_in_seconds), retry_in_seconds, backoff_factor=2
+        )
+        while True:
+            try:
+                async for message in self._transport.subscribe(
+                    self._resolve(self._action_stream_url)
+                ):
+                    retry.reset()
+                    yield Action.from_json(message)
+                self._logger.info("action stream closed by the server")
+            except NotImplementedError:
+                self._logger.info("transport can't subscribe, polling actions")
+                async for action in self._polled_actions(interval):
+                    yield action
+            except Exception as err:
+                self._logger.warning(
+                    "action stream unavailable, polling actions: %s", err
                 )
-                return None
+
+            deadline = loop.time() + retry.next()
+            while loop.time() < deadline:
+                action = await self._take_action_or_none()
+                if action is not None:
+                    interval.reset()
+                    yield action
+                else:
+                    await asyncio.sleep(
+                        min(interval.next(), max(deadline - loop.time(), 0))
+                    )
+
+    async def _next_action(self, interval: AdaptivePollInterval) -> Action:
+        """polls until an action is available"""
+        while True:
+            action = await self._take_action_or_none()
+            if action is not None:
+                interval.reset()
+                return action
+            await asyncio.sleep(interval.next())
+
+    async def _take_action_or_none(self) -> Optional[Action]:
+        try:
+            return await self.take_action()
+        except FlyteDeadlineExceededError:
+            raise
+        except FlyteClientError as err:
+            self._take_action_errors(err)
+            return None
 
     async def complete_action(self, a: Action, e: Event):
         """posts the action result to the flyte server
@@ -105,15 +317,131 @@ class Client:
         :raise FlyteClientError if complete action call fails
         """
         complete_action_url = a.get_action_complete_url()
-        async with aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(ssl=self._insecure_skip_verify)
-        ) as session:
-            content, status_code = await self._post(
-                session, complete_action_url, e.to_json()
+        with self._tracer.start_as_current_span("flyte.serialize_event"):
+            data = encode_event(e)
+        with self._tracer.start_as_current_span("flyte.complete_action") as span:
+            content, status_code = await self._post(complete_action_url, data)
+            span.set_attribute("http.status_code", status_code)
+        self._raise_error(
+            status_code, f"error posting action - {content} : {status_code}"
+        )
+
+    async def complete_actions(
+        self, results: List[Tuple[Action, Event]]
+    ) -> List[Optional[Exception]]:
+        """posts several action results, in one request when the server has a batch endpoint and concurrently
+        otherwise
+        :param results actions and the events they are completed with
+        :return the error completing each action, None for actions that were completed
+        :raise FlyteClientError if the batch request fails as a whole
+        """
+        if self._action_results_url is None or len(results) == 1:
+            outcomes = await asyncio.gather(
+                *(self.complete_action(a, e) for a, e in results),
+                return_exceptions=True,
             )
-            self._raise_error(
-                status_code, f"error posting action - {content} : {status_code}"
+            return [o if isinstance(o, Exception) else None for o in outcomes]
+
+        errors: List[Optional[Exception]] = [None] * len(results)
+        entries = []
+        for i, (a, e) in enumerate(results):
+            try:
+                entries.append((i, a.get_action_complete_url(), e))
+            except ValueError as err:
+                errors[i] = err
+        if not entries:
+            return errors
+        with self._tracer.start_as_current_span("flyte.serialize_event"):
+            data = b"[%s]" % b", ".join(
+                b'{"href": %s, "event": %s}'
+                % (json.dumps(href).encode("utf-8"), _as_bytes(encode_event(e)))
+                for _, href, e in entries
             )
+        with self._tracer.start_as_current_span("flyte.complete_actions") as span:
+            content, status_code = await self._post(self._action_results_url, data)
+            span.set_attribute("http.status_code", status_code)
+        self._raise_error(
+            status_code, f"error posting action results - {content} : {status_code}"
+        )
+        statuses = json.loads(content)
+        if len(statuses) != len(entries):
+            raise FlyteClientError(
+                f"expected {len(entries)} action results statuses, got {content}"
+            )
+        for (i, href, _), status in zip(entries, statuses):
+            if status > 399:
+                errors[i] = FlyteClientError(f"error posting action {href} : {status}")
+        return errors
+
+    async def wait_until_ready(
+        self,
+        timeout_in_seconds: float,
+        min_backoff_in_seconds=0.1,
+        max_backoff_in_seconds=5.0,
+    ):
+        """probes the flyte api by fetching its links, backing off between failed attempts, until it answers
+        :param timeout_in_seconds time after which probing stops, each probe is bounded by the time left
+        :raises FlyteClientError when the api is not ready within the timeout
+        """
+        backoff = AdaptivePollInterval(
+            min_backoff_in_seconds, max_backoff_in_seconds, backoff_factor=2
+        )
+        loop = asyncio.get_event_loop()
+        until = loop.time() + timeout_in_seconds
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                with deadline.deadline(until - loop.time()):
+                    self._links = await self._get_api_links()
+                return
+            except FlyteClientError as err:
+                wait = min(backoff.next(), until - loop.time())
+                if wait <= 0:
+                    raise FlyteClientError(
+                        f"flyte api not ready after {attempts} attempts", err
+                    )
+                self._logger.info(
+                    "flyte api not ready, probing again in %.1fs: %s", wait, err
+                )
+                await asyncio.sleep(wait)
+
+    async def warm_up(self, connections: int) -> int:
+        """opens connections to every flyte api node ahead of the first requests by sending that many concurrent
+        requests for the api links to each node. Connections stay in the pool of transports that keep them alive
+        :param connections number of connections to open per node
+        :return number of requests that succeeded
+        """
+        urls = [self._url]
+        if self._endpoints is not None:
+            urls = [
+                self._endpoints.resolve(self._url, e) for e in self._endpoints.endpoints
+            ]
+        headers = self._headers()
+        results = await asyncio.gather(
+            *(
+                self._transport.get(url, self._timeout, headers)
+                for url in urls
+                for _ in range(connections)
+            ),
+            return_exceptions=True,
+        )
+        opened = sum(1 for r in results if not isinstance(r, BaseException))
+        if opened < len(results):
+            self._logger.warning(
+                "opened %d of %d connections to the flyte api", opened, len(results)
+            )
+        return opened
+
+    async def close(self):
+        """releases the connections held by the client"""
+        await self._transport.close()
+
+    async def __aenter__(self) -> "Client":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
 
     async def _register_pack(self, p: Pack) -> Pack:
         """registers the pack in flyte server
@@ -123,12 +451,10 @@ class Client:
         :raise
         """
         packs_url = self._get_packs_url()
-        async with aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(ssl=self._insecure_skip_verify)
-        ) as session:
-            result, status_code = await self._post(session, packs_url, p.to_json())
-            self._raise_error(status_code, "unable to register the pack")
-            return Pack.from_json(result)
+        # registering the same pack again only updates it
+        result, status_code = await self._post(packs_url, p.to_json(), idempotent=True)
+        self._raise_error(status_code, "unable to register the pack")
+        return Pack.from_json(result)
 
     def _get_packs_url(self) -> str:
         """returns the url to register your pack
@@ -136,34 +462,192 @@ class Client:
         """
         return find_url_by_relative_name(self._links, "pack/listPacks")
 
-    async def _fetch(self, session: aiohttp.ClientSession, url) -> (str, int):
-        timeout = aiohttp.ClientTimeout(total=self._timeout)
+    async def _fetch(self, url, hedge=False) -> (str, int):
+        return await self._send(
+            url,
+            lambda u, timeout, headers: self._transport.get(u, timeout, headers),
+            self._headers(),
+            hedge,
+            idempotent=True,
+        )
+
+    async def _post(self, url, data, hedge=False, idempotent=False) -> (str, int):
+        headers = self._headers()
+        if self._compression is not None and data is not None:
+            # the threshold is in bytes, which the length of a str under-counts
+            data = _as_bytes(data)
+        if self._should_compress(data):
+            data, compression_headers = await self._compress(data)
+            headers = dict(headers or {}, **compression_headers)
+        elif isinstance(data, bytes):
+            # same content type as str bodies get
+            headers = dict(headers or {}, **{"Content-Type": _TEXT_CONTENT_TYPE})
+        return await self._send(
+            url,
+            lambda u, timeout, h: self._transport.post(u, data, timeout, h),
+            headers,
+            hedge,
+            idempotent,
+        )
+
+    async def _send(
+        self,
+        url: str,
+        request: Callable[[str, float, Optional[dict]], Awaitable[Tuple[str, int]]],
+        headers: Optional[dict],
+        hedge: bool,
+        idempotent: bool,
+    ) -> (str, int):
+        """sends a request within the remaining deadline, hedging it when asked to and enabled
+        :param request sends the request given the url, a timeout and headers
+        :param idempotent whether the request can be sent again to another node after it may have reached one
+        :raise FlyteDeadlineExceededError when the deadline of the caller is exceeded
+        :raise FlyteRequestError when the request fails
+        """
         try:
-            async with session.get(url=url, timeout=timeout) as response:
-                return await response.text(), response.status
+            if hedge and self._hedge_quantile is not None:
+                return await self._hedged(url, request, headers, idempotent)
+            return await self._timed(url, request, headers, idempotent)
+        except FlyteClientError:
+            raise
         except Exception as e:
+            budget = deadline.remaining()
+            if budget is not None and budget <= 0:
+                raise FlyteDeadlineExceededError(url) from e
             raise FlyteRequestError(url, e)
 
-    async def _post(self, session: aiohttp.ClientSession, url, data) -> (str, int):
-        timeout = aiohttp.ClientTimeout(total=self._timeout)
+    async def _timed(
+        self, url, request, headers, idempotent, tracker: LatencyTracker = None
+    ):
+        """sends a request with the remaining budget as timeout. With several nodes it goes to the best node and
+        fails over to the others. Requests that are not idempotent only fail over when they could not be sent at
+        all, as a node may have applied a request that timed out or answered with a gateway error"""
+        tried = []
+        while True:
+            budget = deadline.remaining()
+            if budget is not None and budget <= 0:
+                raise FlyteDeadlineExceededError(url)
+            timeout = self._timeout if budget is None else min(self._timeout, budget)
+            endpoint, target = None, url
+            if self._endpoints is not None:
+                endpoint = self._endpoints.select(exclude=tried)
+                tried.append(endpoint)
+                target = self._endpoints.resolve(url, endpoint)
+            last_attempt = endpoint is None or len(tried) == len(
+                self._endpoints.endpoints
+            )
+            start = time.monotonic()
+            try:
+                content, status_code = await request(target, timeout, headers)
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                if endpoint is None:
+                    raise
+                self._endpoints.failed(endpoint)
+                if last_attempt or not (
+                    idempotent or self._transport.was_not_sent(err)
+                ):
+                    raise
+                self._logger.warning("%s failed, failing over: %s", target, err)
+                continue
+            latency = time.monotonic() - start
+            if endpoint is not None:
+                if status_code not in self._FAILOVER_STATUSES:
+                    self._endpoints.succeeded(endpoint, latency)
+                else:
+                    self._endpoints.failed(endpoint)
+                    if idempotent and not last_attempt:
+                        self._logger.warning(
+                            "%s answered %s, failing over", target, status_code
+                        )
+                        continue
+            if tracker is not None:
+                tracker.record(latency)
+            return content, status_code
+
+    async def _hedged(self, url, request, headers, idempotent) -> (str, int):
+        """sends the request again when it takes longer than the hedge quantile of the recent latencies of url,
+        returns the first successful response and cancels the other request"""
+        tracker = self._latencies.setdefault(url, LatencyTracker())
+        delay = tracker.quantile(self._hedge_quantile)
+        if delay is None:
+            return await self._timed(url, request, headers, idempotent, tracker)
+
+        headers = dict(headers or {}, **{"Idempotency-Key": uuid.uuid4().hex})
+        first = asyncio.ensure_future(
+            self._timed(url, request, headers, idempotent, tracker)
+        )
+        tasks = [first]
         try:
-            async with session.post(url=url, timeout=timeout, data=data) as response:
-                return await response.text(), response.status
-        except Exception as e:
-            raise FlyteRequestError(url, e)
+            done, _ = await asyncio.wait({first}, timeout=delay)
+            budget = deadline.remaining()
+            if done or (budget is not None and budget <= 0):
+                return await first
+
+            self._logger.debug("hedging request to %s after %.3fs", url, delay)
+            tasks.append(
+                asyncio.ensure_future(
+                    self._timed(url, request, headers, idempotent, tracker)
+                )
+            )
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+            return await first
+        finally:
+            # also when the caller is cancelled, a request left running could take an action nobody handles
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _resolve(self, url: str) -> str:
+        """rewrites a url to the best flyte api node when there are several"""
+        if self._endpoints is None:
+            return url
+        return self._endpoints.resolve(url, self._endpoints.select())
+
+    def _headers(self) -> Optional[dict]:
+        """returns the trace context headers, None when there is nothing to propagate"""
+        headers = {}
+        self._tracer.inject(headers)
+        return headers or None
+
+    def _should_compress(self, data) -> bool:
+        return (
+            self._compression is not None
+            and data is not None
+            and len(data) >= self._compression_threshold_in_bytes
+        )
+
+    async def _compress(self, data: Union[str, bytes]) -> (bytes, dict):
+        """compresses a request body off the event loop
+        :param data request body
+        :return compressed body and the headers describing it
+        """
+        body = await asyncio.get_event_loop().run_in_executor(
+            None, compress, _as_bytes(data), self._compression, self._compression_level,
+        )
+        headers = {
+            "Content-Encoding": self._compression,
+            "Content-Type": _TEXT_CONTENT_TYPE,
+        }
+        return body, headers
 
     async def _get_api_links(self) -> [Link]:
         """retrieves links from the flyte api server that are useful to the client such as packs url and health url
         and so on
         :raise FlyteClientError when there is an error when retrieving api links
         """
-        async with aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(ssl=self._insecure_skip_verify)
-        ) as session:
-            result, status = await self._fetch(session, self._url)
-            self._raise_error(status, "unable to fetch api links")
-            links = json.loads(result)["links"]
-            return Link.schema().load(links, many=True)
+        result, status = await self._fetch(self._url, hedge=True)
+        self._raise_error(status, "unable to fetch api links")
+        links = json.loads(result)["links"]
+        return Link.schema().load(links, many=True)
 
     @staticmethod
     def _raise_error(status_code, message):
@@ -174,3 +658,7 @@ class Client:
         """
         if status_code > 399:
             raise FlyteClientError(message)
+
+
+def _as_bytes(data: Union[str, bytes]) -> bytes:
+    return data.encode("utf-8") if isinstance(data, str) else data
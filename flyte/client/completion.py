@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from typing import List, Set
+
+from flyte.client.classes import Action, Event
+from flyte.client.errors import FlyteClientError
+
+
+class CompletionBatcher:
+    """
+    coalesces action results submitted within a short linger window and completes them together through
+    Client.complete_actions. Each submitted result gets a future that resolves once the server acknowledged it,
+    results the server rejected are retried on their own with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        client,
+        linger_in_seconds=0.005,
+        max_batch_size=64,
+        max_attempts=3,
+        retry_backoff_in_seconds=0.1,
+    ) -> None:
+        """
+        :param client Client used to complete the actions
+        :param linger_in_seconds how long the first result of a batch waits for others to join it
+        :param max_batch_size batches are sent as soon as they reach this size
+        :param max_attempts attempts to complete an action before its future fails
+        :param retry_backoff_in_seconds wait before the first retry, doubled on every further retry
+        """
+        self._client = client
+        self._linger_in_seconds = linger_in_seconds
+        self._max_batch_size = max_batch_size
+        self._max_attempts = max_attempts
+        self._retry_backoff_in_seconds = retry_backoff_in_seconds
+        self._logger = logging.getLogger(__name__)
+        self._pending: List[tuple] = []
+        self._outstanding: Set[asyncio.Future] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._timer = None
+        self._batches = 0
+        self._retries = 0
+
+    def submit(self, action: Action, event: Event) -> asyncio.Future:
+        """queues an action result
+        :return future resolved once the action is completed, it fails with FlyteClientError when every attempt
+        failed
+        """
+        future = asyncio.get_event_loop().create_future()
+        self._outstanding.add(future)
+        future.add_done_callback(self._outstanding.discard)
+        self._enqueue((action, event, future, 1))
+        return future
+
+    async def flush(self):
+        """
+        sends queued results straight away and waits until every submitted result is acknowledged or failed and
+        every batch sent is done
+        """
+        while self._outstanding:
+            self._send_pending()
+            await asyncio.gather(*self._outstanding, return_exceptions=True)
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    def stats(self):
+        return {
+            "pending": len(self._pending),
+            "outstanding": len(self._outstanding),
+            "batches": self._batches,
+            "retries": self._retries,
+        }
+
+    def _enqueue(self, entry: tuple):
+        self._pending.append(entry)
+        if len(self._pending) >= self._max_batch_size:
+            self._send_pending()
+        elif self._timer is None:
+            self._timer = asyncio.get_event_loop().call_later(
+                self._linger_in_seconds, self._send_pending
+            )
+
+    def _send_pending(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending:
+            batch = self._pending[: self._max_batch_size]
+            del self._pending[: self._max_batch_size]
+            task = asyncio.ensure_future(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[tuple]):
+        batch = [entry for entry in batch if not entry[2].done()]
+        if not batch:
+            return
+        self._batches += 1
+        try:
+            errors = await self._client.complete_actions(
+                [(a, e) for a, e, _, _ in batch]
+            )
+        except Exception as err:
+            errors = [err] * len(batch)
+
+        loop = asyncio.get_event_loop()
+        for (action, event, future, attempt), error in zip(batch, errors):
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(None)
+            elif attempt < self._max_attempts:
+                self._retries += 1
+                self._logger.warning(
+                    "could not complete action %s, retrying: %s", action, error
+                )
+                loop.call_later(
+                    self._retry_backoff_in_seconds * 2 ** (attempt - 1),
+                    self._enqueue,
+                    (action, event, future, attempt + 1),
+                )
+            elif isinstance(error, FlyteClientError):
+                future.set_exception(error)
+            else:
+                future.set_exception(
+                    FlyteClientError(f"could not complete action {action}", error)
+                )
@@ -0,0 +1,44 @@
+import gzip
+import zlib
+
+GZIP = "gzip"
+DEFLATE = "deflate"
+
+_compressors = {
+    GZIP: lambda data, level: gzip.compress(data, compresslevel=level),
+    DEFLATE: zlib.compress,
+}
+
+_decompressors = {
+    GZIP: gzip.decompress,
+    DEFLATE: zlib.decompress,
+}
+
+
+def supported_encodings() -> [str]:
+    return list(_compressors)
+
+
+def compress(data: bytes, encoding: str, level: int = 6) -> bytes:
+    """compresses a request body
+    :param data body to compress
+    :param encoding content encoding, gzip or deflate
+    :param level compression level from 1 (fastest) to 9 (smallest)
+    :return compressed body
+    :raises ValueError if the encoding is not supported
+    """
+    if encoding not in _compressors:
+        raise ValueError(f"unsupported content encoding {encoding}")
+    return _compressors[encoding](data, level)
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    """decompresses a body compressed with compress
+    :param data compressed body
+    :param encoding content encoding, gzip or deflate
+    :return decompressed body
+    :raises ValueError if the encoding is not supported
+    """
+    if encoding not in _decompressors:
+        raise ValueError(f"unsupported content encoding {encoding}")
+    return _decompressors[encoding](data)
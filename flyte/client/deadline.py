@@ -0,0 +1,32 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+_deadline: ContextVar[Optional[float]] = ContextVar("flyte_deadline", default=None)
+
+
+@contextmanager
+def deadline(timeout_in_seconds: float):
+    """bounds the time spent by the client calls made within the block, including tasks started from it. Every
+    request, and every hedge of a request, only gets the remaining budget as its timeout. Nested deadlines can only
+    shorten the budget.
+    :param timeout_in_seconds budget of the block
+    """
+    expires_at = time.monotonic() + timeout_in_seconds
+    current = _deadline.get()
+    if current is not None:
+        expires_at = min(expires_at, current)
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """returns the seconds left before the current deadline, None when there is no deadline"""
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
@@ -0,0 +1,90 @@
+import time
+from typing import List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+
+class Endpoint:
+    """
+    a flyte api node, with the smoothed latency of its recent requests and its failure state
+    """
+
+    def __init__(self, url: str) -> None:
+        self.netloc = urlsplit(url).netloc
+        self.latency: Optional[float] = None
+        self.failures = 0
+        self.down_until = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"Endpoint({self.netloc}, latency={self.latency}, failures={self.failures})"
+        )
+
+
+class EndpointPool:
+    """
+    picks the flyte api node requests are sent to. Nodes are ranked by an exponentially weighted moving average of
+    their latency, nodes without samples first. A node that fails is skipped for cooldown_in_seconds, doubled on
+    every consecutive failure up to max_cooldown_in_seconds. Links handed out by any node are rewritten to the node
+    picked, so hateoas links stay resolvable when the node that issued them is down.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        smoothing=0.3,
+        cooldown_in_seconds=1.0,
+        max_cooldown_in_seconds=30.0,
+        clock=time.monotonic,
+    ) -> None:
+        """
+        :param urls base urls of the flyte api nodes
+        :param smoothing weight of a new latency sample in the average
+        :param cooldown_in_seconds time a node is skipped after it fails
+        :param max_cooldown_in_seconds longest time a node is skipped
+        :param clock returns the current time in seconds
+        """
+        if not urls:
+            raise ValueError("at least one url is required")
+        self.endpoints = [Endpoint(url) for url in urls]
+        self._smoothing = smoothing
+        self._cooldown_in_seconds = cooldown_in_seconds
+        self._max_cooldown_in_seconds = max_cooldown_in_seconds
+        self._clock = clock
+
+    def select(self, exclude=()) -> Endpoint:
+        """returns the healthy node with the lowest latency, or the node that comes back first if all are down
+        :param exclude nodes already tried for the current request, used only while other nodes are left
+        """
+        candidates = [e for e in self.endpoints if e not in exclude] or self.endpoints
+        now = self._clock()
+        healthy = [e for e in candidates if e.down_until <= now]
+        if not healthy:
+            return min(candidates, key=lambda e: e.down_until)
+        return min(healthy, key=lambda e: -1 if e.latency is None else e.latency)
+
+    def resolve(self, url: str, endpoint: Endpoint) -> str:
+        """rewrites a url of any of the nodes to the given node, other urls are returned as they are"""
+        parts = urlsplit(url)
+        if parts.netloc != endpoint.netloc and any(
+            e.netloc == parts.netloc for e in self.endpoints
+        ):
+            return urlunsplit(parts._replace(netloc=endpoint.netloc))
+        return url
+
+    def succeeded(self, endpoint: Endpoint, latency_in_seconds: float):
+        endpoint.failures = 0
+        endpoint.down_until = 0.0
+        if endpoint.latency is None:
+            endpoint.latency = latency_in_seconds
+        else:
+            endpoint.latency += self._smoothing * (
+                latency_in_seconds - endpoint.latency
+            )
+
+    def failed(self, endpoint: Endpoint):
+        endpoint.failures += 1
+        cooldown = min(
+            self._cooldown_in_seconds * 2 ** (endpoint.failures - 1),
+            self._max_cooldown_in_seconds,
+        )
+        endpoint.down_until = self._clock() + cooldown
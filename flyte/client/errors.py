@@ -15,3 +15,11 @@ class FlyteRequestError(FlyteClientError):
 
     def __init__(self, url, original_exception):
         super().__init__(f"failed when calling {url}", original_exception)
+
+
+class FlyteDeadlineExceededError(FlyteClientError):
+    """Error raised when a request can't be sent or completed within the deadline of the caller.
+    """
+
+    def __init__(self, url):
+        super().__init__(f"deadline exceeded calling {url}")
@@ -0,0 +1,26 @@
+from collections import deque
+from typing import Optional
+
+
+class LatencyTracker:
+    """
+    keeps the latencies of the most recent requests to derive hedging delays from them
+    """
+
+    def __init__(self, window=100, min_samples=10) -> None:
+        """
+        :param window number of recent latencies kept
+        :param min_samples latencies needed before quantile returns anything
+        """
+        self._latencies = deque(maxlen=window)
+        self._min_samples = min_samples
+
+    def record(self, latency_in_seconds: float):
+        self._latencies.append(latency_in_seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """returns the q quantile of the recent latencies, None while there are fewer than min_samples"""
+        if len(self._latencies) < self._min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
@@ -0,0 +1,66 @@
+import logging
+import time
+
+
+class SummarizedLog:
+    """
+    log record emitted on hot paths, like empty polls, at most once per interval. The first occurrence is logged
+    straight away, later ones are counted and logged with the next record once the interval has passed, with the
+    count and the interval appended to the message and set as the count and interval_in_seconds attributes of the
+    record. Nothing is counted or formatted while the level is disabled.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        level: int,
+        msg: str,
+        interval_in_seconds=60.0,
+        clock=time.monotonic,
+    ) -> None:
+        """
+        :param logger logger the record is emitted with
+        :param level level of the record
+        :param msg %-style message, formatted with the arguments of the latest occurrence
+        :param interval_in_seconds minimum time between two records
+        :param clock returns the current time in seconds
+        """
+        self._logger = logger
+        self._level = level
+        self._msg = msg
+        self._interval_in_seconds = interval_in_seconds
+        self._clock = clock
+        self._count = 0
+        self._since = None
+
+    def __call__(self, *args):
+        if not self._logger.isEnabledFor(self._level):
+            return
+        self._count += 1
+        now = self._clock()
+        if self._since is None:
+            self._since = now
+            self._emit(args, now)
+        elif now - self._since >= self._interval_in_seconds:
+            self._emit(args, now)
+
+    def _emit(self, args, now: float):
+        count, elapsed = self._count, now - self._since
+        if count == 1:
+            self._logger.log(
+                self._level,
+                self._msg,
+                *args,
+                extra={"count": 1, "interval_in_seconds": 0.0},
+            )
+        else:
+            self._logger.log(
+                self._level,
+                self._msg + " (%d times in the last %.0fs)",
+                *args,
+                count,
+                elapsed,
+                extra={"count": count, "interval_in_seconds": elapsed},
+            )
+        self._count = 0
+        self._since = now
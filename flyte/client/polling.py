@@ -0,0 +1,30 @@
+class AdaptivePollInterval:
+    """
+    polling interval that backs off while there is nothing to take and resets as soon as something arrives
+    """
+
+    def __init__(
+        self,
+        min_interval_in_seconds=0.1,
+        max_interval_in_seconds=5,
+        backoff_factor=2.0,
+    ) -> None:
+        if min_interval_in_seconds > max_interval_in_seconds:
+            raise ValueError("min interval must not be greater than max interval")
+        self._min = min_interval_in_seconds
+        self._max = max_interval_in_seconds
+        self._factor = backoff_factor
+        self._current = min_interval_in_seconds
+
+    @property
+    def current(self) -> float:
+        return self._current
+
+    def next(self) -> float:
+        """returns the time to wait before the next poll and grows the interval"""
+        interval = self._current
+        self._current = min(self._current * self._factor, self._max)
+        return interval
+
+    def reset(self):
+        self._current = self._min
@@ -0,0 +1,63 @@
+import asyncio
+import threading
+from typing import Optional
+
+from flyte.client.classes import Action, Event, Pack
+from flyte.client.client import Client
+
+
+class SyncClient:
+    """
+    blocking facade over Client for code that isn't async, e.g. web apps or cron scripts. It runs one event loop in a
+    background thread for its whole lifetime, so the pooled connections of the client are reused across calls.
+    Calls can be made from any thread, they are handed to the loop with asyncio.run_coroutine_threadsafe.
+    """
+
+    def __init__(self, *args, call_timeout_in_seconds: float = None, **kwargs) -> None:
+        """
+        takes the same arguments as Client
+        :param call_timeout_in_seconds longest time a call blocks its caller, None waits for the client timeout
+        """
+        self._call_timeout_in_seconds = call_timeout_in_seconds
+        self._client = Client(*args, **kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run, name="flyte-client-loop", daemon=True
+        )
+        self._thread.start()
+
+    def create_pack(self, p: Pack) -> Pack:
+        return self._call(self._client.create_pack(p))
+
+    def post_event(self, e: Event):
+        self._call(self._client.post_event(e))
+
+    def take_action(self) -> Optional[Action]:
+        return self._call(self._client.take_action())
+
+    def complete_action(self, a: Action, e: Event):
+        self._call(self._client.complete_action(a, e))
+
+    def close(self):
+        """closes the client and stops the background loop"""
+        if self._loop.is_closed():
+            return
+        self._call(self._client.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> "SyncClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _call(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result(
+            self._call_timeout_in_seconds
+        )
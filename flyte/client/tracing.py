@@ -0,0 +1,71 @@
+from typing import Any, ContextManager, Dict, Optional
+
+
+class Span:
+    """
+    span interface, a subset of the OpenTelemetry span api
+    """
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def record_exception(self, exception: BaseException):
+        pass
+
+
+class Tracer:
+    """
+    The Tracer interface declares how the client and the pack report spans. Its methods follow the OpenTelemetry
+    api so an OpenTelemetry tracer can be plugged in through OpenTelemetryTracer. The default implementation does
+    nothing.
+    """
+
+    def start_as_current_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> ContextManager[Span]:
+        """starts a span that is the parent of spans started while it is active
+        :param name span name
+        :param attributes span attributes
+        :return context manager that ends the span on exit
+        """
+        return _noop_span
+
+    def inject(self, headers: Dict[str, str]):
+        """adds the current trace context to outgoing http headers"""
+
+
+class _NoopSpan(Span):
+    def __enter__(self) -> Span:
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_noop_span = _NoopSpan()
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    reports spans through OpenTelemetry and propagates the trace context with the globally configured propagator.
+    Requires the opentelemetry-api package.
+    """
+
+    def __init__(self, tracer=None) -> None:
+        """
+        :param tracer OpenTelemetry tracer, defaults to the tracer of the global tracer provider
+        """
+        try:
+            from opentelemetry import propagate, trace
+        except ImportError as err:
+            raise ImportError(
+                "OpenTelemetryTracer requires opentelemetry-api, install flyte-client[tracing]"
+            ) from err
+        self._tracer = tracer or trace.get_tracer("flyte-client")
+        self._inject = propagate.inject
+
+    def start_as_current_span(self, name, attributes=None):
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+    def inject(self, headers):
+        self._inject(headers)
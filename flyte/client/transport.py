@@ -0,0 +1,191 @@
+import asyncio
+from abc import abstractmethod
+from typing import AsyncIterator, Dict, Optional
+
+import aiohttp
+
+
+class Transport:
+    """
+    The Transport interface declares how the client sends http requests to the flyte api. Implementations are
+    expected to reuse connections between requests.
+    """
+
+    @abstractmethod
+    async def get(
+        self, url: str, timeout: float, headers: Optional[Dict[str, str]] = None
+    ) -> (str, int):
+        """sends a GET request
+        :return response body and status code
+        """
+
+    @abstractmethod
+    async def post(
+        self, url: str, data, timeout: float, headers: Optional[Dict[str, str]] = None,
+    ) -> (str, int):
+        """sends a POST request
+        :return response body and status code
+        """
+
+    def subscribe(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[str]:
+        """subscribes to a stream of messages pushed by the server, over a WebSocket for ws:// and wss:// urls and
+        as Server-Sent Events otherwise. The iterator ends when the server closes the stream.
+        :return async iterator over the messages
+        :raises NotImplementedError if the transport can't subscribe to streams
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support streams")
+
+    def was_not_sent(self, err: Exception) -> bool:
+        """tells whether a request failed before any of it was sent, e.g. because no connection could be opened.
+        Only such requests are safe to send again when they are not idempotent
+        """
+        return isinstance(err, ConnectionRefusedError)
+
+    async def close(self):
+        """releases connections held by the transport"""
+
+
+class AiohttpTransport(Transport):
+    """
+    default transport, HTTP/1.1 over a single pooled aiohttp session. Responses are decompressed according to their
+    Content-Encoding.
+    """
+
+    def __init__(
+        self,
+        insecure_skip_verify=False,
+        limit=100,
+        keepalive_timeout=30,
+        sse_idle_timeout_in_seconds=60,
+    ) -> None:
+        """
+        :param limit maximum number of simultaneous connections
+        :param keepalive_timeout seconds idle connections are kept open
+        :param sse_idle_timeout_in_seconds longest wait for data, comments included, on a Server-Sent Events stream
+        before it is considered lost. Unlike WebSockets SSE has no heartbeat to notice a stream dropped silently
+        """
+        self._insecure_skip_verify = insecure_skip_verify
+        self._limit = limit
+        self._keepalive_timeout = keepalive_timeout
+        self._sse_idle_timeout_in_seconds = sse_idle_timeout_in_seconds
+        self._session = None
+        self._loop = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        returns the pooled session, creating it for the running event loop when needed. The session of another loop
+        can't be closed from this one, so it has to be closed with close() before the transport is used on a new loop
+        """
+        loop = asyncio.get_event_loop()
+        if (
+            self._session is not None
+            and not self._session.closed
+            and self._loop is not loop
+        ):
+            raise RuntimeError(
+                "the transport is still open on another event loop, close it before using it on a new loop"
+            )
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    ssl=self._insecure_skip_verify,
+                    limit=self._limit,
+                    keepalive_timeout=self._keepalive_timeout,
+                )
+            )
+            self._loop = loop
+        return self._session
+
+    async def get(self, url, timeout, headers=None) -> (str, int):
+        kwargs = {"headers": headers} if headers else {}
+        async with self._get_session().get(
+            url=url, timeout=aiohttp.ClientTimeout(total=timeout), **kwargs
+        ) as response:
+            return await response.text(), response.status
+
+    async def post(self, url, data, timeout, headers=None) -> (str, int):
+        kwargs = {"headers": headers} if headers else {}
+        async with self._get_session().post(
+            url=url, timeout=aiohttp.ClientTimeout(total=timeout), data=data, **kwargs
+        ) as response:
+            return await response.text(), response.status
+
+    def was_not_sent(self, err: Exception) -> bool:
+        return isinstance(err, (aiohttp.ClientConnectorError, ConnectionRefusedError))
+
+    async def subscribe(self, url, headers=None) -> AsyncIterator[str]:
+        if url.startswith(("ws://", "wss://")):
+            async with self._get_session().ws_connect(
+                url, headers=headers, heartbeat=30
+            ) as ws:
+                async for message in ws:
+                    if message.type == aiohttp.WSMsgType.TEXT:
+                        yield message.data
+                    elif message.type == aiohttp.WSMsgType.ERROR:
+                        raise ws.exception()
+            return
+
+        headers = dict(headers or {}, Accept="text/event-stream")
+        async with self._get_session().get(
+            url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(
+                total=None, sock_read=self._sse_idle_timeout_in_seconds
+            ),
+        ) as response:
+            response.raise_for_status()
+            data = []
+            async for line in response.content:
+                line = line.decode("utf-8").rstrip("\r\n")
+                if line.startswith("data:"):
+                    value = line[5:]
+                    data.append(value[1:] if value.startswith(" ") else value)
+                elif not line and data:
+                    yield "\n".join(data)
+                    data = []
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+class HttpxTransport(Transport):
+    """
+    HTTP/2 transport backed by httpx, requests are multiplexed over few connections.
+    Requires the http2 extra: pip install flyte-client[http2]
+    """
+
+    def __init__(
+        self, insecure_skip_verify=False, max_connections=10, http2=True
+    ) -> None:
+        try:
+            import httpx
+        except ImportError as err:
+            raise ImportError(
+                "HttpxTransport requires httpx, install flyte-client[http2]"
+            ) from err
+        self._connect_error = httpx.ConnectError
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            verify=not insecure_skip_verify,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+
+    async def get(self, url, timeout, headers=None) -> (str, int):
+        response = await self._client.get(url, headers=headers, timeout=timeout)
+        return response.text, response.status_code
+
+    async def post(self, url, data, timeout, headers=None) -> (str, int):
+        response = await self._client.post(
+            url, content=data, headers=headers, timeout=timeout
+        )
+        return response.text, response.status_code
+
+    def was_not_sent(self, err: Exception) -> bool:
+        return isinstance(err, (self._connect_error, ConnectionRefusedError))
+
+    async def close(self):
+        await self._client.aclose()
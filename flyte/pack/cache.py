@@ -0,0 +1,69 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+_missing = object()
+
+
+class TTLCache:
+    """
+    least recently used cache whose entries also expire after a time to live. Memory is bounded by maxsize.
+    """
+
+    def __init__(
+        self,
+        maxsize=1024,
+        ttl_in_seconds=300,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be zero or positive")
+        self._maxsize = maxsize
+        self._ttl_in_seconds = ttl_in_seconds
+        self._clock = clock
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default=None) -> Any:
+        """returns the cached value or default when the key is missing or expired"""
+        entry = self._entries.get(key, _missing)
+        if entry is not _missing:
+            expires_at, value = entry
+            if expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, key: Hashable, value: Any):
+        """stores a value, evicting the least recently used entry when the cache is full"""
+        if self._maxsize == 0:
+            return
+        self._entries[key] = (self._clock() + self._ttl_in_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable, default=None) -> Any:
+        entry = self._entries.pop(key, _missing)
+        return default if entry is _missing else entry[1]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key, _missing)
+        return entry is not _missing and entry[0] > self._clock()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
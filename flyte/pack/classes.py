@@ -2,11 +2,15 @@ from abc import abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
+from flyte.pack.coalesce import Coalesce
+from flyte.pack.memoize import Memoize
+
 
 @dataclass
 class EventDef:
     name: str
     help_url: str = ""
+    coalesce: Coalesce = None
 
 
 @dataclass
@@ -32,6 +36,10 @@ class Command:
     handler: CommandHandler
     output_events: [EventDef] = field(default_factory=list)
     help_url: str = ""
+    input_type: type = None
+    memoize: Memoize = None
+    priority: int = 0
+    run_in_process: bool = False
 
 
 @dataclass
@@ -43,5 +51,12 @@ class PackDef:
     help_url: str
 
 
+FATAL_EVENT_NAME = "FATAL"
+
+
 def fatal_event(payload: Any) -> Event:
-    return Event(eventDef=EventDef(name="FATAL"), payload=payload)
+    return Event(eventDef=EventDef(name=FATAL_EVENT_NAME), payload=payload)
+
+
+def is_fatal(event: Event) -> bool:
+    return event.eventDef.name == FATAL_EVENT_NAME
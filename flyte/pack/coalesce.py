@@ -0,0 +1,134 @@
+import asyncio
+import json
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, Hashable, Set
+
+from flyte.pack.cache import TTLCache
+from flyte.pack.codecs import encode_payload
+
+DROP_DUPLICATES = "drop_duplicates"
+KEEP_LATEST = "keep_latest"
+COUNT = "count"
+
+
+@dataclass
+class Coalesce:
+    """
+    coalescing policy for a spontaneous event, applied by Pack.send_event within window_in_seconds:
+    drop_duplicates sends an event and drops events with the same payload until the window ends,
+    keep_latest sends an event and then at most one event per window, the latest one sent during the window,
+    count sends one event per distinct payload at the end of the window with {"count": n, "payload": payload}.
+    """
+
+    mode: str = DROP_DUPLICATES
+    window_in_seconds: float = 1.0
+    maxsize: int = 1024
+
+    def __post_init__(self):
+        if self.mode not in (DROP_DUPLICATES, KEEP_LATEST, COUNT):
+            raise ValueError(f"unsupported coalesce mode {self.mode}")
+
+
+class EventCoalescer:
+    """
+    applies a Coalesce policy to the events of an event definition. Events that are held back are sent later
+    through send, errors sending them can only be logged by send as the caller of Pack.send_event already returned.
+    """
+
+    def __init__(
+        self, policy: Coalesce, send: Callable[[Any], Awaitable[None]]
+    ) -> None:
+        """
+        :param policy coalescing policy
+        :param send coroutine function sending an event
+        """
+        self._policy = policy
+        self._send = send
+        self._seen = TTLCache(
+            maxsize=policy.maxsize, ttl_in_seconds=policy.window_in_seconds
+        )
+        self._window = None
+        self._latest = None
+        self._counts: Dict[Hashable, list] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.received = 0
+        self.sent = 0
+
+    def offer(self, event) -> bool:
+        """
+        :param event event about to be sent
+        :return True when the event has to be sent straight away, False when it was dropped or held back
+        """
+        self.received += 1
+        if self._policy.mode == DROP_DUPLICATES:
+            key = _payload_key(event.payload)
+            if key in self._seen:
+                return False
+            self._seen.put(key, True)
+            self.sent += 1
+            return True
+
+        if self._policy.mode == KEEP_LATEST:
+            if self._window is not None:
+                self._latest = event
+                return False
+            self._open_window()
+            self.sent += 1
+            return True
+
+        key = _payload_key(event.payload)
+        if key in self._counts:
+            self._counts[key][1] += 1
+        else:
+            self._counts[key] = [event, 1]
+        if self._window is None:
+            self._open_window()
+        return False
+
+    async def flush(self):
+        """sends the events held back straight away and waits until they are sent"""
+        if self._window is not None:
+            self._window.cancel()
+            self._close_window(reopen=False)
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    def stats(self) -> Dict[str, int]:
+        return {"received": self.received, "sent": self.sent}
+
+    def _open_window(self):
+        self._window = asyncio.get_event_loop().call_later(
+            self._policy.window_in_seconds, self._close_window
+        )
+
+    def _close_window(self, reopen=True):
+        self._window = None
+        if self._policy.mode == KEEP_LATEST:
+            latest, self._latest = self._latest, None
+            if latest is None:
+                return
+            if reopen:
+                self._open_window()
+            self._spawn(latest)
+            return
+
+        counts, self._counts = self._counts, {}
+        for event, count in counts.values():
+            self._spawn(
+                replace(event, payload={"count": count, "payload": event.payload})
+            )
+
+    def _spawn(self, event):
+        self.sent += 1
+        task = asyncio.ensure_future(self._send(event))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+def _payload_key(payload: Any) -> Hashable:
+    """payloads that can't be hashed, like dicts or dataclasses, are compared by their json encoding"""
+    try:
+        hash(payload)
+        return payload
+    except TypeError:
+        return json.dumps(encode_payload(payload), sort_keys=True)
@@ -0,0 +1,147 @@
+import dataclasses
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Union, get_type_hints
+
+Decoder = Callable[[str], Any]
+Encoder = Callable[[Any], Any]
+
+
+@lru_cache(maxsize=None)
+def compile_decoder(input_type: type = None) -> Decoder:
+    """returns a decoder that converts a raw action input into an instance of input_type. Decoders are compiled
+    once per type and cached, so decoding an input does not inspect the type again.
+    :param input_type dataclass, TypedDict, dict, list or str. None means the raw input is passed through
+    :return function that decodes a raw json string
+    """
+    if input_type is None or input_type is str:
+        return _identity
+    convert = _compile_converter(input_type)
+    if convert is _identity:
+        return json.loads
+    return lambda raw: convert(json.loads(raw))
+
+
+@lru_cache(maxsize=None)
+def compile_encoder(payload_type: type) -> Encoder:
+    """returns an encoder that converts an event payload of type payload_type into json compatible values.
+    Encoders are compiled once per type and cached.
+    :param payload_type type of the payload
+    :return function that encodes a payload
+    """
+    if not dataclasses.is_dataclass(payload_type):
+        return _identity
+    if hasattr(payload_type, "to_dict"):
+        return lambda payload: payload.to_dict()
+    return dataclasses.asdict
+
+
+def encode_payload(payload: Any) -> Any:
+    """encodes an event payload using the cached encoder for its type
+    :param payload event payload
+    :return json compatible payload
+    """
+    return compile_encoder(type(payload))(payload)
+
+
+def _compile_converter(target: type) -> Callable[[Any], Any]:
+    """
+    builds a function that converts decoded json values into target. Fields of dataclasses are converted according
+    to their resolved annotations, through List, Dict and Optional
+    :raises TypeError if a field type needs converting but can't be, e.g. a union of dataclasses
+    """
+    origin = getattr(target, "__origin__", None)
+    args = getattr(target, "__args__", None) or ()
+    if origin is Union:
+        options = [a for a in args if a is not type(None)]  # noqa: E721
+        if len(options) == 1:
+            convert = _compile_converter(options[0])
+            if convert is _identity:
+                return _identity
+            return lambda value: None if value is None else convert(value)
+        return _require_identity(target, options)
+    if origin in (list, List):
+        if not args:
+            return _identity
+        convert = _compile_converter(args[0])
+        if convert is _identity:
+            return _identity
+        return lambda value: [convert(v) for v in value]
+    if origin in (dict, Dict):
+        if len(args) < 2:
+            return _identity
+        convert = _compile_converter(args[1])
+        if convert is _identity:
+            return _identity
+        return lambda value: {k: convert(v) for k, v in value.items()}
+    if origin is not None:
+        return _require_identity(target, args)
+    if dataclasses.is_dataclass(target):
+        return _compile_dataclass_converter(target)
+    if _is_typed_dict(target):
+        required = getattr(
+            target, "__required_keys__", frozenset(target.__annotations__)
+        )
+
+        def check(value):
+            missing = required.difference(value)
+            if missing:
+                raise ValueError(
+                    f"missing keys {sorted(missing)} for {target.__name__}"
+                )
+            return value
+
+        return check
+    return _identity
+
+
+# dataclass converters, also those still being compiled so that recursive dataclasses refer to themselves
+_dataclass_converters: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _compile_dataclass_converter(target: type) -> Callable[[Any], Any]:
+    if hasattr(target, "from_dict"):
+        return target.from_dict
+    if target in _dataclass_converters:
+        return lambda value: _dataclass_converters[target](value)
+    _dataclass_converters[target] = target
+    try:
+        hints = get_type_hints(target)
+    except Exception as err:
+        del _dataclass_converters[target]
+        raise TypeError(
+            f"can't resolve the field types of {target.__name__}: {err}"
+        ) from err
+    try:
+        converters = {
+            f.name: _compile_converter(hints.get(f.name, Any))
+            for f in dataclasses.fields(target)
+        }
+    except TypeError:
+        del _dataclass_converters[target]
+        raise
+    converters = {k: v for k, v in converters.items() if v is not _identity}
+
+    def convert(value):
+        for name, field_converter in converters.items():
+            if name in value:
+                value[name] = field_converter(value[name])
+        return target(**value)
+
+    _dataclass_converters[target] = convert
+    return convert
+
+
+def _require_identity(target, args) -> Callable[[Any], Any]:
+    """json values of a generic type are passed through as they are, unless its arguments need converting"""
+    if any(_compile_converter(a) is not _identity for a in args):
+        raise TypeError(f"unsupported field type {target}")
+    return _identity
+
+
+def _is_typed_dict(t: type) -> bool:
+    return isinstance(t, type) and issubclass(t, dict) and hasattr(t, "__annotations__")
+
+
+def _identity(value):
+    return value
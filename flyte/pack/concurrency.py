@@ -0,0 +1,113 @@
+import asyncio
+import math
+from typing import Any, Dict
+
+
+class AIMDLimiter:
+    """
+    limits the number of actions handled at once and adapts the limit to how handlers behave.
+    The limit grows additively while handlers succeed within the latency tolerance and is cut multiplicatively
+    when a handler fails or is slower than latency_tolerance times the latency baseline.
+    """
+
+    def __init__(
+        self,
+        min_limit=1,
+        max_limit=1,
+        initial_limit=None,
+        decrease_factor=0.5,
+        latency_tolerance=2.0,
+        smoothing=0.05,
+    ) -> None:
+        """
+        :param min_limit lowest limit, at least 1
+        :param max_limit highest limit
+        :param initial_limit starting limit, defaults to min_limit
+        :param decrease_factor factor applied to the limit on failures or slow handlers
+        :param latency_tolerance how many times slower than the baseline a handler can be before the limit is cut
+        :param smoothing weight of new samples in the latency baseline and error rate averages
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= max_limit")
+        self._min = min_limit
+        self._max = max_limit
+        self._limit = float(initial_limit or min_limit)
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._smoothing = smoothing
+        self._in_flight = 0
+        self._latency_baseline = None
+        self._error_rate = 0.0
+        self._last_decrease = None
+        self._condition = None
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self):
+        """waits until fewer actions than the limit are in flight and takes a slot"""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self, latency_in_seconds: float = None, failed=False):
+        """frees a slot and feeds the outcome of the action into the limit
+        :param latency_in_seconds how long the action took, None if it was not run
+        :param failed whether the action failed
+        """
+        self._in_flight -= 1
+        if latency_in_seconds is not None:
+            self._update(latency_in_seconds, failed)
+        condition = self._get_condition()
+        async with condition:
+            condition.notify_all()
+
+    def _update(self, latency: float, failed: bool):
+        self._error_rate += self._smoothing * (float(failed) - self._error_rate)
+        slow = (
+            self._latency_baseline is not None
+            and latency > self._latency_baseline * self._latency_tolerance
+        )
+        if not failed:
+            if self._latency_baseline is None:
+                self._latency_baseline = latency
+            else:
+                self._latency_baseline += self._smoothing * (
+                    latency - self._latency_baseline
+                )
+
+        if failed or slow:
+            self._decrease()
+        else:
+            self._limit = min(self._max, self._limit + 1 / self._limit)
+
+    def _decrease(self):
+        """cuts the limit, at most once per baseline latency so a burst of failures of actions that were in flight
+        together only counts once"""
+        now = asyncio.get_event_loop().time()
+        window = self._latency_baseline or 0
+        if self._last_decrease is not None and now - self._last_decrease < window:
+            return
+        self._last_decrease = now
+        self._limit = max(
+            self._min, math.floor(self._limit * self._decrease_factor) or 1
+        )
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "error_rate": self._error_rate,
+            "latency_baseline_in_seconds": self._latency_baseline,
+        }
@@ -13,3 +13,20 @@ class SendEventError(PackError):
 
     def __init__(self, event, original_exception):
         super().__init__("Failed when sending event %s" % event, original_exception)
+
+
+class UndeclaredEventError(PackError):
+    """
+    Error raised when a pack sends an event that its PackDef doesn't declare
+    """
+
+    def __init__(self, event_name, declared):
+        # not caused by another exception, so the message of PackError doesn't fit
+        Exception.__init__(
+            self,
+            "Event %s is not declared, declared events are %s"
+            % (event_name, sorted(declared)),
+        )
+        self.original_exception = None
+        self.event_name = event_name
+        self.declared = declared
@@ -1,3 +1,5 @@
+from typing import Dict, FrozenSet, List, Tuple
+
 from flyte.client.classes import (
     Command as ClientCommand,
     Link,
@@ -5,7 +7,8 @@ from flyte.client.classes import (
     Pack as ClientPack,
     Event as ClientEvent,
 )
-from flyte.pack.classes import Command, EventDef, PackDef, Event
+from flyte.pack.classes import Command, EventDef, PackDef, Event, FATAL_EVENT_NAME
+from flyte.pack.codecs import encode_payload
 
 
 def to_client_command(from_obj: Command) -> ClientCommand:
@@ -42,14 +45,40 @@ def to_client_event_def(from_obj: EventDef) -> ClientEventDef:
     return ClientEventDef(name=from_obj.name, links=help_link(from_obj.help_url))
 
 
-def to_client_pack(from_obj: PackDef) -> ClientPack:
-    """converts a PackDef object to a flyte-client Pack
+def command_event_defs(from_obj: PackDef) -> List[EventDef]:
+    """flats the output events of every command of a pack
     :param from_obj pack definition
-    :return a flyte-client pack instance"""
+    :return output event definitions, in command order"""
     command_events = []
     for command in from_obj.commands:
         for val in command.output_events:
             command_events.append(val)
+    return command_events
+
+
+def to_event_index(
+    from_obj: PackDef,
+) -> Tuple[FrozenSet[str], Dict[str, FrozenSet[str]]]:
+    """indexes the names of the events a pack declares
+    :param from_obj pack definition
+    :return names of every declared event, and per command the names of its output events. Fatal events are
+    always allowed as the pack emits them itself when a handler fails"""
+    per_command = {
+        c.name: frozenset(to_event_list_name(c.output_events) + [FATAL_EVENT_NAME])
+        for c in from_obj.commands
+    }
+    pack_wide = frozenset(
+        to_event_list_name(from_obj.event_defs + command_event_defs(from_obj))
+        + [FATAL_EVENT_NAME]
+    )
+    return pack_wide, per_command
+
+
+def to_client_pack(from_obj: PackDef) -> ClientPack:
+    """converts a PackDef object to a flyte-client Pack
+    :param from_obj pack definition
+    :return a flyte-client pack instance"""
+    command_events = command_event_defs(from_obj)
 
     spontaneous_events = list(
         map(lambda e: to_client_event_def(e), from_obj.event_defs)
@@ -69,4 +98,6 @@ def to_client_event(from_obj: Event) -> ClientEvent:
     :param from_obj Pack event
     :return client event
     """
-    return ClientEvent(event=from_obj.eventDef.name, payload=from_obj.payload)
+    return ClientEvent(
+        event=from_obj.eventDef.name, payload=encode_payload(from_obj.payload)
+    )
@@ -0,0 +1,70 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from flyte.pack.cache import TTLCache
+
+
+@dataclass
+class Memoize:
+    """
+    memoization policy for a command. Results of actions with the same input are reused for ttl_in_seconds and
+    concurrent actions with the same input are coalesced into a single handler call.
+    """
+
+    maxsize: int = 256
+    ttl_in_seconds: float = 30
+
+
+class Memoizer:
+    """
+    applies a Memoize policy: a size and ttl bounded result cache plus single-flight coalescing of in-flight calls
+    """
+
+    def __init__(
+        self, policy: Memoize, should_cache: Callable[[Any], bool] = lambda _: True
+    ) -> None:
+        self._cache = TTLCache(
+            maxsize=policy.maxsize, ttl_in_seconds=policy.ttl_in_seconds
+        )
+        self._should_cache = should_cache
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def call(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """returns the memoized result for key, computing it at most once at a time
+        :param key identifies the call, usually the raw action input
+        :param compute coroutine function producing the result
+        :return result
+        """
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(in_flight)
+
+        future = asyncio.get_event_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as err:
+            future.set_exception(err)
+            # waiters re-raise it, nobody else needs to retrieve it
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+        future.set_result(result)
+        if self._should_cache(result):
+            self._cache.put(key, result)
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._cache.stats(), coalesced=self.coalesced)
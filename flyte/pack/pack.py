@@ -1,18 +1,38 @@
 import asyncio
+import concurrent.futures
 import logging
+import signal
 import time
-from typing import Dict
+from dataclasses import replace
+from typing import Any, AsyncIterable, Dict, Optional
+
+from aiohttp import web
 
 from flyte.client.client import Client
 from flyte.client.errors import FlyteClientError
-from flyte.client.classes import Action as ClientAction
-from flyte.pack.classes import PackDef, Event, CommandHandler, fatal_event
-from flyte.pack.errors import SendEventError
+from flyte.client.logs import SummarizedLog
+from flyte.client.polling import AdaptivePollInterval
+from flyte.client.classes import Action as ClientAction, RawPayload
+from flyte.client.completion import CompletionBatcher
+from flyte.client.tracing import Tracer
+from flyte.pack.cache import TTLCache
+from flyte.pack.coalesce import EventCoalescer
+from flyte.pack.classes import PackDef, Event, CommandHandler, fatal_event, is_fatal
+from flyte.pack.codecs import compile_decoder
+from flyte.pack.concurrency import AIMDLimiter
+from flyte.pack.errors import SendEventError, UndeclaredEventError
 from flyte.pack.health import HealthCheck
-from flyte.pack.mappers import to_client_pack, to_client_event
+from flyte.pack import processes
+from flyte.pack.memoize import Memoizer
+from flyte.pack.mappers import to_client_pack, to_client_event, to_event_index
+from flyte.pack.profiler import SamplingProfiler
+from flyte.pack.scheduling import PriorityActionQueue
+from flyte.pack.sources import EventSource, Mapper
 
 register_retry_wait_in_seconds = 3
 
+_EVENT_VALIDATION_MODES = ("strict", "warn", "off")
+
 
 class Pack:
     def __init__(
@@ -21,38 +41,270 @@ class Pack:
         client: Client,
         health_checks: HealthCheck = [],
         polling_frequency_in_seconds=5,
+        result_cache_size=1024,
+        result_cache_ttl_in_seconds=600,
+        min_concurrency=1,
+        max_concurrency=1,
+        tracer: Tracer = None,
+        profiler: SamplingProfiler = None,
+        profiler_signal=getattr(signal, "SIGUSR2", None),
+        health_check_port: int = None,
+        completion_linger_in_seconds: float = None,
+        action_queue_size=0,
+        priority_aging_rate_per_second=1.0,
+        process_pool: concurrent.futures.Executor = None,
+        shared_memory_threshold_in_bytes=1024 * 1024,
+        event_validation="warn",
+        startup_timeout_in_seconds: float = None,
+        warm_connections=0,
     ) -> None:
+        """
+        :param result_cache_size number of action results whose completion failed kept so that redelivered actions
+        are completed without running their handler again, 0 disables it. Results are dropped once completed
+        :param result_cache_ttl_in_seconds how long an action result is kept
+        :param min_concurrency lowest number of actions handled at once
+        :param max_concurrency highest number of actions handled at once. Between both bounds the limit adapts to
+        handler latency and failures
+        :param tracer reports a span per action with child spans for input decoding, handler execution and event
+        mapping, defaults to a tracer that does nothing. Pass the same tracer to the client to get its spans too
+        :param profiler samples the stacks of running handlers per command while it is enabled, None disables profiling
+        :param profiler_signal signal that toggles the profiler, None to not install a signal handler
+        :param health_check_port port of the health check server, None to not start it. The server toggles the
+        profiler on POST /profiler
+        :param completion_linger_in_seconds when set, results of actions finishing within this window are completed
+        together, in a single request if the server has a batch endpoint. None completes each action on its own
+        :param action_queue_size when above 0, actions are taken ahead into a queue of this size while all
+        concurrency slots are busy and handled by command priority. 0 takes an action only when a slot is free
+        :param priority_aging_rate_per_second priority a queued action gains per second of waiting so that low
+        priority commands are not starved
+        :param process_pool executor running the commands with run_in_process, defaults to a ProcessPoolExecutor
+        created when the first of them is handled
+        :param shared_memory_threshold_in_bytes inputs and output payloads of commands running in processes of this
+        size or more are passed through shared memory instead of being pickled (python 3.8+)
+        :param event_validation what to do with events the pack def doesn't declare: "strict" raises
+        UndeclaredEventError from send_event and completes the action with a fatal event when a handler returns one,
+        "warn" logs and sends them anyway, "off" sends them without checking
+        :param startup_timeout_in_seconds when set, start probes the flyte api with backoff and retries the
+        registration until this timeout before raising. None retries the registration once after
+        register_retry_wait_in_seconds
+        :param warm_connections number of connections opened to each flyte api node before registering, so the first
+        actions don't pay for connection setup
+        """
+        if event_validation not in _EVENT_VALIDATION_MODES:
+            raise ValueError(f"unsupported event validation {event_validation}")
         self._polling_frequency_in_seconds = polling_frequency_in_seconds
         self._health_checks = health_checks
         self._client = client
         self._pack_def = pack_def
+        self._loop = None
+        self._registered = False
+        self._sources: Dict[str, EventSource] = {}
         self._logger = logging.getLogger(__name__)
+        self._take_action_errors = SummarizedLog(
+            self._logger, logging.ERROR, "there was an error fetching actions: %s"
+        )
         self._registration = None
+        self._decoders = {
+            c.name: compile_decoder(c.input_type) for c in pack_def.commands
+        }
+        self._result_cache = TTLCache(
+            maxsize=result_cache_size, ttl_in_seconds=result_cache_ttl_in_seconds
+        )
+        self._memoizers = {
+            c.name: Memoizer(c.memoize, should_cache=lambda e: not is_fatal(e))
+            for c in pack_def.commands
+            if c.memoize is not None
+        }
+        self._tracer = tracer or Tracer()
+        self._limiter = AIMDLimiter(
+            min_limit=min_concurrency, max_limit=max_concurrency
+        )
+        self._profiler = profiler
+        self._profiler_signal = profiler_signal
+        self._health_check_port = health_check_port
+        self._health_check_runner = None
+        self._coalescers = {
+            e.name: EventCoalescer(e.coalesce, self._send_coalesced_event)
+            for e in pack_def.event_defs
+            if e.coalesce is not None
+        }
+        self._priorities = {c.name: c.priority for c in pack_def.commands}
+        self._event_validation = event_validation
+        self._startup_timeout_in_seconds = startup_timeout_in_seconds
+        self._warm_connections = warm_connections
+        self._undeclared_events = SummarizedLog(
+            self._logger, logging.WARNING, "sending undeclared event %s"
+        )
+        self._declared_events, self._command_events = to_event_index(pack_def)
+        self._process_commands = {
+            c.name: c for c in pack_def.commands if c.run_in_process
+        }
+        self._process_pool = process_pool
+        self._shared_memory_threshold_in_bytes = shared_memory_threshold_in_bytes
+        self._action_queue_size = action_queue_size
+        self._priority_aging_rate_per_second = priority_aging_rate_per_second
+        self._completions = None
+        if completion_linger_in_seconds is not None:
+            self._completions = CompletionBatcher(
+                client, linger_in_seconds=completion_linger_in_seconds
+            )
 
     async def start(self):
         """Registers the pack with the flyte server and starts handling actions from the flyte server and invoking
         the necessary commands. Once started the Pack is also available to send observed events. // This will also
-        start up a pack health check server. """
-        try:
-            await self._register()
-            self._logger.info(f"pack {self._pack_def.name} registered successfully")
-        except FlyteClientError:
-            time.sleep(register_retry_wait_in_seconds)
-            await self._register()
-            self._logger.info(f"pack {self._pack_def.name} registered successfully")
-            return
+        start up a pack health check server. Actions are only taken once the pack is registered, see
+        startup_timeout_in_seconds and warm_connections.
+        :raises FlyteClientError when the pack could not be registered"""
+        self._loop = asyncio.get_event_loop()
+        await self._start_up()
+        self._logger.info("pack %s registered successfully", self._pack_def.name)
 
+        self._registered = True
+        for source in self._sources.values():
+            source.start()
+        self._install_profiler_signal()
         await asyncio.gather(self._handle_commands(), self._start_health_check_server())
 
     async def send_event(self, event: Event):
         """Spontaneously sends an event that the pack has observed to the flyte server
-        :param event Event to be sent to flyte server"""
+        :param event Event to be sent to flyte server. Events whose definition has a coalesce policy may be dropped
+        or sent later, in which case errors sending them are only logged
+        :raises UndeclaredEventError if event validation is strict and the pack def doesn't declare the event"""
+        if (
+            self._event_validation != "off"
+            and event.eventDef.name not in self._declared_events
+        ):
+            if self._event_validation == "strict":
+                raise UndeclaredEventError(event.eventDef.name, self._declared_events)
+            self._undeclared_events(event.eventDef.name)
+        coalescer = self._coalescers.get(event.eventDef.name)
+        if coalescer is not None and not coalescer.offer(event):
+            return
+        await self._post_event(event)
+
+    def send_event_threadsafe(self, event: Event) -> concurrent.futures.Future:
+        """sends an event from any thread, e.g. from a handler running in the executor or from a thread the pack
+        doesn't own. The event is sent on the event loop of the pack
+        :param event Event to be sent to flyte server
+        :return future of the send_event call, its result raises SendEventError if sending failed
+        :raises RuntimeError if the pack has not been started"""
+        if self._loop is None:
+            raise RuntimeError("the pack must be started before sending events")
+        return asyncio.run_coroutine_threadsafe(self.send_event(event), self._loop)
+
+    def attach_source(
+        self,
+        source: AsyncIterable,
+        mapper: Mapper,
+        name: str = None,
+        buffer_size=100,
+        senders=1,
+    ) -> EventSource:
+        """sends the events observed on an async iterable, e.g. a message queue consumer or a log tail. Sources are
+        read concurrently, each through a bounded buffer that pauses the source while it is full. Sources attached
+        before the pack is started are read once it is registered
+        :param source async iterable of observed items
+        :param mapper maps an item to the Event to send, None skips the item. It can be a coroutine function
+        :param name name of the source in logs and metrics, defaults to source-<n>
+        :param buffer_size number of items read ahead of the senders
+        :param senders number of events of this source sent at once
+        :return the attached source, join() waits until it is exhausted and close() stops it
+        """
+        name = name or f"source-{len(self._sources) + 1}"
+        if name in self._sources:
+            raise ValueError(f"a source named {name} is already attached")
+        attached = EventSource(
+            name, source, mapper, self.send_event, buffer_size, senders
+        )
+        self._sources[name] = attached
+        if self._registered:
+            attached.start()
+        return attached
+
+    async def flush_events(self):
+        """sends the events held back by coalesce policies straight away"""
+        await asyncio.gather(*(c.flush() for c in self._coalescers.values()))
+
+    async def close(self):
+        """stops the attached sources, sends the events and completions held back, stops the health check server and
+        closes the client"""
+        for source in self._sources.values():
+            source.close()
+        await self.flush_events()
+        if self._completions is not None:
+            await self._completions.flush()
+        if self._health_check_runner is not None:
+            await self._health_check_runner.cleanup()
+            self._health_check_runner = None
+        await self._client.close()
+
+    async def _post_event(self, event: Event):
         try:
             await self._client.post_event(to_client_event(event))
         except FlyteClientError as e:
-            self._logger.error("failed to send the event", e)
+            self._logger.error(
+                "failed to send the event %s: %s", event.eventDef.name, e
+            )
             raise SendEventError(event, e)
 
+    async def _send_coalesced_event(self, event: Event):
+        try:
+            await self._post_event(event)
+        except SendEventError:
+            # already logged, the caller of send_event has returned by now
+            pass
+
+    @property
+    def pack_def(self) -> PackDef:
+        return self._pack_def
+
+    def metrics(self) -> Dict[str, Any]:
+        """returns runtime metrics of the pack"""
+        return {
+            "result_cache": self._result_cache.stats(),
+            "memoize": {name: m.stats() for name, m in self._memoizers.items()},
+            "concurrency": self._limiter.stats(),
+            "completions": self._completions.stats() if self._completions else None,
+            "coalesce": {name: c.stats() for name, c in self._coalescers.items()},
+            "sources": {name: s.stats() for name, s in self._sources.items()},
+        }
+
+    async def _start_up(self):
+        """probes the flyte api, opens the connections to warm up and registers the pack
+        :raises FlyteClientError when the pack could not be registered in time"""
+        if self._startup_timeout_in_seconds is None:
+            if self._warm_connections > 0:
+                await self._client.warm_up(self._warm_connections)
+            try:
+                await self._register()
+            except FlyteClientError:
+                await asyncio.sleep(register_retry_wait_in_seconds)
+                await self._register()
+            return
+
+        loop = asyncio.get_event_loop()
+        until = loop.time() + self._startup_timeout_in_seconds
+        await self._client.wait_until_ready(self._startup_timeout_in_seconds)
+        if self._warm_connections > 0:
+            await self._client.warm_up(self._warm_connections)
+        backoff = AdaptivePollInterval(
+            min(1, register_retry_wait_in_seconds),
+            register_retry_wait_in_seconds,
+            backoff_factor=2,
+        )
+        while True:
+            try:
+                await self._register()
+                return
+            except FlyteClientError as err:
+                wait = backoff.next()
+                if loop.time() + wait > until:
+                    raise
+                self._logger.warning(
+                    "pack registration failed, retrying in %.1fs: %s", wait, err
+                )
+                await asyncio.sleep(wait)
+
     async def _register(self):
         """Registers this pack to Flyte.
         """
@@ -65,7 +317,52 @@ class Pack:
             await self._handle_command_actions()
 
     async def _start_health_check_server(self):
-        pass
+        if self._health_check_port is None:
+            return
+        app = web.Application()
+        app.router.add_get("/profiler", self._profiler_status)
+        app.router.add_post("/profiler", self._toggle_profiler)
+        self._health_check_runner = web.AppRunner(app)
+        await self._health_check_runner.setup()
+        await web.TCPSite(
+            self._health_check_runner, port=self._health_check_port
+        ).start()
+        self._logger.info(
+            "health check server listening on port %s", self._health_check_port
+        )
+
+    async def _profiler_status(self, _) -> web.Response:
+        if self._profiler is None:
+            return web.json_response({"enabled": False}, status=404)
+        return web.json_response({"enabled": self._profiler.enabled})
+
+    async def _toggle_profiler(self, request: web.Request) -> web.Response:
+        """toggles the profiler, or sets it with ?enabled=true|false"""
+        if self._profiler is None:
+            return web.json_response({"enabled": False}, status=404)
+        enabled = request.query.get("enabled")
+        if enabled is None:
+            enabled = not self._profiler.enabled
+        else:
+            enabled = enabled.lower() == "true"
+        # disabling joins the sampler thread and writes the profiles
+        await asyncio.get_event_loop().run_in_executor(
+            None, self._profiler.enable if enabled else self._profiler.disable
+        )
+        return web.json_response({"enabled": self._profiler.enabled})
+
+    def _install_profiler_signal(self):
+        if self._profiler is None or self._profiler_signal is None:
+            return
+        loop = asyncio.get_event_loop()
+        try:
+            # disabling joins the sampler thread and writes the profiles, off the event loop
+            loop.add_signal_handler(
+                self._profiler_signal,
+                lambda: loop.run_in_executor(None, self._profiler.toggle),
+            )
+        except (NotImplementedError, RuntimeError, ValueError) as err:
+            self._logger.warning("could not install the profiler signal: %s", err)
 
     async def _handle_command_actions(self):
         """
@@ -73,9 +370,82 @@ class Pack:
         :return: None
         """
         handlers = {c.name: c.handler for c in self._pack_def.commands}
+        if self._action_queue_size > 0:
+            await self._handle_queued_actions(handlers)
+            return
+        in_flight = set()
         while self.continue_running():
+            await self._limiter.acquire()
             action = await self._get_next_action()
-            await self._handle_action(handlers, action)
+            if action is None:
+                await self._limiter.release()
+                continue
+            task = asyncio.ensure_future(self._run_action(handlers, action))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        if in_flight:
+            await asyncio.gather(*in_flight)
+
+    async def _handle_queued_actions(self, handlers: Dict[str, CommandHandler]):
+        """takes actions into a priority queue in the background and hands the most urgent one to each free
+        concurrency slot"""
+        queue = PriorityActionQueue(
+            maxsize=self._action_queue_size,
+            aging_rate_per_second=self._priority_aging_rate_per_second,
+        )
+        taker = asyncio.ensure_future(self._take_actions(queue))
+        in_flight = set()
+        try:
+            while True:
+                await self._limiter.acquire()
+                next_action = asyncio.ensure_future(queue.get())
+                await asyncio.wait(
+                    {next_action, taker}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not next_action.done():
+                    # the taker stopped and every queued action has been handed out
+                    next_action.cancel()
+                    await self._limiter.release()
+                    break
+                task = asyncio.ensure_future(
+                    self._run_action(handlers, next_action.result())
+                )
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+        finally:
+            taker.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight)
+        if not taker.cancelled():
+            taker.result()
+
+    async def _take_actions(self, queue: PriorityActionQueue):
+        while self.continue_running():
+            action = await self._get_next_action()
+            if action is not None:
+                await queue.put(self._priorities.get(action.command, 0), action)
+
+    async def _run_action(
+        self, handlers: Dict[str, CommandHandler], action: ClientAction
+    ):
+        """handles an action in its concurrency slot and reports how it went to the limiter"""
+        start = time.monotonic()
+        output_event = None
+        try:
+            with self._tracer.start_as_current_span(
+                "flyte.action", attributes={"flyte.command": action.command}
+            ) as span:
+                output_event = await self._handle_action(handlers, action)
+                if output_event is not None:
+                    span.set_attribute("flyte.event", output_event.eventDef.name)
+        except Exception as err:
+            self._logger.exception(
+                "unexpected error handling action %s: %s", action, err
+            )
+        finally:
+            await self._limiter.release(
+                time.monotonic() - start, output_event is None or is_fatal(output_event)
+            )
 
     async def _get_next_action(self) -> ClientAction:
         """
@@ -86,39 +456,184 @@ class Pack:
             try:
                 action = await self._client.take_action()
             except FlyteClientError as err:
-                self._logger.error("there was an error fetching actions", err)
+                self._take_action_errors(err)
                 action = None
 
             if action is not None:
                 return action
             else:
-                time.sleep(self._polling_frequency_in_seconds)
+                await asyncio.sleep(self._polling_frequency_in_seconds)
 
     async def _handle_action(
         self, handlers: Dict[str, CommandHandler], action: ClientAction
-    ):
+    ) -> Optional[Event]:
         """
         executes the handler associated to a specific command and completes the action
         :param handlers: handlers associated to a command
         :param action: action to be processed
-        :return:
+        :return: the event the action was completed with
         """
         if action is None:
             return
 
+        result_key = None
         if action.command in handlers:
-            output_event = handlers[action.command].handle(action.input)
-            await self._complete_action(action, output_event)
+            result_key = self._result_key(action)
+            output_event = None
+            if result_key is not None:
+                output_event = self._result_cache.get(result_key)
+            if output_event is not None:
+                self._logger.debug(
+                    "completing redelivered action %s from cache", action
+                )
+            else:
+                output_event = self._validate_output(
+                    action.command,
+                    await self._execute(handlers[action.command], action),
+                )
+                if result_key is not None:
+                    self._result_cache.put(result_key, output_event)
         else:
             self._logger.error(
-                f"no handler could be found for command {action.command} in {handlers}"
+                "no handler could be found for command %s in %s",
+                action.command,
+                list(handlers),
+            )
+            output_event = fatal_event(
+                f"no handler could be found for command {action.command} in {list(handlers)}"
+            )
+        completed = await self._complete_action(action, output_event)
+        if completed and result_key is not None:
+            # only results whose completion failed can be redelivered
+            self._result_cache.pop(result_key)
+        return output_event
+
+    def _validate_output(self, command: str, output_event: Event) -> Event:
+        """checks that the command declares the event its handler returned
+        :return: the event, or a fatal event if it is undeclared and event validation is strict
+        """
+        if (
+            self._event_validation == "off"
+            or output_event is None
+            or output_event.eventDef.name in self._command_events[command]
+        ):
+            return output_event
+        if self._event_validation == "strict":
+            err = UndeclaredEventError(
+                output_event.eventDef.name, self._command_events[command]
             )
-            await self._complete_action(
-                action,
-                fatal_event(
-                    f"no handler could be found for command {action.command} in {handlers}"
-                ),
+            self._logger.error(
+                "command %s returned an undeclared event: %s", command, err
             )
+            return fatal_event(f"command {command} returned an undeclared event: {err}")
+        self._undeclared_events(output_event.eventDef.name)
+        return output_event
+
+    async def _execute(self, handler: CommandHandler, action: ClientAction) -> Event:
+        """runs the handler of an action, through the command memoizer when the command has one
+        :param handler: handler associated to the action command
+        :param action: action to be processed
+        :return: output event
+        """
+        memoizer = self._memoizers.get(action.command)
+        if memoizer is None:
+            return await self._invoke(handler, action)
+        return await memoizer.call(action.input, lambda: self._invoke(handler, action))
+
+    async def _invoke(self, handler: CommandHandler, action: ClientAction) -> Event:
+        """decodes the action input and calls the handler. Coroutine handlers run on the event loop, other handlers
+        run in the default executor so they don't block it
+        :param handler: handler associated to the action command
+        :param action: action to be processed
+        :return: output event, a fatal event if the input could not be decoded or the handler raised an exception
+        """
+        if action.command in self._process_commands:
+            return await self._invoke_in_process(action)
+        try:
+            with self._tracer.start_as_current_span("flyte.decode_input"):
+                request = self._decoders[action.command](action.input)
+        except (ValueError, TypeError, KeyError) as err:
+            self._logger.error(
+                "could not decode input for command %s: %s", action.command, err
+            )
+            return fatal_event(f"invalid input for command {action.command}: {err}")
+        try:
+            with self._tracer.start_as_current_span("flyte.handle") as span:
+                try:
+                    if asyncio.iscoroutinefunction(handler.handle):
+                        return await self._await_handler(
+                            action.command, handler.handle(request)
+                        )
+                    return await asyncio.get_event_loop().run_in_executor(
+                        None, self._call_handler, action.command, handler, request
+                    )
+                except Exception as err:
+                    span.record_exception(err)
+                    raise
+        except Exception as err:
+            self._logger.exception(
+                "handler for command %s failed: %s", action.command, err
+            )
+            return fatal_event(f"handler for command {action.command} failed: {err}")
+
+    async def _invoke_in_process(self, action: ClientAction) -> Event:
+        """runs the handler in the process pool. The worker decodes the input and encodes the output payload, large
+        ones travel through shared memory segments
+        :param action: action to be processed
+        :return: output event with a raw payload, a fatal event if the handler failed
+        """
+        command = self._process_commands[action.command]
+        if self._process_pool is None:
+            self._process_pool = concurrent.futures.ProcessPoolExecutor()
+        segment, action_input = None, action.input
+        threshold = self._shared_memory_threshold_in_bytes
+        if processes.shared_memory is not None and len(action_input) >= threshold:
+            segment, action_input = processes.share(action_input.encode("utf-8"))
+        try:
+            with self._tracer.start_as_current_span("flyte.handle") as span:
+                try:
+                    event = await asyncio.get_event_loop().run_in_executor(
+                        self._process_pool,
+                        processes.handle_in_process,
+                        command.handler,
+                        command.input_type,
+                        action_input,
+                        threshold,
+                    )
+                except Exception as err:
+                    span.record_exception(err)
+                    raise
+        except Exception as err:
+            self._logger.exception(
+                "handler for command %s failed: %s", action.command, err
+            )
+            return fatal_event(f"handler for command {action.command} failed: {err}")
+        finally:
+            if segment is not None:
+                processes.release(segment)
+        if isinstance(event.payload, processes.SharedPayload):
+            event = replace(event, payload=RawPayload(processes.take(event.payload)))
+        return event
+
+    async def _await_handler(self, command: str, coroutine) -> Event:
+        if self._profiler is None:
+            return await coroutine
+        with self._profiler.track_coroutine(command, coroutine):
+            return await coroutine
+
+    def _call_handler(self, command: str, handler: CommandHandler, request) -> Event:
+        if self._profiler is None:
+            return handler.handle(request)
+        with self._profiler.track_thread(command):
+            return handler.handle(request)
+
+    @staticmethod
+    def _result_key(action: ClientAction) -> Optional[str]:
+        """the action result url identifies an action, redeliveries of an action share it"""
+        try:
+            return action.get_action_complete_url()
+        except ValueError:
+            return None
 
     @staticmethod
     def continue_running() -> bool:
@@ -128,14 +643,21 @@ class Pack:
         """
         return True
 
-    async def _complete_action(self, action: ClientAction, event: Event):
+    async def _complete_action(self, action: ClientAction, event: Event) -> bool:
         """
         mark an action as completed in flyte server
         :param action: action to be marked as completed
         :param event: result
-        :return:
+        :return: whether the flyte server acknowledged the result
         """
         try:
-            await self._client.complete_action(action, to_client_event(event))
+            with self._tracer.start_as_current_span("flyte.map_event"):
+                client_event = to_client_event(event)
+            if self._completions is None:
+                await self._client.complete_action(action, client_event)
+            else:
+                await self._completions.submit(action, client_event)
+            return True
         except FlyteClientError as err:
             self._logger.error("could not complete action %s: %s", action, err)
+            return False
@@ -0,0 +1,79 @@
+import json
+from dataclasses import replace
+from typing import Any, NamedTuple, Tuple, Union
+
+from flyte.client.classes import RawPayload
+from flyte.pack.classes import CommandHandler, Event
+from flyte.pack.codecs import compile_decoder, encode_payload
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # python < 3.8
+    shared_memory = None
+
+
+class SharedPayload(NamedTuple):
+    """
+    reference to bytes handed to or from a worker process through a shared memory segment
+    """
+
+    name: str
+    size: int
+
+
+def share(data: bytes) -> Tuple[Any, SharedPayload]:
+    """copies data into a new shared memory segment. The segment has to be released by the caller once the other
+    process is done with it
+    :return segment and the reference to pass to the other process
+    """
+    segment = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+    segment.buf[: len(data)] = data
+    return segment, SharedPayload(segment.name, len(data))
+
+
+def release(segment):
+    segment.close()
+    segment.unlink()
+
+
+def read(ref: SharedPayload) -> bytes:
+    """copies the bytes out of a segment created by another process, leaving the segment in place"""
+    segment = shared_memory.SharedMemory(name=ref.name)
+    try:
+        return bytes(segment.buf[: ref.size])
+    finally:
+        segment.close()
+
+
+def take(ref: SharedPayload) -> bytes:
+    """copies the bytes out of a segment created by another process and releases the segment"""
+    segment = shared_memory.SharedMemory(name=ref.name)
+    try:
+        return bytes(segment.buf[: ref.size])
+    finally:
+        release(segment)
+
+
+def handle_in_process(
+    handler: CommandHandler,
+    input_type: type,
+    action_input: Union[str, SharedPayload],
+    threshold_in_bytes: int,
+) -> Event:
+    """runs in the worker process: decodes the action input, calls the handler and encodes the payload of the output
+    event so the pack does not have to. Payloads of threshold_in_bytes or more are returned through a shared memory
+    segment that the pack releases.
+    """
+    if isinstance(action_input, SharedPayload):
+        action_input = read(action_input).decode("utf-8")
+    event = handler.handle(compile_decoder(input_type)(action_input))
+    if isinstance(event.payload, RawPayload):
+        data = event.payload.data
+    else:
+        data = json.dumps(encode_payload(event.payload)).encode("utf-8")
+    if shared_memory is None or len(data) < threshold_in_bytes:
+        return replace(event, payload=RawPayload(data))
+    segment, ref = share(data)
+    # the pack unlinks the segment once it has read it
+    segment.close()
+    return replace(event, payload=ref)
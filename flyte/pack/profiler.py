@@ -0,0 +1,179 @@
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+class SamplingProfiler:
+    """
+    samples the stacks of running handlers, both handlers running in executor threads and coroutine handlers, and
+    aggregates them per command as collapsed stacks that flamegraph tools understand. Sampling happens in a
+    daemon thread and only while the profiler is enabled.
+    """
+
+    def __init__(
+        self,
+        interval_in_seconds=0.01,
+        dump_interval_in_seconds=60,
+        output_dir="profiles",
+        enabled=False,
+    ) -> None:
+        """
+        :param interval_in_seconds time between samples
+        :param dump_interval_in_seconds time between dumps of the aggregated stacks
+        :param output_dir directory where a <command>-<timestamp>.folded file is written per command on each dump
+        :param enabled start sampling straight away
+        """
+        self._interval_in_seconds = interval_in_seconds
+        self._dump_interval_in_seconds = dump_interval_in_seconds
+        self._output_dir = output_dir
+        self._logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._threads: Dict[int, str] = {}
+        self._coroutines: Dict[int, tuple] = {}
+        self._stacks: Dict[str, Counter] = defaultdict(Counter)
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        if enabled:
+            self.enable()
+
+    @property
+    def enabled(self) -> bool:
+        return self._sampler is not None
+
+    def enable(self):
+        if self._sampler is not None:
+            return
+        self._stop.clear()
+        self._sampler = threading.Thread(
+            target=self._run, name="flyte-profiler", daemon=True
+        )
+        self._sampler.start()
+        self._logger.info("handler profiling enabled")
+
+    def disable(self):
+        """stops sampling and dumps what has been sampled so far"""
+        if self._sampler is None:
+            return
+        self._stop.set()
+        self._sampler.join()
+        self._sampler = None
+        self.dump()
+        self._logger.info("handler profiling disabled")
+
+    def toggle(self):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    @contextmanager
+    def track_thread(self, command: str):
+        """marks the current thread as running a handler of command"""
+        ident = threading.get_ident()
+        with self._lock:
+            self._threads[ident] = command
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._threads.pop(ident, None)
+
+    @contextmanager
+    def track_coroutine(self, command: str, coroutine):
+        """marks a coroutine as a handler of command"""
+        with self._lock:
+            self._coroutines[id(coroutine)] = (command, coroutine)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._coroutines.pop(id(coroutine), None)
+
+    def sample(self):
+        """records the current stack of every running handler"""
+        frames = sys._current_frames()
+        with self._lock:
+            threads = list(self._threads.items())
+            coroutines = list(self._coroutines.values())
+        stacks = []
+        for ident, command in threads:
+            frame = frames.get(ident)
+            if frame is not None:
+                stacks.append((command, _thread_stack(frame)))
+        for command, coroutine in coroutines:
+            stack = _coroutine_stack(coroutine)
+            if stack:
+                stacks.append((command, stack))
+        with self._lock:
+            for command, stack in stacks:
+                self._stacks[command][";".join(stack)] += 1
+
+    def collapsed(self) -> Dict[str, str]:
+        """returns the aggregated stacks per command in collapsed format, one "frame;frame count" line per stack"""
+        with self._lock:
+            return {
+                command: "\n".join(f"{s} {n}" for s, n in stacks.most_common())
+                for command, stacks in self._stacks.items()
+            }
+
+    def dump(self):
+        """writes the aggregated stacks of each command to output_dir and starts aggregating again"""
+        collapsed = self.collapsed()
+        with self._lock:
+            self._stacks.clear()
+        if not collapsed:
+            return
+        os.makedirs(self._output_dir, exist_ok=True)
+        timestamp = int(time.time())
+        for command, stacks in collapsed.items():
+            path = os.path.join(self._output_dir, f"{command}-{timestamp}.folded")
+            with open(path, "w") as f:
+                f.write(stacks + "\n")
+            self._logger.info("wrote %s handler profile to %s", command, path)
+
+    def _run(self):
+        next_dump = time.monotonic() + self._dump_interval_in_seconds
+        while not self._stop.wait(self._interval_in_seconds):
+            try:
+                self.sample()
+                if time.monotonic() >= next_dump:
+                    self.dump()
+                    next_dump = time.monotonic() + self._dump_interval_in_seconds
+            except Exception as err:
+                self._logger.error("profiler sampling failed: %s", err)
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)})"
+
+
+def _thread_stack(frame) -> List[str]:
+    """stack from the outermost to the innermost frame"""
+    stack = []
+    while frame is not None:
+        stack.append(_frame_name(frame))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _coroutine_stack(coroutine) -> List[str]:
+    """follows the chain of awaited coroutines and generators from the handler down to where it is suspended"""
+    stack = []
+    while coroutine is not None:
+        frame = getattr(coroutine, "cr_frame", None) or getattr(
+            coroutine, "gi_frame", None
+        )
+        if frame is None:
+            break
+        stack.append(_frame_name(frame))
+        coroutine = getattr(coroutine, "cr_await", None) or getattr(
+            coroutine, "gi_yieldfrom", None
+        )
+    return stack
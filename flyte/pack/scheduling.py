@@ -0,0 +1,43 @@
+import asyncio
+import itertools
+import time
+from typing import Any
+
+
+class PriorityActionQueue:
+    """
+    bounded priority queue with aging. An item waiting for t seconds competes with an effective priority of
+    priority + aging_rate_per_second * t, so items of low priority commands are eventually handled even while
+    higher priority ones keep arriving. As every item ages at the same rate the order between two queued items never
+    changes, which keeps the queue a plain heap.
+    """
+
+    def __init__(self, maxsize=0, aging_rate_per_second=1.0, clock=time.monotonic):
+        """
+        :param maxsize number of items after which put waits, 0 for unbounded
+        :param aging_rate_per_second priority gained per second of waiting, 0 disables aging
+        :param clock returns the current time in seconds
+        """
+        self._maxsize = maxsize
+        self._aging_rate = aging_rate_per_second
+        self._clock = clock
+        self._counter = itertools.count()
+        self._queue = None
+
+    async def put(self, priority: float, item: Any):
+        """queues an item, waiting for a free slot when the queue is full. Higher priorities are handled first"""
+        rank = self._aging_rate * self._clock() - priority
+        await self._get_queue().put((rank, next(self._counter), item))
+
+    async def get(self) -> Any:
+        """removes and returns the item with the highest effective priority, waiting for one if the queue is empty"""
+        _, _, item = await self._get_queue().get()
+        return item
+
+    def qsize(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def _get_queue(self) -> asyncio.PriorityQueue:
+        if self._queue is None:
+            self._queue = asyncio.PriorityQueue(self._maxsize)
+        return self._queue
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional
+
+from flyte.pack.classes import Event
+
+Mapper = Callable[[Any], Optional[Event]]
+
+_END = object()
+
+
+class EventSource:
+    """
+    consumes an async iterable and sends the events it maps to. Items are read into a bounded buffer, once it is full
+    the source is not read again until senders have made room, so a slow flyte server slows the source down instead of
+    piling up items in memory.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        source: AsyncIterable,
+        mapper: Mapper,
+        send: Callable[[Event], Awaitable[None]],
+        buffer_size=100,
+        senders=1,
+    ) -> None:
+        """
+        :param name name of the source in logs and metrics
+        :param source async iterable of observed items
+        :param mapper maps an item to the event to send, None skips the item. It can be a coroutine function
+        :param send coroutine function sending an event
+        :param buffer_size number of items read ahead of the senders
+        :param senders number of events of this source sent at once
+        """
+        self.name = name
+        self._source = source
+        self._mapper = mapper
+        self._send = send
+        self._buffer_size = buffer_size
+        self._sender_count = senders
+        self._logger = logging.getLogger(__name__)
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Future] = []
+        self.received = 0
+        self.sent = 0
+        self.skipped = 0
+        self.failed = 0
+        self._lag_in_seconds = 0.0
+        self._paused_in_seconds = 0.0
+
+    def start(self):
+        self._queue = asyncio.Queue(self._buffer_size)
+        self._tasks = [asyncio.ensure_future(self._read())] + [
+            asyncio.ensure_future(self._send_buffered())
+            for _ in range(self._sender_count)
+        ]
+
+    async def join(self):
+        """waits until the source is exhausted and every item read from it is handled"""
+        await asyncio.gather(*self._tasks)
+
+    def close(self):
+        """stops reading the source, buffered items are dropped"""
+        for task in self._tasks:
+            task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        lag_in_seconds is the time the last item handled waited in the buffer, paused_in_seconds the total time the
+        source was not read because the buffer was full
+        """
+        return {
+            "received": self.received,
+            "sent": self.sent,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "buffered": self._queue.qsize() if self._queue is not None else 0,
+            "lag_in_seconds": self._lag_in_seconds,
+            "paused_in_seconds": self._paused_in_seconds,
+        }
+
+    async def _read(self):
+        try:
+            async for item in self._source:
+                self.received += 1
+                entry = (time.monotonic(), item)
+                if self._queue.full():
+                    paused_at = time.monotonic()
+                    await self._queue.put(entry)
+                    self._paused_in_seconds += time.monotonic() - paused_at
+                else:
+                    self._queue.put_nowait(entry)
+        except Exception as err:
+            self._logger.error("source %s failed: %s", self.name, err)
+        for _ in range(self._sender_count):
+            await self._queue.put(_END)
+
+    async def _send_buffered(self):
+        while True:
+            entry = await self._queue.get()
+            if entry is _END:
+                return
+            enqueued_at, item = entry
+            self._lag_in_seconds = time.monotonic() - enqueued_at
+            try:
+                event = self._mapper(item)
+                if asyncio.iscoroutine(event):
+                    event = await event
+                if event is None:
+                    self.skipped += 1
+                    continue
+                await self._send(event)
+                self.sent += 1
+            except Exception as err:
+                self.failed += 1
+                self._logger.error(
+                    "could not send the event of source %s for %s: %s",
+                    self.name,
+                    item,
+                    err,
+                )
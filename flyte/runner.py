@@ -0,0 +1,106 @@
+import asyncio
+import gc
+import logging
+import signal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Sequence, Tuple
+
+from flyte.pack.pack import Pack
+
+_logger = logging.getLogger(__name__)
+
+_SHUTDOWN_SIGNALS = tuple(
+    getattr(signal, name) for name in ("SIGINT", "SIGTERM") if hasattr(signal, name)
+)
+
+
+def new_event_loop(use_uvloop: Optional[bool] = None) -> asyncio.AbstractEventLoop:
+    """
+    :param use_uvloop True requires uvloop, None uses it when it is installed and False never does
+    """
+    if use_uvloop is not False:
+        try:
+            import uvloop
+
+            return uvloop.new_event_loop()
+        except ImportError as err:
+            if use_uvloop:
+                raise ImportError(
+                    "use_uvloop requires uvloop, install flyte-client[uvloop]"
+                ) from err
+    return asyncio.new_event_loop()
+
+
+def run(
+    pack: Pack,
+    use_uvloop: Optional[bool] = None,
+    executor_workers: Optional[int] = None,
+    gc_thresholds: Optional[Tuple[int, int, int]] = None,
+    shutdown_signals: Sequence[signal.Signals] = _SHUTDOWN_SIGNALS,
+    shutdown_timeout_in_seconds=30.0,
+):
+    """
+    starts the pack on a new event loop and blocks until it stops. On the first shutdown signal the pack stops taking
+    actions and finishes the ones in flight, a second signal or the shutdown timeout cancels them. A pack without
+    commands, e.g. one that only sends the events of attached sources, runs until a shutdown signal. The pack is closed
+    before returning, which sends the events held back and closes its client.
+    :param pack pack to run
+    :param use_uvloop True requires uvloop, None uses it when it is installed and False never does
+    :param executor_workers size of the default thread pool running synchronous handlers, defaults to the asyncio one
+    :param gc_thresholds thresholds of the garbage collector while the pack runs, see gc.set_threshold. Packs
+    allocating a lot per action spend less time collecting with a higher first threshold, e.g. (50000, 20, 20)
+    :param shutdown_signals signals that stop the pack gracefully
+    :param shutdown_timeout_in_seconds time given to the actions in flight once a shutdown signal is received
+    """
+    loop = new_event_loop(use_uvloop)
+    asyncio.set_event_loop(loop)
+    if executor_workers is not None:
+        loop.set_default_executor(
+            ThreadPoolExecutor(executor_workers, thread_name_prefix="flyte")
+        )
+    previous_gc_thresholds = gc.get_threshold()
+    if gc_thresholds is not None:
+        gc.set_threshold(*gc_thresholds)
+    stopped = asyncio.Event()
+
+    async def serve():
+        await pack.start()
+        if not pack.pack_def.commands:
+            await stopped.wait()
+
+    task = loop.create_task(serve())
+    stopping = []
+
+    def stop(sig: signal.Signals):
+        if stopping:
+            _logger.info("received %s again, cancelling the actions in flight", sig)
+            task.cancel()
+            return
+        _logger.info("received %s, finishing the actions in flight", sig)
+        stopping.append(loop.call_later(shutdown_timeout_in_seconds, task.cancel))
+        pack.continue_running = lambda: False
+        stopped.set()
+
+    installed = []
+    for sig in shutdown_signals:
+        try:
+            loop.add_signal_handler(sig, stop, sig)
+            installed.append(sig)
+        except (NotImplementedError, RuntimeError, ValueError) as err:
+            _logger.warning("could not install a handler for %s: %s", sig, err)
+    try:
+        loop.run_until_complete(task)
+    except asyncio.CancelledError:
+        _logger.info("pack stopped before finishing the actions in flight")
+    finally:
+        for timer in stopping:
+            timer.cancel()
+        for sig in installed:
+            loop.remove_signal_handler(sig)
+        try:
+            loop.run_until_complete(pack.close())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+            asyncio.set_event_loop(None)
+            gc.set_threshold(*previous_gc_thresholds)
@@ -0,0 +1,4 @@
+from flyte.testing.server import FakeFlyteServer  # noqa
+from flyte.testing.transport import InMemoryTransport  # noqa
+from flyte.testing.tracing import RecordingTracer  # noqa
+from flyte.testing.replay import TrafficRecorder, TrafficReplayer  # noqa
@@ -0,0 +1,318 @@
+"""
+records the traffic of a pack and replays it offline against the fake flyte server.
+
+    python -m flyte.testing.replay trace.jsonl.gz my_pack.main:create_pack --speed 10
+
+replays a trace against the pack returned by create_pack(client) and prints throughput and latency next to the
+recorded ones.
+"""
+import argparse
+import asyncio
+import gzip
+import importlib
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, IO, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+from flyte.client.client import Client
+from flyte.client.compression import decompress
+from flyte.client.transport import Transport
+from flyte.pack.pack import Pack
+from flyte.testing.server import FakeFlyteServer
+from flyte.testing.transport import InMemoryTransport
+
+_take = re.compile(r"/actions/take$")
+_result = re.compile(r"/actions/[^/]+/result$")
+_results = re.compile(r"/actions/results$")
+_event = re.compile(r"/events$")
+
+
+def _open(path: str, mode: str) -> IO:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class TrafficRecorder(Transport):
+    """
+    transport that records the actions a pack takes, the events it completes them with and the events it sends while
+    passing every request on to another transport. Records are json lines with the time since recording started,
+    written to path, gzip compressed when it ends with .gz:
+    {"t": 0.1, "type": "action", "command": "name", "input": "...", "size": 3}
+    {"t": 0.3, "type": "completion", "command": "name", "event": "name", "size": 10, "latency": 0.2}
+    {"t": 0.5, "type": "event", "event": "name", "size": 10}
+    """
+
+    def __init__(self, transport: Transport, path: str, record_inputs=True) -> None:
+        """
+        :param transport transport the requests are sent with
+        :param path file the records are written to
+        :param record_inputs write action inputs, without them actions are replayed with inputs of the same size
+        """
+        self._transport = transport
+        self._file = _open(path, "w")
+        self._record_inputs = record_inputs
+        self._start = time.monotonic()
+        self._taken: Dict[str, tuple] = {}
+
+    async def get(self, url, timeout, headers=None) -> (str, int):
+        return await self._transport.get(url, timeout, headers)
+
+    async def post(self, url, data, timeout, headers=None) -> (str, int):
+        content, status = await self._transport.post(url, data, timeout, headers)
+        if status < 300:
+            self._observe(urlsplit(url).path, data, content, headers)
+        return content, status
+
+    def subscribe(self, url, headers=None):
+        return self._transport.subscribe(url, headers)
+
+    async def close(self):
+        self._file.close()
+        await self._transport.close()
+
+    def _observe(self, path: str, data, content: str, headers):
+        now = time.monotonic()
+        if _take.search(path) and content:
+            action = json.loads(content)
+            result = next(
+                (
+                    urlsplit(link["href"]).path
+                    for link in action.get("links") or []
+                    if link["rel"].endswith("actionResult")
+                ),
+                None,
+            )
+            self._taken[result] = (now, action["command"])
+            record = {
+                "type": "action",
+                "command": action["command"],
+                "size": len(action["input"] or ""),
+            }
+            if self._record_inputs:
+                record["input"] = action["input"]
+            self._write(now, record)
+        elif _result.search(path) or _results.search(path) or _event.search(path):
+            encoding = (headers or {}).get("Content-Encoding")
+            if encoding:
+                data = decompress(data, encoding)
+            if isinstance(data, bytes):
+                data = data.decode("utf-8")
+            body = json.loads(data)
+            if _event.search(path):
+                self._write(
+                    now,
+                    {"type": "event", "event": body.get("event"), "size": len(data)},
+                )
+            elif _results.search(path):
+                for entry, status in zip(body, json.loads(content)):
+                    if status < 300:
+                        self._completed(
+                            now,
+                            urlsplit(entry["href"]).path,
+                            entry["event"].get("event"),
+                            len(json.dumps(entry["event"])),
+                        )
+            else:
+                self._completed(now, path, body.get("event"), len(data))
+
+    def _completed(self, now: float, path: str, event: Optional[str], size: int):
+        taken_at, command = self._taken.pop(path, (None, None))
+        record = {
+            "type": "completion",
+            "command": command,
+            "event": event,
+            "size": size,
+        }
+        if taken_at is not None:
+            record["latency"] = now - taken_at
+        self._write(now, record)
+
+    def _write(self, now: float, record: dict):
+        self._file.write(
+            json.dumps(dict(t=round(now - self._start, 6), **record)) + "\n"
+        )
+
+
+def read_trace(path: str) -> Iterator[dict]:
+    with _open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+@dataclass
+class TrafficSummary:
+    actions: int = 0
+    completions: int = 0
+    duration_in_seconds: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    events: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def of(cls, records: List[dict]) -> "TrafficSummary":
+        summary = cls()
+        for record in records:
+            summary.duration_in_seconds = max(summary.duration_in_seconds, record["t"])
+            if record["type"] == "action":
+                summary.actions += 1
+            elif record["type"] == "completion":
+                summary.completions += 1
+                if "latency" in record:
+                    summary.latencies.append(record["latency"])
+            else:
+                summary.events[record["event"]] = (
+                    summary.events.get(record["event"], 0) + 1
+                )
+        return summary
+
+    @property
+    def throughput(self) -> float:
+        """completed actions per second"""
+        if self.duration_in_seconds == 0:
+            return 0.0
+        return self.completions / self.duration_in_seconds
+
+    def latency(self, q: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+@dataclass
+class ReplayReport:
+    recorded: TrafficSummary
+    replayed: TrafficSummary
+    speed: float
+
+    def format(self) -> str:
+        def ms(value):
+            return "-" if value is None else f"{value * 1000:.1f}"
+
+        rows = [("", "recorded", f"replayed {self.speed:g}x")]
+        rows.append(
+            (
+                "completed",
+                str(self.recorded.completions),
+                str(self.replayed.completions),
+            )
+        )
+        rows.append(
+            (
+                "actions/s",
+                f"{self.recorded.throughput:.1f}",
+                f"{self.replayed.throughput:.1f}",
+            )
+        )
+        for q in (0.5, 0.95, 0.99):
+            rows.append(
+                (
+                    f"p{int(q * 100)} ms",
+                    ms(self.recorded.latency(q)),
+                    ms(self.replayed.latency(q)),
+                )
+            )
+        for name in sorted(set(self.recorded.events) | set(self.replayed.events)):
+            rows.append(
+                (
+                    f"event {name}",
+                    str(self.recorded.events.get(name, 0)),
+                    str(self.replayed.events.get(name, 0)),
+                )
+            )
+        return "\n".join(f"{a:<24}{b:>14}{c:>16}" for a, b, c in rows)
+
+
+class TrafficReplayer:
+    """
+    replays the actions of a trace against a pack talking to a FakeFlyteServer, at the recorded pace divided by
+    speed, and records the replay to compare it with the trace. Use a short polling frequency on the pack, it waits
+    that long whenever it finds no action.
+    """
+
+    def __init__(self, trace_path: str, speed=1.0, timeout_in_seconds=60) -> None:
+        """
+        :param trace_path trace written by TrafficRecorder
+        :param speed replay speed, 2 replays twice as fast as recorded
+        :param timeout_in_seconds stops the replay when the pack takes longer to complete every action
+        """
+        self._records = list(read_trace(trace_path))
+        self._speed = speed
+        self._timeout_in_seconds = timeout_in_seconds
+
+    async def run(
+        self, create_pack: Callable[[Client], Pack], replay_path: str
+    ) -> ReplayReport:
+        """
+        :param create_pack builds the pack under test with the given client
+        :param replay_path file the replayed traffic is recorded to
+        :return recorded and replayed traffic summaries
+        """
+        server = FakeFlyteServer(url="http://flyte", batch_completion=True)
+        recorder = TrafficRecorder(InMemoryTransport(server), replay_path)
+        client = Client(url=server.url, transport=recorder)
+        pack = create_pack(client)
+        actions = [r for r in self._records if r["type"] == "action"]
+        deadline = time.monotonic() + self._timeout_in_seconds
+        fed = asyncio.Event()
+
+        def continue_running():
+            if time.monotonic() > deadline:
+                return False
+            return not fed.is_set() or len(server.completed) < len(actions)
+
+        pack.continue_running = continue_running
+        feeder = asyncio.ensure_future(self._feed(server, actions, fed))
+        try:
+            await pack.start()
+        finally:
+            feeder.cancel()
+            await client.close()
+        return ReplayReport(
+            recorded=TrafficSummary.of(self._records),
+            replayed=TrafficSummary.of(list(read_trace(replay_path))),
+            speed=self._speed,
+        )
+
+    async def _feed(self, server: FakeFlyteServer, actions: List[dict], fed):
+        start = time.monotonic()
+        for action in actions:
+            delay = action["t"] / self._speed - (time.monotonic() - start)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            server.add_action(
+                action["command"], action.get("input", "x" * action["size"])
+            )
+        fed.set()
+
+
+def load_pack_factory(target: str) -> Callable[[Client], Pack]:
+    """
+    :param target module:function returning a pack given a client, as passed on the command line
+    :return the function
+    """
+    module, _, name = target.partition(":")
+    return getattr(importlib.import_module(module), name)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("trace", help="trace recorded with TrafficRecorder")
+    parser.add_argument(
+        "factory", help="module:function returning the pack to test given a client"
+    )
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed")
+    parser.add_argument(
+        "--output", default="replay.jsonl.gz", help="file the replay is recorded to"
+    )
+    args = parser.parse_args()
+    report = asyncio.run(
+        TrafficReplayer(args.trace, args.speed).run(
+            load_pack_factory(args.factory), args.output
+        )
+    )
+    print(report.format())
@@ -0,0 +1,326 @@
+import asyncio
+import gzip
+import itertools
+import json
+import re
+import zlib
+from collections import deque
+from typing import Dict, List, Optional, Union
+
+from aiohttp import web
+
+
+class FakeFlyteServer:
+    """
+    in-process stand-in for the flyte api, useful to run packs offline in tests and benchmarks.
+    It serves the hateoas links a client needs, hands out queued actions and records completed actions and events.
+    Requests can reach it over http once started, or without sockets through dispatch (see InMemoryTransport).
+    """
+
+    _routes = [
+        ("GET", re.compile(r"^/v1$"), "_links"),
+        ("POST", re.compile(r"^/v1/packs$"), "_register"),
+        ("POST", re.compile(r"^/v1/packs/(?P<pack>[^/]+)/actions/take$"), "_take"),
+        (
+            "POST",
+            re.compile(r"^/v1/packs/(?P<pack>[^/]+)/actions/(?P<id>[^/]+)/result$"),
+            "_complete",
+        ),
+        (
+            "POST",
+            re.compile(r"^/v1/packs/(?P<pack>[^/]+)/actions/results$"),
+            "_complete_batch",
+        ),
+        ("POST", re.compile(r"^/v1/packs/(?P<pack>[^/]+)/events$"), "_event"),
+    ]
+    _result_url = re.compile(r"/v1/packs/(?P<pack>[^/]+)/actions/(?P<id>[^/]+)/result$")
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        client_max_size=64 * 1024 * 1024,
+        url: Optional[str] = None,
+        push: Optional[str] = None,
+        batch_completion=False,
+    ) -> None:
+        """
+        :param url base url used in the hateoas links when the server is only reached through dispatch
+        :param push "websocket" or "sse" to advertise an action stream, pending and new actions are then pushed to
+        subscribers
+        :param batch_completion advertise an endpoint that completes several actions in one request
+        """
+        if push not in (None, "websocket", "sse"):
+            raise ValueError(f"unsupported push mode {push}")
+        self._host = host
+        self._port = port
+        self._client_max_size = client_max_size
+        self._url = url
+        self._runner = None
+        self._nodes: Dict[str, web.TCPSite] = {}
+        self._ids = itertools.count(1)
+        self._pending = deque()
+        self._push = push
+        self._batch_completion = batch_completion
+        self._subscribers: List[asyncio.Queue] = []
+        self._stalled: List[asyncio.Queue] = []
+        self.packs: List[Dict] = []
+        self.events: List[Dict] = []
+        self.completed: Dict[str, Dict] = {}
+        self.requests = 0
+        self.bytes_received = 0
+        self.last_request_headers: Dict[str, str] = {}
+
+    @property
+    def url(self) -> str:
+        if self._url is not None:
+            return self._url
+        return f"http://{self._host}:{self._port}"
+
+    async def start(self):
+        """starts listening, when port is 0 a free port is picked"""
+        self._runner = web.AppRunner(self._create_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        self._port = self._runner.addresses[0][1]
+
+    async def stop(self):
+        if self._runner is not None:
+            self.disconnect_subscribers()
+            await self._runner.cleanup()
+            self._runner = None
+            self._nodes.clear()
+
+    async def add_node(self) -> str:
+        """listens on another free port, like another node of the same flyte api. Hateoas links keep pointing to
+        url. Requires the server to be started
+        :return base url of the node"""
+        addresses = set(self._runner.addresses)
+        site = web.TCPSite(self._runner, self._host, 0)
+        await site.start()
+        (address,) = set(self._runner.addresses) - addresses
+        url = f"http://{self._host}:{address[1]}"
+        self._nodes[url] = site
+        return url
+
+    async def stop_node(self, url: str):
+        """stops listening on a node added with add_node, or on url for the main node"""
+        if url == self.url:
+            site = next(s for s in self._runner.sites if s not in self._nodes.values())
+        else:
+            site = self._nodes.pop(url)
+        await site.stop()
+
+    def add_action(self, command: str, input: str = "") -> str:
+        """queues an action to be taken by the pack
+        :param command command name
+        :param input action input
+        :return action id"""
+        action_id = str(next(self._ids))
+        self._pending.append((action_id, command, input))
+        self._push_pending()
+        return action_id
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def disconnect_subscribers(self):
+        """closes every action stream, undelivered actions go back to the pending actions"""
+        for subscriber in self._subscribers + self._stalled:
+            subscriber.put_nowait(None)
+
+    def stall_subscribers(self):
+        """stops writing to the action streams without closing them, like a proxy that dropped them silently"""
+        self._stalled.extend(self._subscribers)
+        self._subscribers.clear()
+
+    @property
+    def pending_actions(self) -> int:
+        return len(self._pending)
+
+    def dispatch(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Union[str, bytes]],
+        content_encoding: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> (str, int):
+        """handles a request
+        :param method http method
+        :param path request path, without scheme and host
+        :param body request body
+        :param content_encoding gzip or deflate when the body is compressed
+        :param headers request headers
+        :return response body and status code
+        """
+        self.last_request_headers = dict(headers or {})
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.requests += 1
+        self.bytes_received += len(body) if body else 0
+        if body and content_encoding == "gzip":
+            body = gzip.decompress(body)
+        elif body and content_encoding == "deflate":
+            body = zlib.decompress(body)
+        return self._route(method, path, body.decode("utf-8") if body else None)
+
+    def _route(self, method: str, path: str, body: Optional[str]) -> (str, int):
+        for route_method, pattern, name in self._routes:
+            match = pattern.match(path)
+            if match and route_method == method:
+                return getattr(self, name)(body, **match.groupdict())
+        return "", 404
+
+    def _create_app(self) -> web.Application:
+        app = web.Application(client_max_size=self._client_max_size)
+        app.router.add_get("/v1/packs/{pack}/actions/stream", self._stream)
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        return app
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self.bytes_received += request.content_length or 0
+        self.last_request_headers = dict(request.headers)
+        body, status = self._route(request.method, request.path, await request.text())
+        return web.Response(text=body, status=status, content_type="application/json")
+
+    def _links(self, _) -> (str, int):
+        return (
+            json.dumps(
+                {
+                    "links": [
+                        {
+                            "href": f"{self.url}/v1/packs",
+                            "rel": f"{self.url}/swagger#!/pack/listPacks",
+                        }
+                    ]
+                }
+            ),
+            200,
+        )
+
+    def _register(self, body: str) -> (str, int):
+        pack = json.loads(body)
+        self.packs.append(pack)
+        pack["id"] = pack["name"]
+        pack["links"] = (pack.get("links") or []) + self._pack_links(pack["name"])
+        return json.dumps(pack), 200
+
+    def _pack_links(self, name: str) -> List[Dict]:
+        links = [
+            {
+                "href": f"{self.url}/v1/packs/{name}/actions/take",
+                "rel": f"{self.url}/swagger#!/action/takeAction",
+            },
+            {
+                "href": f"{self.url}/v1/packs/{name}/events",
+                "rel": f"{self.url}/swagger#/event",
+            },
+        ]
+        if self._batch_completion:
+            links.append(
+                {
+                    "href": f"{self.url}/v1/packs/{name}/actions/results",
+                    "rel": f"{self.url}/swagger#!/action/actionResults",
+                }
+            )
+        if self._push is not None:
+            base = self.url
+            if self._push == "websocket":
+                base = base.replace("http", "ws", 1)
+            links.append(
+                {
+                    "href": f"{base}/v1/packs/{name}/actions/stream",
+                    "rel": f"{self.url}/swagger#!/action/actionStream",
+                }
+            )
+        return links
+
+    def _take(self, _, pack: str) -> (str, int):
+        if not self._pending:
+            return "", 204
+        action_id, command, action_input = self._pending.popleft()
+        return json.dumps(self._action(pack, action_id, command, action_input)), 200
+
+    def _action(self, pack: str, action_id: str, command: str, action_input: str):
+        return {
+            "command": command,
+            "input": action_input,
+            "links": [
+                {
+                    "href": f"{self.url}/v1/packs/{pack}/actions/{action_id}/result",
+                    "rel": f"{self.url}/swagger#!/action/actionResult",
+                }
+            ],
+        }
+
+    def _complete(self, body: str, pack: str, id: str) -> (str, int):
+        self.completed[id] = json.loads(body)
+        return json.dumps({"result": "ok"}), 200
+
+    def _complete_batch(self, body: str, pack: str) -> (str, int):
+        """completes each {"href": result url, "event": event} entry and returns a status code per entry"""
+        statuses = []
+        for result in json.loads(body):
+            match = self._result_url.search(result["href"])
+            if match is None:
+                statuses.append(404)
+                continue
+            self.completed[match.group("id")] = result["event"]
+            statuses.append(200)
+        return json.dumps(statuses), 200
+
+    def _event(self, body: str, pack: str) -> (str, int):
+        self.events.append(json.loads(body))
+        return "", 202
+
+    def _push_pending(self):
+        """hands pending actions to subscribers in turn"""
+        while self._pending and self._subscribers:
+            subscriber = self._subscribers.pop(0)
+            subscriber.put_nowait(self._pending.popleft())
+            self._subscribers.append(subscriber)
+
+    async def _stream(self, request: web.Request) -> web.StreamResponse:
+        if self._push is None:
+            return web.Response(status=404)
+        pack = request.match_info["pack"]
+        subscriber = asyncio.Queue()
+        if self._push == "websocket":
+            response = web.WebSocketResponse()
+            await response.prepare(request)
+            send = response.send_str
+        else:
+            response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+            await response.prepare(request)
+
+            async def send(data: str):
+                await response.write(f"data: {data}\n\n".encode("utf-8"))
+
+        self._subscribers.append(subscriber)
+        self._push_pending()
+        try:
+            while True:
+                pending = await subscriber.get()
+                if pending is None:
+                    break
+                try:
+                    await send(json.dumps(self._action(pack, *pending)))
+                except ConnectionError:
+                    self._pending.appendleft(pending)
+                    break
+        finally:
+            if subscriber in self._stalled:
+                self._stalled.remove(subscriber)
+            else:
+                self._subscribers.remove(subscriber)
+            while not subscriber.empty():
+                pending = subscriber.get_nowait()
+                if pending is not None:
+                    self._pending.appendleft(pending)
+        if self._push == "websocket":
+            await response.close()
+        return response
@@ -0,0 +1,296 @@
+"""
+drives a pack through a long run of actions against the fake flyte server and fails when memory, file descriptors,
+sockets or asyncio tasks keep growing.
+
+    python -m flyte.testing.soak my_pack.main:create_pack --action echo=hello --actions 1000000 --sockets
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from flyte.client.client import Client
+from flyte.pack.classes import Event
+from flyte.pack.pack import Pack
+from flyte.testing.replay import load_pack_factory
+from flyte.testing.server import FakeFlyteServer
+from flyte.testing.transport import InMemoryTransport
+
+
+@dataclass
+class ResourceSample:
+    actions: int
+    rss_in_bytes: Optional[int]
+    traced_in_bytes: Optional[int]
+    open_fds: Optional[int]
+    sockets: Optional[int]
+    tasks: int
+
+
+def sample_resources(actions=0) -> ResourceSample:
+    """
+    samples the resources of the current process. Values that can't be read on this platform, or tracemalloc when it
+    is not tracing, are None
+    """
+    rss, fds, sockets = None, None, None
+    try:
+        with open("/proc/self/statm") as f:
+            rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        fds, sockets = 0, 0
+        for fd in os.listdir("/proc/self/fd"):
+            try:
+                target = os.readlink(f"/proc/self/fd/{fd}")
+            except OSError:  # closed since it was listed
+                continue
+            fds += 1
+            sockets += target.startswith("socket:")
+    except OSError:
+        pass
+    traced = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+    return ResourceSample(actions, rss, traced, fds, sockets, len(asyncio.all_tasks()))
+
+
+@dataclass
+class SoakLimits:
+    """growth allowed over the measured part of a run, as fitted by a least squares line through the samples"""
+
+    rss_in_bytes: int = 64 * 1024 * 1024
+    traced_in_bytes: int = 16 * 1024 * 1024
+    open_fds: int = 8
+    sockets: int = 4
+    tasks: int = 16
+
+
+def growth(samples: List[ResourceSample], resource: str) -> Optional[float]:
+    """
+    growth of a resource from the first to the last sample according to a least squares line, which ignores the ups
+    and downs of garbage collection and connection reuse that a plain difference would pick up
+    """
+    points = [
+        (s.actions, getattr(s, resource))
+        for s in samples
+        if getattr(s, resource) is not None
+    ]
+    if len(points) < 2:
+        return None
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return 0.0
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+    return slope * (points[-1][0] - points[0][0])
+
+
+@dataclass
+class SoakReport:
+    samples: List[ResourceSample]
+    measured: List[ResourceSample]
+    limits: SoakLimits
+    events: int = 0
+    growth: Dict[str, Optional[float]] = field(default_factory=dict)
+
+    @property
+    def leaks(self) -> List[str]:
+        """resources that grew more than allowed"""
+        return [
+            resource
+            for resource, value in self.growth.items()
+            if value is not None and value > getattr(self.limits, resource)
+        ]
+
+    def format(self) -> str:
+        rows = [("resource", "first", "last", "growth", "limit")]
+        for resource, value in self.growth.items():
+            first = getattr(self.measured[0], resource) if self.measured else None
+            last = getattr(self.measured[-1], resource) if self.measured else None
+            rows.append(
+                (
+                    resource,
+                    "-" if first is None else str(first),
+                    "-" if last is None else str(last),
+                    "-" if value is None else f"{value:.0f}",
+                    str(getattr(self.limits, resource)),
+                )
+            )
+        lines = [f"{a:<18}{b:>14}{c:>14}{d:>14}{e:>14}" for a, b, c, d, e in rows]
+        actions = self.samples[-1].actions if self.samples else 0
+        lines.append(f"{actions} actions, {self.events} events")
+        return "\n".join(lines)
+
+
+class SoakLeakError(Exception):
+    def __init__(self, report: SoakReport) -> None:
+        super().__init__(
+            f"resources kept growing: {', '.join(report.leaks)}\n{report.format()}"
+        )
+        self.report = report
+
+
+class SoakTest:
+    """
+    feeds actions to a pack talking to a FakeFlyteServer and samples the resources of the process every
+    sample_every completed actions. Samples taken during the warmup are left out of the trend, caches and connection
+    pools fill up then. What the fake server records is dropped after every sample so that it doesn't grow itself.
+    """
+
+    def __init__(
+        self,
+        actions: int,
+        inputs: Dict[str, str],
+        event: Optional[Event] = None,
+        sample_every=10_000,
+        warmup_fraction=0.2,
+        backlog=100,
+        limits: Optional[SoakLimits] = None,
+        sockets=False,
+        trace_memory=True,
+    ) -> None:
+        """
+        :param actions number of actions to complete
+        :param inputs action input per command, actions are spread over the commands in turn
+        :param event sent by the soak test once per action fed, on top of the events of the pack
+        :param sample_every number of completed actions between samples
+        :param warmup_fraction fraction of the run left out of the trend
+        :param backlog number of actions kept pending on the server
+        :param limits growth allowed per resource
+        :param sockets run the server on localhost and talk to it over http instead of the in memory transport
+        :param trace_memory measure python allocations with tracemalloc, which slows the pack down
+        """
+        if not inputs:
+            raise ValueError("at least one command input is required")
+        self._actions = actions
+        self._inputs = inputs
+        self._event = event
+        self._sample_every = sample_every
+        self._warmup_fraction = warmup_fraction
+        self._backlog = backlog
+        self._limits = limits or SoakLimits()
+        self._sockets = sockets
+        self._trace_memory = trace_memory
+
+    async def run(self, create_pack: Callable[[Client], Pack]) -> SoakReport:
+        """
+        :param create_pack builds the pack under test with the given client
+        :return samples and growth per resource, check leaks or use run_and_check
+        """
+        server = FakeFlyteServer(url=None if self._sockets else "http://flyte")
+        if self._sockets:
+            await server.start()
+            client = Client(url=server.url)
+        else:
+            client = Client(url=server.url, transport=InMemoryTransport(server))
+        pack = create_pack(client)
+        samples: List[ResourceSample] = []
+        state = {"completed": 0, "events": 0, "fed": 0}
+
+        def completed() -> int:
+            return state["completed"] + len(server.completed)
+
+        def continue_running():
+            # samples[0] is taken before the pack starts
+            if completed() // self._sample_every >= len(samples):
+                state["completed"] = completed()
+                state["events"] += len(server.events)
+                server.completed.clear()
+                server.events.clear()
+                samples.append(sample_resources(state["completed"]))
+            return completed() < self._actions
+
+        pack.continue_running = continue_running
+        started = self._trace_memory and not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        feeder = asyncio.ensure_future(self._feed(server, state))
+        source = None
+        if self._event is not None:
+            source = pack.attach_source(self._events(state), lambda e: e, name="soak")
+        try:
+            samples.append(sample_resources())
+            await pack.start()
+            samples.append(sample_resources(completed()))
+        finally:
+            feeder.cancel()
+            if source is not None:
+                source.close()
+            await client.close()
+            await server.stop()
+            if started:
+                tracemalloc.stop()
+        measured = [
+            s for s in samples if s.actions >= self._warmup_fraction * self._actions
+        ]
+        return SoakReport(
+            samples=samples,
+            measured=measured,
+            limits=self._limits,
+            events=state["events"] + len(server.events),
+            growth={
+                resource: growth(measured, resource)
+                for resource in (
+                    "rss_in_bytes",
+                    "traced_in_bytes",
+                    "open_fds",
+                    "sockets",
+                    "tasks",
+                )
+            },
+        )
+
+    async def run_and_check(self, create_pack: Callable[[Client], Pack]) -> SoakReport:
+        """runs the soak test and raises a SoakLeakError when a resource grew more than its limit"""
+        report = await self.run(create_pack)
+        if report.leaks:
+            raise SoakLeakError(report)
+        return report
+
+    async def _feed(self, server: FakeFlyteServer, state: Dict):
+        commands = itertools.cycle(self._inputs.items())
+        while state["fed"] < self._actions:
+            if server.pending_actions >= self._backlog:
+                await asyncio.sleep(0.001)
+                continue
+            command, action_input = next(commands)
+            server.add_action(command, action_input)
+            state["fed"] += 1
+
+    async def _events(self, state: Dict):
+        """yields the event once per action fed"""
+        for i in range(self._actions):
+            while state["fed"] <= i:
+                await asyncio.sleep(0.001)
+            yield self._event
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "factory", help="module:function returning the pack to test given a client"
+    )
+    parser.add_argument(
+        "--action",
+        action="append",
+        required=True,
+        help="command=input of the actions to feed, can be repeated",
+    )
+    parser.add_argument("--actions", type=int, default=1_000_000)
+    parser.add_argument("--sample-every", type=int, default=10_000)
+    parser.add_argument(
+        "--sockets", action="store_true", help="talk to the fake server over http"
+    )
+    parser.add_argument(
+        "--no-tracemalloc", action="store_true", help="don't trace allocations"
+    )
+    args = parser.parse_args()
+    soak = SoakTest(
+        args.actions,
+        dict(a.partition("=")[::2] for a in args.action),
+        sample_every=args.sample_every,
+        sockets=args.sockets,
+        trace_memory=not args.no_tracemalloc,
+    )
+    print(asyncio.run(soak.run_and_check(load_pack_factory(args.factory))).format())
@@ -0,0 +1,67 @@
+import contextvars
+import itertools
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from flyte.client.tracing import Span, Tracer
+
+_current_span = contextvars.ContextVar("flyte_testing_current_span", default=None)
+
+
+@dataclass
+class RecordedSpan(Span):
+    name: str
+    span_id: int
+    parent_id: Optional[int]
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    exceptions: List[BaseException] = field(default_factory=list)
+    start: float = 0
+    end: float = 0
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, exception):
+        self.exceptions.append(exception)
+
+
+class RecordingTracer(Tracer):
+    """
+    tracer that keeps finished spans in memory and propagates a w3c traceparent header, useful in tests
+    """
+
+    def __init__(self) -> None:
+        self._ids = itertools.count(1)
+        self.spans: List[RecordedSpan] = []
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        parent = _current_span.get()
+        span = RecordedSpan(
+            name=name,
+            span_id=next(self._ids),
+            parent_id=parent.span_id if parent else None,
+            attributes=dict(attributes or {}),
+            start=time.monotonic(),
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            _current_span.reset(token)
+            span.end = time.monotonic()
+            self.spans.append(span)
+
+    def inject(self, headers):
+        span = _current_span.get()
+        if span is not None:
+            headers["traceparent"] = f"00-{0:032x}-{span.span_id:016x}-01"
+
+    def find(self, name: str) -> List[RecordedSpan]:
+        return [s for s in self.spans if s.name == name]
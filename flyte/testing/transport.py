@@ -0,0 +1,22 @@
+from urllib.parse import urlsplit
+
+from flyte.client.transport import Transport
+from flyte.testing.server import FakeFlyteServer
+
+
+class InMemoryTransport(Transport):
+    """
+    transport that hands requests straight to a FakeFlyteServer, without sockets or serialization to the wire
+    """
+
+    def __init__(self, server: FakeFlyteServer) -> None:
+        self._server = server
+
+    async def get(self, url, timeout, headers=None) -> (str, int):
+        return self._server.dispatch("GET", urlsplit(url).path, None, headers=headers)
+
+    async def post(self, url, data, timeout, headers=None) -> (str, int):
+        encoding = (headers or {}).get("Content-Encoding")
+        return self._server.dispatch(
+            "POST", urlsplit(url).path, data, encoding, headers
+        )
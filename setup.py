@@ -62,7 +62,7 @@ setup(name='flyte-client',
       url='https://github.expedia.biz/iasensiomejia/python-flyte-client',
       license='MIT',
       description='Flyte client',
-      packages=find_packages(exclude=['tests']),
+      packages=find_packages(exclude=['tests', 'benchmarks']),
       long_description=open('README.md').read(),
       install_requires=[
           "aiohttp>3.5.2",
@@ -71,6 +71,9 @@ setup(name='flyte-client',
       extras_require={
           'testing': 'pytest',
           'coverage': 'coverage',
+          'http2': ['httpx[http2]'],
+          'tracing': ['opentelemetry-api'],
+          'uvloop': ['uvloop'],
       },
       setup_requires=["pytest-runner"],
       test_suite="tests",
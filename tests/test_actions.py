@@ -0,0 +1,122 @@
+import asyncio
+import unittest
+
+from flyte import Client
+from flyte.client.classes import Pack
+from flyte.client.errors import FlyteClientError
+from flyte.client.polling import AdaptivePollInterval
+from flyte.testing import FakeFlyteServer, InMemoryTransport
+
+
+class TestAdaptivePollInterval(unittest.TestCase):
+
+    def test_backs_off_up_to_max_and_resets(self):
+        interval = AdaptivePollInterval(min_interval_in_seconds=1, max_interval_in_seconds=5)
+
+        self.assertEqual([1, 2, 4, 5, 5], [interval.next() for _ in range(5)])
+        interval.reset()
+        self.assertEqual(1, interval.next())
+
+
+class TestClientActions(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeFlyteServer(url="http://flyte")
+        self.client = Client(url=self.server.url, transport=InMemoryTransport(self.server))
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def register(self):
+        self.run_async(self.client.create_pack(Pack(name="tests")))
+
+    def test_fails_when_pack_has_not_been_registered_yet(self):
+        with self.assertRaises(FlyteClientError):
+            self.run_async(self.client.actions().__anext__())
+
+    def test_yields_actions_as_they_arrive(self):
+        self.register()
+
+        async def consume():
+            actions = self.client.actions(min_poll_interval_in_seconds=0.001)
+            first = await actions.__anext__()
+            self.loop.call_later(0.01, self.server.add_action, "command2", "later")
+            second = await actions.__anext__()
+            await actions.aclose()
+            return first, second
+
+        self.server.add_action("command1", "now")
+        first, second = self.run_async(consume())
+
+        self.assertEqual(("command1", "now"), (first.command, first.input))
+        self.assertEqual(("command2", "later"), (second.command, second.input))
+
+    def test_prefetches_up_to_prefetch_actions_ahead(self):
+        self.register()
+        for i in range(5):
+            self.server.add_action("command", str(i))
+
+        async def consume():
+            actions = self.client.actions(prefetch=2, min_poll_interval_in_seconds=0.001)
+            first = await actions.__anext__()
+            await asyncio.sleep(0.01)
+            pending = self.server.pending_actions
+            await actions.aclose()
+            return first, pending
+
+        first, pending = self.run_async(consume())
+
+        self.assertEqual("0", first.input)
+        self.assertEqual(2, pending)
+
+    def test_stops_polling_when_closed(self):
+        self.register()
+
+        async def consume():
+            actions = self.client.actions(prefetch=1, min_poll_interval_in_seconds=0.001)
+            task = asyncio.ensure_future(actions.__anext__())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            await actions.aclose()
+            requests = self.server.requests
+            await asyncio.sleep(0.01)
+            return requests
+
+        requests = self.run_async(consume())
+
+        self.assertEqual(requests, self.server.requests)
+
+    def test_closes_the_source_of_prefetched_actions(self):
+        self.register()
+        closed = []
+        polled_actions = self.client._polled_actions
+
+        async def source(interval):
+            try:
+                async for action in polled_actions(interval):
+                    yield action
+            finally:
+                closed.append(True)
+
+        self.client._polled_actions = source
+        for i in range(3):
+            self.server.add_action("command", str(i))
+
+        async def consume():
+            actions = self.client.actions(prefetch=1, min_poll_interval_in_seconds=0.001)
+            await actions.__anext__()
+            await asyncio.sleep(0.01)
+            await actions.aclose()
+
+        self.run_async(consume())
+
+        self.assertEqual([True], closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
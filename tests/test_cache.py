@@ -0,0 +1,53 @@
+import unittest
+from unittest import TestCase
+
+from flyte.pack.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache(TestCase):
+
+    def test_returns_cached_values_and_counts_hits_and_misses(self):
+        cache = TTLCache(maxsize=2)
+        cache.put("a", 1)
+
+        self.assertEqual(1, cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual({"size": 1, "hits": 1, "misses": 1, "evictions": 0}, cache.stats())
+
+    def test_evicts_least_recently_used_entries(self):
+        cache = TTLCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(1, cache.evictions)
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = TTLCache(ttl_in_seconds=10, clock=clock)
+        cache.put("a", 1)
+        clock.now = 10
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(0, len(cache))
+
+    def test_zero_maxsize_disables_the_cache(self):
+        cache = TTLCache(maxsize=0)
+        cache.put("a", 1)
+
+        self.assertIsNone(cache.get("a"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import asyncio
+import unittest
+
+from flyte import Client, Pack
+from flyte.pack.classes import PackDef, Event, EventDef
+from flyte.pack.coalesce import Coalesce
+from flyte.testing import FakeFlyteServer, InMemoryTransport
+
+
+class TestEventCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeFlyteServer(url="http://flyte")
+
+    def tearDown(self):
+        self.loop.close()
+
+    def start_pack(self, event_def: EventDef) -> Pack:
+        pack = Pack(
+            pack_def=PackDef(name="tests", commands=[], labels={}, event_defs=[event_def], help_url=""),
+            client=Client(url=self.server.url, transport=InMemoryTransport(self.server)))
+        self.loop.run_until_complete(pack.start())
+        return pack
+
+    def send(self, pack: Pack, event_def: EventDef, payloads, pause_in_seconds=0.0):
+        async def run():
+            for payload in payloads:
+                await pack.send_event(Event(eventDef=event_def, payload=payload))
+                await asyncio.sleep(pause_in_seconds)
+
+        self.loop.run_until_complete(run())
+
+    def payloads(self):
+        return [e["payload"] for e in self.server.events]
+
+    def test_sends_every_event_without_policy(self):
+        alert = EventDef(name="Alert")
+        pack = self.start_pack(alert)
+
+        self.send(pack, alert, ["down", "down", "down"])
+
+        self.assertEqual(["down"] * 3, self.payloads())
+
+    def test_drops_duplicates_within_the_window(self):
+        alert = EventDef(name="Alert", coalesce=Coalesce(window_in_seconds=60))
+        pack = self.start_pack(alert)
+
+        self.send(pack, alert, [{"host": "a"}, {"host": "a"}, {"host": "b"}, {"host": "a"}])
+
+        self.assertEqual([{"host": "a"}, {"host": "b"}], self.payloads())
+        self.assertEqual({"received": 4, "sent": 2}, pack.metrics()["coalesce"]["Alert"])
+
+    def test_sends_duplicates_again_once_the_window_ended(self):
+        alert = EventDef(name="Alert", coalesce=Coalesce(window_in_seconds=0.01))
+        pack = self.start_pack(alert)
+
+        self.send(pack, alert, ["down", "down"], pause_in_seconds=0.02)
+
+        self.assertEqual(["down", "down"], self.payloads())
+
+    def test_keeps_the_latest_event_of_the_window(self):
+        status = EventDef(name="Status", coalesce=Coalesce(mode="keep_latest", window_in_seconds=0.05))
+        pack = self.start_pack(status)
+
+        self.send(pack, status, ["up", "down", "flapping", "up"])
+        self.assertEqual(["up"], self.payloads())
+        self.loop.run_until_complete(asyncio.sleep(0.1))
+
+        self.assertEqual(["up", "up"], self.payloads())
+
+    def test_counts_events_per_payload(self):
+        alert = EventDef(name="Alert", coalesce=Coalesce(mode="count", window_in_seconds=60))
+        pack = self.start_pack(alert)
+
+        self.send(pack, alert, ["down", "down", "slow", "down"])
+        self.assertEqual([], self.payloads())
+        self.loop.run_until_complete(pack.flush_events())
+
+        self.assertEqual([{"count": 3, "payload": "down"}, {"count": 1, "payload": "slow"}], self.payloads())
+
+    def test_rejects_unknown_modes(self):
+        with self.assertRaises(ValueError):
+            Coalesce(mode="sometimes")
+
+
+if __name__ == '__main__':
+    unittest.main()
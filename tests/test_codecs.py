@@ -0,0 +1,105 @@
+import unittest
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+from unittest import TestCase
+
+from dataclasses_json import dataclass_json
+
+from flyte.pack.codecs import compile_decoder, compile_encoder, encode_payload
+
+
+@dataclass
+class Address:
+    city: str
+
+
+@dataclass
+class Person:
+    name: str
+    address: Address
+    tags: List[str]
+
+
+@dataclass
+class Team:
+    members: List[Person]
+    lead: Optional[Person]
+    offices: Dict[str, Address]
+
+
+@dataclass
+class Office:
+    # string annotations, as with from __future__ import annotations
+    address: "Address"
+    annex: "Optional[Office]" = None
+
+
+@dataclass
+class Ambiguous:
+    location: Union[Address, Person]
+
+
+@dataclass
+@dataclass_json
+class Rota:
+    team: str
+    size: int = 1
+
+
+class TestCodecs(TestCase):
+
+    def test_no_input_type_passes_raw_input_through(self):
+        self.assertEqual("raw input", compile_decoder(None)("raw input"))
+        self.assertEqual("raw input", compile_decoder(str)("raw input"))
+
+    def test_decodes_json_into_plain_types(self):
+        self.assertEqual({"a": 1}, compile_decoder(dict)('{"a": 1}'))
+        self.assertEqual([1, 2], compile_decoder(list)('[1, 2]'))
+
+    def test_decodes_nested_dataclasses(self):
+        person = compile_decoder(Person)('{"name": "Isaac", "address": {"city": "London"}, "tags": ["oncall"]}')
+        self.assertEqual(Person(name="Isaac", address=Address(city="London"), tags=["oncall"]), person)
+
+    def test_decodes_dataclasses_in_lists_dicts_and_optionals(self):
+        team = compile_decoder(Team)(
+            '{"members": [{"name": "Isaac", "address": {"city": "London"}, "tags": []}], "lead": null, '
+            '"offices": {"hq": {"city": "Leeds"}}}')
+
+        self.assertEqual(Team(members=[Person(name="Isaac", address=Address(city="London"), tags=[])], lead=None,
+                              offices={"hq": Address(city="Leeds")}), team)
+        lead = compile_decoder(Team)('{"members": [], "lead": {"name": "Ada", "address": {"city": "Bath"}, '
+                                     '"tags": []}, "offices": {}}').lead
+        self.assertEqual(Person(name="Ada", address=Address(city="Bath"), tags=[]), lead)
+
+    def test_decodes_fields_with_string_annotations(self):
+        office = compile_decoder(Office)('{"address": {"city": "London"}, "annex": {"address": {"city": "Leeds"}}}')
+
+        self.assertEqual(Office(address=Address(city="London"), annex=Office(address=Address(city="Leeds"))), office)
+
+    def test_rejects_field_types_it_can_not_convert_when_compiling(self):
+        with self.assertRaises(TypeError):
+            compile_decoder(Ambiguous)
+
+    def test_decodes_dataclass_json_classes(self):
+        self.assertEqual(Rota(team="ops", size=2), compile_decoder(Rota)('{"team": "ops", "size": 2}'))
+
+    def test_decoder_is_compiled_once_per_type(self):
+        self.assertIs(compile_decoder(Person), compile_decoder(Person))
+
+    def test_decoder_raises_value_error_on_invalid_json(self):
+        with self.assertRaises(ValueError):
+            compile_decoder(Person)("not json")
+
+    def test_decoder_raises_type_error_on_missing_fields(self):
+        with self.assertRaises(TypeError):
+            compile_decoder(Address)('{"street": "High Street"}')
+
+    def test_encodes_dataclass_payloads(self):
+        self.assertEqual({"city": "London"}, encode_payload(Address(city="London")))
+        self.assertEqual({"team": "ops", "size": 1}, encode_payload(Rota(team="ops")))
+        self.assertEqual("payload", encode_payload("payload"))
+        self.assertIs(compile_encoder(Address), compile_encoder(Address))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+import asyncio
+import unittest
+
+from flyte import Client, Pack
+from flyte.client.classes import Action, Event, Link, Pack as ClientPack
+from flyte.client.completion import CompletionBatcher
+from flyte.client.errors import FlyteClientError
+from flyte.pack.classes import PackDef, Command, CommandHandler, Event as PackEvent, EventDef
+from flyte.testing import FakeFlyteServer, InMemoryTransport
+
+
+def action(id: str) -> Action:
+    return Action(command="command", input="", links=[
+        Link(href=f"http://flyte/v1/packs/tests/actions/{id}/result", rel="http://flyte/swagger#!/action/actionResult")])
+
+
+class FlakyClient:
+    """fails to complete each action the given number of times before completing it"""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.attempts = {}
+        self.batches = []
+
+    async def complete_actions(self, results):
+        self.batches.append(len(results))
+        errors = []
+        for a, _ in results:
+            attempt = self.attempts.get(a.input, 0) + 1
+            self.attempts[a.input] = attempt
+            errors.append(FlyteClientError("server error") if attempt <= self.failures else None)
+        return errors
+
+
+class TestCompletionBatcher(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def submit_all(self, batcher, count):
+        async def run():
+            futures = [batcher.submit(Action(command="command", input=str(i)), Event(event="Done"))
+                       for i in range(count)]
+            return await asyncio.gather(*futures, return_exceptions=True)
+
+        return self.run_async(run())
+
+    def test_coalesces_results_within_the_linger_window(self):
+        client = FlakyClient()
+        batcher = CompletionBatcher(client, linger_in_seconds=0.01, max_batch_size=4)
+
+        self.assertEqual([None] * 10, self.submit_all(batcher, 10))
+        self.assertEqual([4, 4, 2], client.batches)
+
+    def test_retries_individual_failures(self):
+        client = FlakyClient(failures=2)
+        batcher = CompletionBatcher(client, linger_in_seconds=0, retry_backoff_in_seconds=0.001)
+
+        self.assertEqual([None] * 3, self.submit_all(batcher, 3))
+        self.assertEqual({"0": 3, "1": 3, "2": 3}, client.attempts)
+        self.assertEqual(6, batcher.stats()["retries"])
+
+    def test_fails_the_ack_future_after_max_attempts(self):
+        client = FlakyClient(failures=5)
+        batcher = CompletionBatcher(client, linger_in_seconds=0, max_attempts=2, retry_backoff_in_seconds=0.001)
+
+        outcomes = self.submit_all(batcher, 1)
+
+        self.assertIsInstance(outcomes[0], FlyteClientError)
+        self.assertEqual(2, client.attempts["0"])
+
+    def test_flush_sends_pending_results_straight_away(self):
+        client = FlakyClient()
+        batcher = CompletionBatcher(client, linger_in_seconds=60)
+
+        async def run():
+            future = batcher.submit(Action(command="command", input="0"), Event(event="Done"))
+            await batcher.flush()
+            return future.done()
+
+        self.assertTrue(self.run_async(run()))
+
+
+    def test_flush_waits_for_batches_already_sent(self):
+        class SlowClient(FlakyClient):
+            async def complete_actions(self, results):
+                await asyncio.sleep(0.01)
+                return await super().complete_actions(results)
+
+        client = SlowClient()
+        batcher = CompletionBatcher(client, linger_in_seconds=0)
+
+        async def run():
+            future = batcher.submit(Action(command="command", input="0"), Event(event="Done"))
+            await asyncio.sleep(0.001)
+            future.cancel()
+            await batcher.flush()
+
+        self.run_async(run())
+
+        self.assertEqual([1], client.batches)
+
+
+class TestClientCompleteActions(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def complete(self, server: FakeFlyteServer, ids):
+        client = Client(url=server.url, transport=InMemoryTransport(server))
+
+        async def run():
+            await client.create_pack(ClientPack(name="tests"))
+            return await client.complete_actions([(action(id), Event(event="Done", payload=id)) for id in ids])
+
+        return self.loop.run_until_complete(run())
+
+    def test_uses_the_batch_endpoint_when_available(self):
+        server = FakeFlyteServer(url="http://flyte", batch_completion=True)
+
+        errors = self.complete(server, ["1", "2", "3"])
+
+        self.assertEqual([None] * 3, errors)
+        self.assertEqual(["1", "2", "3"], [server.completed[id]["payload"] for id in ["1", "2", "3"]])
+        self.assertEqual(3, server.requests)
+
+    def test_completes_concurrently_without_batch_endpoint(self):
+        server = FakeFlyteServer(url="http://flyte")
+
+        errors = self.complete(server, ["1", "2", "3"])
+
+        self.assertEqual([None] * 3, errors)
+        self.assertEqual(3, len(server.completed))
+        self.assertEqual(5, server.requests)
+
+
+class DoneCommandHandler(CommandHandler):
+    async def handle(self, request) -> PackEvent:
+        await asyncio.sleep(0.001)
+        return PackEvent(eventDef=EventDef(name="Done"), payload=request)
+
+
+class TestPackBatchedCompletion(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeFlyteServer(url="http://flyte", batch_completion=True)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_completes_actions_in_batches(self):
+        for i in range(20):
+            self.server.add_action("command", str(i))
+        pack = Pack(
+            pack_def=PackDef(name="tests", commands=[Command(name="command", handler=DoneCommandHandler())],
+                             labels={}, event_defs=[], help_url=""),
+            client=Client(url=self.server.url, transport=InMemoryTransport(self.server)),
+            max_concurrency=8, completion_linger_in_seconds=0.01)
+        pack.continue_running = lambda: self.server.pending_actions > 0
+
+        self.loop.run_until_complete(pack.start())
+
+        self.assertEqual(20, len(self.server.completed))
+        self.assertLess(pack.metrics()["completions"]["batches"], 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
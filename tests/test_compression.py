@@ -0,0 +1,88 @@
+import asyncio
+import gzip
+import unittest
+import zlib
+
+from flyte.client.client import Client
+from flyte.client.classes import Event, Pack
+from flyte.client.compression import compress
+from flyte.client.transport import Transport
+from flyte.testing import FakeFlyteServer
+
+
+class TestCompress(unittest.TestCase):
+
+    def test_compresses_with_gzip_and_deflate(self):
+        data = b"payload" * 100
+        self.assertEqual(data, gzip.decompress(compress(data, "gzip")))
+        self.assertEqual(data, zlib.decompress(compress(data, "deflate")))
+
+    def test_raises_value_error_for_unsupported_encodings(self):
+        with self.assertRaises(ValueError):
+            compress(b"payload", "br")
+        with self.assertRaises(ValueError):
+            Client(compression="br")
+
+
+class RecordingTransport(Transport):
+    def __init__(self):
+        self.posted = []
+
+    async def get(self, url, timeout, headers=None) -> (str, int):
+        raise NotImplementedError()
+
+    async def post(self, url, data, timeout, headers=None) -> (str, int):
+        self.posted.append((data, headers))
+        return "", 200
+
+
+class TestClientCompression(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeFlyteServer()
+        self.loop.run_until_complete(self.server.start())
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.server.stop())
+        self.loop.close()
+
+    def post_event(self, client: Client, payload: str) -> int:
+        async def post():
+            async with client:
+                await client.create_pack(Pack(name="tests"))
+                before = self.server.bytes_received
+                await client.post_event(Event(event="LogExtracted", payload=payload))
+                return self.server.bytes_received - before
+
+        return self.loop.run_until_complete(post())
+
+    def test_compresses_events_above_threshold(self):
+        payload = "log line\n" * 10000
+        plain = self.post_event(Client(url=self.server.url), payload)
+        compressed = self.post_event(
+            Client(url=self.server.url, compression="gzip", compression_threshold_in_bytes=1024), payload)
+
+        self.assertLess(compressed, plain / 10)
+        self.assertEqual(payload, self.server.events[-1]["payload"])
+
+    def test_does_not_compress_events_below_threshold(self):
+        plain = self.post_event(Client(url=self.server.url), "small")
+        sent = self.post_event(Client(url=self.server.url, compression="deflate"), "small")
+
+        self.assertEqual(plain, sent)
+
+    def test_threshold_counts_bytes_rather_than_characters(self):
+        transport = RecordingTransport()
+        client = Client(url=self.server.url, compression="gzip", compression_threshold_in_bytes=1024,
+                        transport=transport)
+
+        self.loop.run_until_complete(client._post("http://flyte/v1/packs/tests/events", "é" * 600))
+
+        data, headers = transport.posted[0]
+        self.assertEqual("gzip", headers["Content-Encoding"])
+        self.assertEqual("é" * 600, gzip.decompress(data).decode("utf-8"))
+
+
+if __name__ == '__main__':
+    unittest.main()
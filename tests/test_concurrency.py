@@ -0,0 +1,136 @@
+import asyncio
+import unittest
+
+from flyte import Client, Pack
+from flyte.pack.classes import PackDef, Command, CommandHandler, Event, EventDef
+from flyte.pack.concurrency import AIMDLimiter
+from flyte.testing import FakeFlyteServer, InMemoryTransport
+
+
+class SlowCommandHandler(CommandHandler):
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def handle(self, request) -> Event:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return Event(eventDef=EventDef(name="Done"), payload=request)
+
+
+class FailingCommandHandler(CommandHandler):
+    def handle(self, request) -> Event:
+        raise RuntimeError("downstream is down")
+
+
+class TestAIMDLimiter(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def complete(self, limiter, count, latency=0.01, failed=False):
+        for _ in range(count):
+            self.run_async(limiter.acquire())
+            self.run_async(limiter.release(latency, failed))
+
+    def test_increases_additively_up_to_max(self):
+        limiter = AIMDLimiter(min_limit=1, max_limit=4)
+
+        self.complete(limiter, 1)
+        self.assertEqual(2, limiter.limit)
+        self.complete(limiter, 3)
+        self.assertEqual(3, limiter.limit)
+        self.complete(limiter, 100)
+        self.assertEqual(4, limiter.limit)
+
+    def test_decreases_multiplicatively_on_failure_down_to_min(self):
+        limiter = AIMDLimiter(min_limit=2, max_limit=16, initial_limit=16)
+
+        self.complete(limiter, 1, failed=True)
+        self.assertEqual(8, limiter.limit)
+        self.loop.run_until_complete(asyncio.sleep(0.02))
+        self.complete(limiter, 1, failed=True)
+        self.assertEqual(4, limiter.limit)
+        for _ in range(3):
+            self.loop.run_until_complete(asyncio.sleep(0.02))
+            self.complete(limiter, 1, failed=True)
+        self.assertEqual(2, limiter.limit)
+
+    def test_decreases_when_latency_exceeds_tolerance(self):
+        limiter = AIMDLimiter(min_limit=1, max_limit=16, initial_limit=8, latency_tolerance=2)
+
+        self.complete(limiter, 1, latency=0.01)
+        self.complete(limiter, 1, latency=0.05)
+
+        self.assertEqual(4, limiter.limit)
+
+    def test_acquire_waits_for_a_free_slot(self):
+        limiter = AIMDLimiter(min_limit=1, max_limit=1)
+
+        async def run():
+            await limiter.acquire()
+            waiter = asyncio.ensure_future(limiter.acquire())
+            await asyncio.sleep(0.01)
+            blocked = not waiter.done()
+            await limiter.release()
+            await waiter
+            return blocked
+
+        self.assertTrue(self.run_async(run()))
+        self.assertEqual(1, limiter.in_flight)
+
+    def test_rejects_invalid_bounds(self):
+        with self.assertRaises(ValueError):
+            AIMDLimiter(min_limit=2, max_limit=1)
+
+
+class TestPackConcurrency(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeFlyteServer(url="http://flyte")
+
+    def tearDown(self):
+        self.loop.close()
+
+    def start_pack(self, handler, **kwargs) -> Pack:
+        pack = Pack(
+            pack_def=PackDef(name="tests", commands=[Command(name="command", handler=handler)],
+                             labels={}, event_defs=[], help_url=""),
+            client=Client(url=self.server.url, transport=InMemoryTransport(self.server)),
+            **kwargs)
+        pack.continue_running = lambda: self.server.pending_actions > 0
+        self.loop.run_until_complete(pack.start())
+        return pack
+
+    def test_handles_actions_concurrently_up_to_the_limit(self):
+        handler = SlowCommandHandler()
+        for i in range(20):
+            self.server.add_action("command", str(i))
+
+        pack = self.start_pack(handler, max_concurrency=4)
+
+        self.assertEqual(20, len(self.server.completed))
+        self.assertLessEqual(handler.max_running, 4)
+        self.assertGreater(handler.max_running, 1)
+        self.assertEqual(0, pack.metrics()["concurrency"]["in_flight"])
+
+    def test_handler_errors_complete_actions_with_fatal_events(self):
+        self.server.add_action("command", "input")
+
+        pack = self.start_pack(FailingCommandHandler())
+
+        self.assertEqual("FATAL", self.server.completed["1"]["event"])
+        self.assertEqual(1.0 * 0.05, pack.metrics()["concurrency"]["error_rate"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import asyncio
+import unittest
+from urllib.parse import urlsplit
+
+from flyte import Client
+from flyte.client.classes import Event, Pack
+from flyte.client.endpoints import EndpointPool
+from flyte.client.errors import FlyteRequestError
+from flyte.testing import FakeFlyteServer, InMemoryTransport
+
+
+class TestEndpointPool(unittest.TestCase):
+    def setUp(self):
+        self.now = 0
+        self.pool = EndpointPool(["http://a:8080", "http://b:8080", "http://c:8080"], smoothing=0.5,
+                                 cooldown_in_seconds=1, max_cooldown_in_seconds=3, clock=lambda: self.now)
+        self.a, self.b, self.c = self.pool.endpoints
+
+    def test_prefers_nodes_without_samples_then_the_fastest(self):
+        self.pool.succeeded(self.a, 0.2)
+        self.pool.succeeded(self.b, 0.1)
+        self.assertIs(self.c, self.pool.select())
+
+        self.pool.succeeded(self.c, 0.3)
+        self.assertIs(self.b, self.pool.select())
+
+    def test_smooths_latency(self):
+        self.pool.succeeded(self.a, 0.1)
+        self.pool.succeeded(self.a, 0.3)
+        self.assertAlmostEqual(0.2, self.a.latency)
+
+    def test_skips_failed_nodes_for_a_growing_cooldown(self):
+        for endpoint, latency in [(self.a, 0.1), (self.b, 0.2), (self.c, 0.3)]:
+            self.pool.succeeded(endpoint, latency)
+
+        self.pool.failed(self.a)
+        self.assertIs(self.b, self.pool.select())
+        self.now = 1
+        self.assertIs(self.a, self.pool.select())
+
+        self.pool.failed(self.a)
+        self.now = 2
+        self.assertIs(self.b, self.pool.select())
+        for _ in range(5):
+            self.pool.failed(self.a)
+        self.assertEqual(5, self.a.down_until)
+
+    def test_picks_the_node_back_first_when_all_are_down(self):
+        self.pool.failed(self.b)
+        self.pool.failed(self.a)
+        self.pool.failed(self.a)
+        self.pool.failed(self.c)
+        self.pool.failed(self.c)
+
+        self.assertIs(self.b, self.pool.select())
+
+    def test_excludes_tried_nodes_while_others_are_left(self):
+        self.assertIs(self.b, self.pool.select(exclude=[self.a]))
+        self.assertIs(self.a, self.pool.select(exclude=self.pool.endpoints))
+
+    def test_rewrites_links_of_any_node(self):
+        self.assertEqual("http://c:8080/v1/packs/p/actions/take?x=1",
+                         self.pool.resolve("http://a:8080/v1/packs/p/actions/take?x=1", self.c))
+        self.assertEqual("ws://c:8080/v1/packs/p/actions/stream",
+                         self.pool.resolve("ws://b:8080/v1/packs/p/actions/stream", self.c))
+        self.assertEqual("http://elsewhere/help", self.pool.resolve("http://elsewhere/help", self.c))
+
+
+class TestClientFailover(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeFlyteServer()
+        self.loop.run_until_complete(self.server.start())
+        self.node = self.loop.run_until_complete(self.server.add_node())
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.server.stop())
+        self.loop.close()
+
+    def test_fails_over_and_resolves_links_on_the_remaining_node(self):
+        client = Client(url=[self.server.url, self.node], timeout=1)
+
+        async def run():
+            try:
+                await client.create_pack(Pack(name="tests"))
+                # drop the kept alive connections, stopping a node only stops it from accepting new ones
+                await client.close()
+                await self.server.stop_node(self.server.url)
+                self.server.add_action("command", "input")
+                main, node = client._endpoints.endpoints
+                main.latency, node.latency = 0.001, 0.1
+                return await client.take_action()
+            finally:
+                await client.close()
+
+        action = self.loop.run_until_complete(run())
+
+        self.assertEqual("command", action.command)
+        self.assertTrue(action.get_action_complete_url().startswith(self.server.url))
+        main, node = client._endpoints.endpoints
+        self.assertEqual(1, main.failures)
+        self.assertEqual(0, node.failures)
+
+
+class TimingOutTransport(InMemoryTransport):
+    """hands requests to the fake server, except that posts to the first node time out once they reach it"""
+
+    def __init__(self, server, failing_netloc):
+        super().__init__(server)
+        self.failing_netloc = failing_netloc
+        self.posts = []
+
+    async def post(self, url, data, timeout, headers=None) -> (str, int):
+        self.posts.append(urlsplit(url).netloc)
+        if urlsplit(url).netloc == self.failing_netloc:
+            raise asyncio.TimeoutError()
+        return await super().post(url, data, timeout, headers)
+
+
+class TestNonIdempotentFailover(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeFlyteServer(url="http://flyte-1")
+        self.transport = TimingOutTransport(self.server, "flyte-1")
+        self.client = Client(url=["http://flyte-1", "http://flyte-2"], transport=self.transport)
+        main, node = self.client._endpoints.endpoints
+        main.latency, node.latency = 0.001, 0.1
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_does_not_send_a_timed_out_post_to_another_node(self):
+        async def run():
+            self.transport.failing_netloc = None
+            await self.client.create_pack(Pack(name="tests"))
+            self.transport.failing_netloc = "flyte-1"
+            await self.client.post_event(Event(event="Observed", payload="once"))
+
+        with self.assertRaises(FlyteRequestError):
+            self.loop.run_until_complete(run())
+
+        self.assertEqual(["flyte-1", "flyte-1"], self.transport.posts)
+        self.assertEqual([], self.server.events)
+
+    def test_fails_over_idempotent_posts_that_time_out(self):
+        self.loop.run_until_complete(self.client.create_pack(Pack(name="tests")))
+
+        self.assertEqual(["flyte-1", "flyte-2"], self.transport.posts)
+        self.assertEqual(["tests"], [p["name"] for p in self.server.packs])
+
+
+if __name__ == '__main__':
+    unittest.main()
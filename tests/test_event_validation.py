@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+
+from flyte import Client, Pack
+from flyte.pack.classes import PackDef, Command, CommandHandler, Event, EventDef
+from flyte.pack.errors import UndeclaredEventError
+from flyte.testing import FakeFlyteServer, InMemoryTransport
+
+DECLARED = EventDef(name="Declared")
+OBSERVED = EventDef(name="Observed")
+UNDECLARED = EventDef(name="Undeclared")
+
+
+class UndeclaredCommandHandler(CommandHandler):
+    async def handle(self, request) -> Event:
+        return Event(eventDef=UNDECLARED, payload=request)
+
+
+class TestEventValidation(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeFlyteServer(url="http://flyte")
+        self.client = Client(url=self.server.url, transport=InMemoryTransport(self.server))
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.client.close())
+        self.loop.close()
+
+    def create_pack(self, event_validation) -> Pack:
+        pack = Pack(pack_def=PackDef(name="tests", labels={}, event_defs=[OBSERVED], help_url="",
+                                     commands=[Command(name="undeclared", handler=UndeclaredCommandHandler(),
+                                                       output_events=[DECLARED])]),
+                    client=self.client, polling_frequency_in_seconds=0.001, event_validation=event_validation)
+        pack.continue_running = lambda: self.server.pending_actions > 0
+        return pack
+
+    def test_strict_validation_rejects_undeclared_events_without_sending_them(self):
+        pack = self.create_pack("strict")
+        self.loop.run_until_complete(pack.start())
+
+        self.loop.run_until_complete(pack.send_event(Event(eventDef=OBSERVED, payload="ok")))
+        self.loop.run_until_complete(pack.send_event(Event(eventDef=DECLARED, payload="ok")))
+        with self.assertRaises(UndeclaredEventError) as cm:
+            self.loop.run_until_complete(pack.send_event(Event(eventDef=UNDECLARED, payload="nope")))
+
+        self.assertEqual("Undeclared", cm.exception.event_name)
+        self.assertIn("Declared", cm.exception.declared)
+        self.assertIsNone(cm.exception.original_exception)
+        self.assertEqual(["Observed", "Declared"], [e["event"] for e in self.server.events])
+
+    def test_strict_validation_completes_actions_returning_undeclared_events_with_a_fatal_event(self):
+        pack = self.create_pack("strict")
+        action_id = self.server.add_action("undeclared", "input")
+
+        self.loop.run_until_complete(pack.start())
+
+        self.assertEqual("FATAL", self.server.completed[action_id]["event"])
+        self.assertIn("Undeclared", self.server.completed[action_id]["payload"])
+
+    def test_warn_validation_logs_and_sends_undeclared_events(self):
+        pack = self.create_pack("warn")
+        action_id = self.server.add_action("undeclared", "input")
+
+        with self.assertLogs("flyte.pack.pack", "WARNING") as logs:
+            self.loop.run_until_complete(pack.start())
+            self.loop.run_until_complete(pack.send_event(Event(eventDef=UNDECLARED, payload="sent")))
+
+        self.assertEqual("Undeclared", self.server.completed[action_id]["event"])
+        self.assertEqual(["Undeclared"], [e["event"] for e in self.server.events])
+        self.assertIn("sending undeclared event Undeclared", logs.output[0])
+
+    def test_rejects_unknown_validation_modes(self):
+        with self.assertRaises(ValueError):
+            self.create_pack("lenient")
+
+
+if __name__ == '__main__':
+    unittest.main()
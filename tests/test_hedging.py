@@ -0,0 +1,151 @@
+import asyncio
+import json
+import unittest
+
+from flyte import Client
+from flyte.client import deadline
+from flyte.client.errors import FlyteDeadlineExceededError, FlyteRequestError
+from flyte.client.hedging import LatencyTracker
+from flyte.client.transport import Transport
+
+LINKS = json.dumps({"links": [{"href": "http://flyte/v1/packs", "rel": "http://flyte/swagger#!/pack/listPacks"}]})
+
+
+class SlowTransport(Transport):
+    """answers the api links request after the delay of each call in turn"""
+
+    def __init__(self, delays):
+        self.delays = list(delays)
+        self.calls = []
+        self.cancelled = 0
+
+    async def get(self, url, timeout, headers=None) -> (str, int):
+        delay = self.delays.pop(0) if self.delays else 0
+        self.calls.append((timeout, headers))
+        if delay > timeout:
+            await asyncio.sleep(timeout)
+            raise asyncio.TimeoutError()
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return LINKS, 200
+
+    async def post(self, url, data, timeout, headers=None) -> (str, int):
+        raise NotImplementedError()
+
+
+class TestLatencyTracker(unittest.TestCase):
+
+    def test_quantile_needs_enough_samples(self):
+        tracker = LatencyTracker(min_samples=10)
+        for latency in range(9):
+            tracker.record(latency)
+        self.assertIsNone(tracker.quantile(0.95))
+
+        tracker.record(9)
+        self.assertEqual(9, tracker.quantile(0.95))
+        self.assertEqual(5, tracker.quantile(0.5))
+
+    def test_keeps_only_the_most_recent_latencies(self):
+        tracker = LatencyTracker(window=10, min_samples=1)
+        for latency in [100] * 10 + [1] * 10:
+            tracker.record(latency)
+        self.assertEqual(1, tracker.quantile(0.95))
+
+
+class TestHedgedRequests(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def fetch_links(self, client, times):
+        for _ in range(times):
+            self.loop.run_until_complete(client._get_api_links())
+
+    def test_sends_a_second_request_when_the_first_is_slower_than_the_quantile(self):
+        transport = SlowTransport([0.001] * 10 + [1, 0.001])
+        client = Client(url="http://flyte", transport=transport, hedge_quantile=0.95)
+
+        self.fetch_links(client, 10)
+        start = self.loop.time()
+        self.fetch_links(client, 1)
+
+        self.assertLess(self.loop.time() - start, 0.5)
+        self.assertEqual(12, len(transport.calls))
+        self.assertEqual(1, transport.cancelled)
+        self.assertEqual(transport.calls[10][1]["Idempotency-Key"], transport.calls[11][1]["Idempotency-Key"])
+
+    def test_cancels_the_first_request_when_the_caller_is_cancelled_during_the_delay(self):
+        transport = SlowTransport([0.01] * 10 + [1])
+        client = Client(url="http://flyte", transport=transport, hedge_quantile=0.95)
+        self.fetch_links(client, 10)
+
+        async def cancel_during_the_delay():
+            caller = asyncio.ensure_future(client._get_api_links())
+            await asyncio.sleep(0.001)
+            caller.cancel()
+            await asyncio.gather(caller, return_exceptions=True)
+            await asyncio.sleep(0)
+
+        self.loop.run_until_complete(cancel_during_the_delay())
+
+        self.assertEqual(11, len(transport.calls))
+        self.assertEqual(1, transport.cancelled)
+
+    def test_does_not_hedge_without_enough_latency_samples_or_when_disabled(self):
+        for client_kwargs in [{"hedge_quantile": 0.95}, {}]:
+            transport = SlowTransport([0.05])
+            client = Client(url="http://flyte", transport=transport, **client_kwargs)
+
+            self.fetch_links(client, 1)
+
+            self.assertEqual([(5, None)], transport.calls)
+
+
+class TestDeadlines(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_requests_only_get_the_remaining_budget(self):
+        transport = SlowTransport([0])
+        client = Client(url="http://flyte", transport=transport, timeout=5)
+
+        with deadline.deadline(1):
+            self.loop.run_until_complete(client._get_api_links())
+
+        self.assertLessEqual(transport.calls[0][0], 1)
+
+    def test_nested_deadlines_only_shorten_the_budget(self):
+        with deadline.deadline(0.1):
+            with deadline.deadline(10):
+                self.assertLessEqual(deadline.remaining(), 0.1)
+        self.assertIsNone(deadline.remaining())
+
+    def test_raises_when_the_deadline_is_exceeded(self):
+        client = Client(url="http://flyte", transport=SlowTransport([1]))
+
+        with deadline.deadline(0.01):
+            with self.assertRaises(FlyteDeadlineExceededError):
+                self.loop.run_until_complete(client._get_api_links())
+            with self.assertRaises(FlyteDeadlineExceededError):
+                self.loop.run_until_complete(client._get_api_links())
+
+    def test_timeouts_within_the_budget_are_request_errors(self):
+        client = Client(url="http://flyte", transport=SlowTransport([1]), timeout=0.01)
+
+        with deadline.deadline(10):
+            with self.assertRaises(FlyteRequestError):
+                self.loop.run_until_complete(client._get_api_links())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import logging
+import unittest
+
+from flyte.client.logs import SummarizedLog
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSummarizedLog(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.logger = logging.getLogger("tests.logs")
+        self.log = SummarizedLog(self.logger, logging.INFO, "no actions available yet", 60, self.clock)
+
+    def test_logs_the_first_occurrence_straight_away(self):
+        with self.assertLogs(self.logger, logging.INFO) as logs:
+            self.log()
+
+        self.assertEqual(["no actions available yet"], [r.getMessage() for r in logs.records])
+
+    def test_summarizes_occurrences_within_the_interval(self):
+        with self.assertLogs(self.logger, logging.INFO) as logs:
+            self.log()
+            for _ in range(99):
+                self.clock.now += 0.5
+                self.log()
+            self.clock.now += 10.5
+            self.log()
+
+        self.assertEqual(["no actions available yet", "no actions available yet (100 times in the last 60s)"],
+                         [r.getMessage() for r in logs.records])
+        self.assertEqual((100, 60.0), (logs.records[1].count, logs.records[1].interval_in_seconds))
+
+    def test_formats_the_arguments_of_the_latest_occurrence(self):
+        log = SummarizedLog(self.logger, logging.ERROR, "fetching failed: %s", 1, self.clock)
+
+        with self.assertLogs(self.logger, logging.ERROR) as logs:
+            log("first")
+            log("second")
+            self.clock.now = 1
+            log("third")
+
+        self.assertEqual(["fetching failed: first", "fetching failed: third (2 times in the last 1s)"],
+                         [r.getMessage() for r in logs.records])
+
+    def test_does_nothing_while_the_level_is_disabled(self):
+        self.logger.setLevel(logging.WARNING)
+        try:
+            self.log()
+            self.log()
+        finally:
+            self.logger.setLevel(logging.NOTSET)
+
+        with self.assertLogs(self.logger, logging.INFO) as logs:
+            self.log()
+
+        self.assertEqual(["no actions available yet"], [r.getMessage() for r in logs.records])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,7 @@ from unittest import TestCase
 
 from flyte.pack.classes import Command, CommandHandler, EventDef, PackDef, Event
 from flyte.pack.mappers import to_event_list_name, to_client_command, to_client_event_def, to_client_pack, \
-    to_client_event
+    to_client_event, to_event_index
 from flyte.client.classes import Command as ClientCommand, Link, EventDef as ClientEventDef, Pack as ClientPack, \
     Event as ClientEvent
 
@@ -110,6 +110,18 @@ class TestMappers(TestCase):
         )
         self.assertEqual(cp, to_client_pack(pd))
 
+    def test_index_declared_event_names_per_command_and_pack_wide(self):
+        pack_def = PackDef(name="name", labels={}, help_url="", event_defs=[EventDef(name="spontaneous")], commands=[
+            Command(name="command1", handler=None, output_events=[EventDef(name="output1"), EventDef(name="output2")]),
+            Command(name="command2", handler=None, output_events=[]),
+        ])
+
+        pack_wide, per_command = to_event_index(pack_def)
+
+        self.assertEqual(frozenset({"spontaneous", "output1", "output2", "FATAL"}), pack_wide)
+        self.assertEqual({"command1": frozenset({"output1", "output2", "FATAL"}), "command2": frozenset({"FATAL"})},
+                         per_command)
+
 
 if __name__ == '__main__':
     unittest.main()
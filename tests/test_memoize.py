@@ -0,0 +1,76 @@
+import asyncio
+import unittest
+from unittest import TestCase
+
+from flyte.pack.memoize import Memoize, Memoizer
+
+
+class Backend:
+    def __init__(self):
+        self.calls = 0
+
+    async def lookup(self, key):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return f"result-{key}"
+
+    async def fail(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("backend down")
+
+
+class TestMemoizer(TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.backend = Backend()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_reuses_results_for_the_same_input(self):
+        memoizer = Memoizer(Memoize())
+
+        self.run_async(memoizer.call("a", lambda: self.backend.lookup("a")))
+        result = self.run_async(memoizer.call("a", lambda: self.backend.lookup("a")))
+        self.run_async(memoizer.call("b", lambda: self.backend.lookup("b")))
+
+        self.assertEqual("result-a", result)
+        self.assertEqual(2, self.backend.calls)
+
+    def test_coalesces_concurrent_calls_with_the_same_input(self):
+        memoizer = Memoizer(Memoize())
+
+        results = self.run_async(asyncio.gather(
+            *[memoizer.call("a", lambda: self.backend.lookup("a")) for _ in range(5)]))
+
+        self.assertEqual(["result-a"] * 5, results)
+        self.assertEqual(1, self.backend.calls)
+        self.assertEqual(4, memoizer.stats()["coalesced"])
+
+    def test_does_not_cache_failures_and_propagates_them_to_waiters(self):
+        memoizer = Memoizer(Memoize())
+
+        results = self.run_async(asyncio.gather(
+            *[memoizer.call("a", self.backend.fail) for _ in range(3)], return_exceptions=True))
+        self.run_async(memoizer.call("a", lambda: self.backend.lookup("a")))
+
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual(2, self.backend.calls)
+
+    def test_skips_results_rejected_by_should_cache(self):
+        memoizer = Memoizer(Memoize(), should_cache=lambda r: r != "result-a")
+
+        self.run_async(memoizer.call("a", lambda: self.backend.lookup("a")))
+        self.run_async(memoizer.call("a", lambda: self.backend.lookup("a")))
+
+        self.assertEqual(2, self.backend.calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import asyncio
 import unittest
+from dataclasses import dataclass
 from unittest import mock
 from unittest.mock import Mock, patch
 
@@ -22,6 +23,16 @@ def create_event_def(event_name):
     return EventDef(name=event_name, help_url="http://help.com")
 
 
+@dataclass
+class RotaRequest:
+    team: str
+
+
+class RotaRequestHandler(CommandHandler):
+    def handle(self, request: RotaRequest) -> Event:
+        return Event(eventDef=create_event_def("rota"), payload=request.team)
+
+
 class Command2Handler(CommandHandler):
     def handle(self, request) -> Event:
         return Event(eventDef=create_event_def("event2"), payload="all good!")
@@ -132,6 +143,64 @@ class TestPackRegistration(AioHTTPTestCase):
         mock_client.complete_action.assert_called_once_with(action,
                                                             ClientEvent(event="event1", payload="all good!"))
 
+    @unittest_run_loop
+    async def test_handler_receives_decoded_input(self):
+        action = Action(command="rota", input='{"team": "ops"}', links=[Link(href="link", rel="actionResult")])
+        mock_client = Mock()
+        mock_client.complete_action.return_value = await create_future(None)
+        pack_def = createPackDef()
+        pack_def.commands.append(Command(name="rota", handler=RotaRequestHandler(), input_type=RotaRequest))
+
+        p = Pack(pack_def=pack_def, client=mock_client)
+        await p._handle_action({c.name: c.handler for c in pack_def.commands}, action)
+
+        mock_client.complete_action.assert_called_once_with(action, ClientEvent(event="rota", payload="ops"))
+
+    @unittest_run_loop
+    async def test_invalid_input_completes_action_with_fatal_event(self):
+        action = Action(command="rota", input="not json", links=[Link(href="link", rel="actionResult")])
+        mock_client = Mock()
+        mock_client.complete_action.return_value = await create_future(None)
+        handler = Mock()
+        pack_def = createPackDef()
+        pack_def.commands.append(Command(name="rota", handler=handler, input_type=RotaRequest))
+
+        p = Pack(pack_def=pack_def, client=mock_client)
+        await p._handle_action({c.name: c.handler for c in pack_def.commands}, action)
+
+        handler.handle.assert_not_called()
+        self.assertEqual("FATAL", mock_client.complete_action.call_args[0][1].event)
+
+    @unittest_run_loop
+    async def test_redelivered_action_is_completed_from_cache(self):
+        action = Action(command="command1", input="{}", links=[Link(href="link", rel="actionResult")])
+        handler = Mock()
+        handler.handle.return_value = Event(eventDef=create_event_def("event1"), payload="all good!")
+        mock_client = Mock()
+        mock_client.complete_action.side_effect = [FlyteClientError("whoops"), await create_future(None)]
+
+        p = Pack(pack_def=createPackDef(), client=mock_client)
+        await p._handle_action({"command1": handler}, action)
+        await p._handle_action({"command1": handler}, action)
+
+        handler.handle.assert_called_once_with("{}")
+        self.assertEqual(2, mock_client.complete_action.call_count)
+        self.assertEqual(1, p.metrics()["result_cache"]["hits"])
+        self.assertEqual(0, p.metrics()["result_cache"]["size"])
+
+    @unittest_run_loop
+    async def test_completed_action_results_are_not_kept(self):
+        action = Action(command="command1", input="{}", links=[Link(href="link", rel="actionResult")])
+        handler = Mock()
+        handler.handle.return_value = Event(eventDef=create_event_def("event1"), payload="all good!")
+        mock_client = Mock()
+        mock_client.complete_action.return_value = await create_future(None)
+
+        p = Pack(pack_def=createPackDef(), client=mock_client)
+        await p._handle_action({"command1": handler}, action)
+
+        self.assertEqual(0, p.metrics()["result_cache"]["size"])
+
 
 if __name__ == '__main__':
     unittest.main()
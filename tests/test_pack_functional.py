@@ -26,6 +26,7 @@ class TestWebClientFunctional(unittest.TestCase):
         self.loop.run_until_complete(asyncio.wait_for(task, 0.1))
 
     def tearDown(self):
+        self.loop.run_until_complete(self.client.close())
         self.loop.run_until_complete(self.site.stop())
 
     async def mock_server(self):
@@ -107,8 +108,8 @@ class TestWebClientFunctional(unittest.TestCase):
             event_defs=[],
             help_url="http://github.com/your-repo.git")
 
-        self.pack = Pack(pack_def=pack_def,
-                         client=Client(url=self.site.name))
+        self.client = Client(url=self.site.name)
+        self.pack = Pack(pack_def=pack_def, client=self.client)
 
         def patch_continue_running(that):
             def all_flow_processed():
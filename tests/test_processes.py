@@ -0,0 +1,107 @@
+import asyncio
+import concurrent.futures
+import json
+import os
+import unittest
+from dataclasses import dataclass
+
+from flyte import Client, Pack
+from flyte.pack import processes
+from flyte.pack.classes import PackDef, Command, CommandHandler, Event, EventDef
+from flyte.testing import FakeFlyteServer, InMemoryTransport
+
+
+@dataclass
+class Report:
+    rows: list
+
+
+class SummaryCommandHandler(CommandHandler):
+    def handle(self, request: Report) -> Event:
+        return Event(eventDef=EventDef(name="Summarised"), payload={"rows": len(request.rows), "pid": os.getpid()})
+
+
+class EchoCommandHandler(CommandHandler):
+    def handle(self, request) -> Event:
+        return Event(eventDef=EventDef(name="Echoed"), payload=request)
+
+
+class FailingCommandHandler(CommandHandler):
+    def handle(self, request) -> Event:
+        raise RuntimeError("boom")
+
+
+def segments():
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+
+@unittest.skipIf(processes.shared_memory is None, "shared memory requires python 3.8+")
+class TestSharedPayloads(unittest.TestCase):
+
+    def test_shares_bytes_with_another_process_and_releases_them(self):
+        before = segments()
+        segment, ref = processes.share(b"payload")
+
+        self.assertEqual(b"payload", processes.read(ref))
+        processes.release(segment)
+
+        self.assertEqual(before, segments())
+
+    def test_take_releases_segments_created_elsewhere(self):
+        before = segments()
+        segment, ref = processes.share(b"payload")
+        segment.close()
+
+        self.assertEqual(b"payload", processes.take(ref))
+        self.assertEqual(before, segments())
+
+
+class TestProcessPoolCommands(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeFlyteServer(url="http://flyte")
+        self.pool = concurrent.futures.ProcessPoolExecutor(max_workers=1)
+
+    def tearDown(self):
+        self.pool.shutdown()
+        self.loop.close()
+
+    def run_pack(self, command: Command, threshold: int):
+        pack = Pack(
+            pack_def=PackDef(name="tests", commands=[command], labels={}, event_defs=[], help_url=""),
+            client=Client(url=self.server.url, transport=InMemoryTransport(self.server)),
+            process_pool=self.pool, shared_memory_threshold_in_bytes=threshold)
+        pack.continue_running = lambda: self.server.pending_actions > 0
+        self.loop.run_until_complete(pack.start())
+
+    def test_runs_handlers_in_worker_processes(self):
+        self.server.add_action("summarise", json.dumps({"rows": [1, 2, 3]}))
+
+        self.run_pack(Command(name="summarise", handler=SummaryCommandHandler(), input_type=Report,
+                              run_in_process=True), threshold=1024)
+
+        payload = self.server.completed["1"]["payload"]
+        self.assertEqual(3, payload["rows"])
+        self.assertNotEqual(os.getpid(), payload["pid"])
+
+    def test_passes_large_inputs_and_outputs_through_shared_memory(self):
+        large = "x" * (2 * 1024 * 1024)
+        self.server.add_action("echo", large)
+        before = segments()
+
+        self.run_pack(Command(name="echo", handler=EchoCommandHandler(), run_in_process=True), threshold=1024)
+
+        self.assertEqual({"event": "Echoed", "payload": large}, self.server.completed["1"])
+        self.assertEqual(before, segments())
+
+    def test_handler_errors_complete_actions_with_fatal_events(self):
+        self.server.add_action("fail", "")
+
+        self.run_pack(Command(name="fail", handler=FailingCommandHandler(), run_in_process=True), threshold=1024)
+
+        self.assertEqual("FATAL", self.server.completed["1"]["event"])
+
+
+if __name__ == '__main__':
+    unittest.main()
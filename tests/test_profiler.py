@@ -0,0 +1,184 @@
+import asyncio
+import os
+import shutil
+import signal
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+from flyte import Client, Pack
+from flyte.pack.classes import PackDef, Command, CommandHandler, Event, EventDef
+from flyte.pack.profiler import SamplingProfiler
+from flyte.testing import FakeFlyteServer, InMemoryTransport
+
+
+def hot_loop(seconds):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        pass
+
+
+class BusyCommandHandler(CommandHandler):
+    def handle(self, request) -> Event:
+        hot_loop(0.1)
+        return Event(eventDef=EventDef(name="Done"), payload=request)
+
+
+async def waiting_handler(done: asyncio.Event):
+    await done.wait()
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir)
+
+    def test_samples_threads_running_handlers(self):
+        profiler = SamplingProfiler(output_dir=self.output_dir)
+        running, done = threading.Event(), threading.Event()
+
+        def handler():
+            with profiler.track_thread("command"):
+                running.set()
+                done.wait()
+
+        thread = threading.Thread(target=handler)
+        thread.start()
+        running.wait()
+        profiler.sample()
+        profiler.sample()
+        done.set()
+        thread.join()
+        profiler.sample()
+
+        stacks = profiler.collapsed()["command"]
+        self.assertEqual(1, len(stacks.splitlines()))
+        self.assertIn("handler (test_profiler.py);wait (threading.py)", stacks)
+        self.assertTrue(stacks.endswith(" 2"))
+
+    def test_samples_suspended_coroutine_handlers(self):
+        profiler = SamplingProfiler(output_dir=self.output_dir)
+        loop = asyncio.new_event_loop()
+
+        async def run():
+            done = asyncio.Event()
+            coroutine = waiting_handler(done)
+            with profiler.track_coroutine("command", coroutine):
+                task = asyncio.ensure_future(coroutine)
+                await asyncio.sleep(0)
+                profiler.sample()
+                done.set()
+                await task
+
+        loop.run_until_complete(run())
+        loop.close()
+
+        self.assertTrue(
+            profiler.collapsed()["command"].startswith(
+                "waiting_handler (test_profiler.py);wait (locks.py)"
+            )
+        )
+
+    def test_dump_writes_a_file_per_command_and_resets(self):
+        profiler = SamplingProfiler(output_dir=self.output_dir)
+        with profiler.track_thread("command"):
+            profiler.sample()
+
+        profiler.dump()
+
+        files = os.listdir(self.output_dir)
+        self.assertEqual(1, len(files))
+        self.assertTrue(files[0].startswith("command-") and files[0].endswith(".folded"))
+        self.assertEqual({}, profiler.collapsed())
+
+    def test_toggle_starts_and_stops_sampling(self):
+        profiler = SamplingProfiler(interval_in_seconds=0.001, output_dir=self.output_dir)
+
+        profiler.toggle()
+        self.assertTrue(profiler.enabled)
+        with profiler.track_thread("command"):
+            hot_loop(0.05)
+        profiler.toggle()
+
+        self.assertFalse(profiler.enabled)
+        self.assertEqual(1, len(os.listdir(self.output_dir)))
+
+
+class TestPackProfiling(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeFlyteServer(url="http://flyte")
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.loop.close()
+        shutil.rmtree(self.output_dir)
+
+    def test_profiles_handlers_per_command(self):
+        output_dir = self.output_dir
+        profiler = SamplingProfiler(interval_in_seconds=0.001, enabled=True, output_dir=output_dir)
+        pack = Pack(
+            pack_def=PackDef(name="tests", commands=[Command(name="busy", handler=BusyCommandHandler())],
+                             labels={}, event_defs=[], help_url=""),
+            client=Client(url=self.server.url, transport=InMemoryTransport(self.server)),
+            profiler=profiler, profiler_signal=None)
+        pack.continue_running = lambda: self.server.pending_actions > 0
+        self.server.add_action("busy", "input")
+
+        self.loop.run_until_complete(pack.start())
+        profiler.disable()
+
+        self.assertEqual(1, len(self.server.completed))
+        folded = os.listdir(output_dir)
+        self.assertEqual(1, len(folded))
+        with open(os.path.join(output_dir, folded[0])) as f:
+            self.assertIn("handle (test_profiler.py);hot_loop (test_profiler.py)", f.read())
+
+    def create_pack(self, **kwargs) -> Pack:
+        return Pack(pack_def=PackDef(name="tests", commands=[], labels={}, event_defs=[], help_url=""),
+                    client=Client(url=self.server.url, transport=InMemoryTransport(self.server)), **kwargs)
+
+    def test_close_stops_the_health_check_server(self):
+        with socket.socket() as s:
+            s.bind(("", 0))
+            port = s.getsockname()[1]
+        pack = self.create_pack(health_check_port=port, profiler_signal=None)
+
+        self.loop.run_until_complete(pack.start())
+        self.loop.run_until_complete(pack.close())
+
+        with socket.socket() as s:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind(("", port))
+
+    @unittest.skipUnless(hasattr(signal, "SIGUSR2"), "requires SIGUSR2")
+    def test_profiler_signal_toggles_the_profiler_off_the_event_loop(self):
+        toggled = []
+
+        class RecordingProfiler(SamplingProfiler):
+            def toggle(self):
+                toggled.append(threading.current_thread())
+
+        pack = self.create_pack(profiler=RecordingProfiler(output_dir=self.output_dir), profiler_signal=signal.SIGUSR2)
+
+        async def run():
+            await pack.start()
+            os.kill(os.getpid(), signal.SIGUSR2)
+            while not toggled:
+                await asyncio.sleep(0.001)
+            self.loop.remove_signal_handler(signal.SIGUSR2)
+            await pack.close()
+
+        self.loop.run_until_complete(run())
+
+        self.assertEqual(1, len(toggled))
+        self.assertIsNot(threading.main_thread(), toggled[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
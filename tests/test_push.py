@@ -0,0 +1,118 @@
+import asyncio
+import unittest
+
+from flyte import Client
+from flyte.client.classes import Pack
+from flyte.client.transport import AiohttpTransport
+from flyte.testing import FakeFlyteServer, InMemoryTransport
+
+
+class TestPushedActions(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(asyncio.wait_for(coro, 5))
+
+    async def start(self, push) -> (FakeFlyteServer, Client):
+        server = FakeFlyteServer(push=push)
+        await server.start()
+        client = Client(url=server.url)
+        await client.create_pack(Pack(name="tests"))
+        return server, client
+
+    async def wait_for_subscriber(self, server: FakeFlyteServer):
+        while server.subscribers == 0:
+            await asyncio.sleep(0.001)
+
+    def assert_actions_are_pushed(self, push):
+        async def run():
+            server, client = await self.start(push)
+            server.add_action("command1", "pending")
+            actions = client.actions(min_poll_interval_in_seconds=0.001)
+            try:
+                first = await actions.__anext__()
+                self.loop.call_soon(server.add_action, "command2", "pushed")
+                second = await actions.__anext__()
+                return server.requests, first, second
+            finally:
+                await actions.aclose()
+                await client.close()
+                await server.stop()
+
+        requests, first, second = self.run_async(run())
+
+        self.assertEqual("pending", first.input)
+        self.assertEqual("pushed", second.input)
+        self.assertEqual(2, requests, "only api links and registration should be requested")
+
+    def test_receives_actions_over_websocket(self):
+        self.assert_actions_are_pushed("websocket")
+
+    def test_receives_actions_over_server_sent_events(self):
+        self.assert_actions_are_pushed("sse")
+
+    def test_falls_back_to_polling_when_the_stream_is_lost(self):
+        async def run():
+            server, client = await self.start("websocket")
+            actions = client.actions(min_poll_interval_in_seconds=0.001)
+            try:
+                task = asyncio.ensure_future(actions.__anext__())
+                await self.wait_for_subscriber(server)
+                server.disconnect_subscribers()
+                while server.subscribers > 0:
+                    await asyncio.sleep(0.001)
+                server.add_action("command", "polled")
+                return await task, server.requests
+            finally:
+                await actions.aclose()
+                await client.close()
+                await server.stop()
+
+        action, requests = self.run_async(run())
+
+        self.assertEqual("polled", action.input)
+        self.assertGreater(requests, 2)
+
+    def test_falls_back_to_polling_when_a_server_sent_events_stream_stalls(self):
+        async def run():
+            server = FakeFlyteServer(push="sse")
+            await server.start()
+            client = Client(url=server.url, transport=AiohttpTransport(sse_idle_timeout_in_seconds=0.05))
+            await client.create_pack(Pack(name="tests"))
+            actions = client.actions(min_poll_interval_in_seconds=0.001)
+            try:
+                task = asyncio.ensure_future(actions.__anext__())
+                await self.wait_for_subscriber(server)
+                server.stall_subscribers()
+                server.add_action("command", "polled")
+                return await task
+            finally:
+                await actions.aclose()
+                await client.close()
+                await server.stop()
+
+        self.assertEqual("polled", self.run_async(run()).input)
+
+    def test_polls_when_the_transport_can_not_subscribe(self):
+        server = FakeFlyteServer(url="http://flyte", push="sse")
+        client = Client(url=server.url, transport=InMemoryTransport(server))
+        server.add_action("command", "polled")
+
+        async def run():
+            await client.create_pack(Pack(name="tests"))
+            actions = client.actions()
+            try:
+                return await actions.__anext__()
+            finally:
+                await actions.aclose()
+
+        self.assertEqual("polled", self.run_async(run()).input)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import asyncio
+import json
+import unittest
+
+from flyte import Client, Pack
+from flyte.client.classes import Action, Event, Link, Pack as ClientPack, RawPayload, encode_event
+from flyte.pack.classes import PackDef, Command, CommandHandler, Event as PackEvent, EventDef
+from flyte.testing import FakeFlyteServer, InMemoryTransport
+
+DOCUMENT = '{"alerts": [{"host": "a", "message": "disk \\"/\\" full"}]}'
+
+
+class RawCommandHandler(CommandHandler):
+    def handle(self, request) -> PackEvent:
+        return PackEvent(eventDef=EventDef(name="Done"), payload=RawPayload(DOCUMENT))
+
+
+class TestEncodeEvent(unittest.TestCase):
+
+    def test_splices_raw_payloads_without_escaping_them(self):
+        body = encode_event(Event(event="Alerted", payload=RawPayload(DOCUMENT.encode("utf-8"))))
+
+        self.assertIn(DOCUMENT.encode("utf-8"), body)
+        self.assertEqual({"event": "Alerted", "payload": json.loads(DOCUMENT)}, json.loads(body))
+
+    def test_encodes_other_payloads_as_before(self):
+        event = Event(event="Alerted", payload="text")
+        self.assertEqual(event.to_json(), encode_event(event))
+
+    def test_splices_raw_payloads_nested_in_the_payload(self):
+        body = encode_event(Event(event="Alerted", payload={"count": 2, "payload": RawPayload(DOCUMENT)}))
+
+        self.assertEqual({"event": "Alerted", "payload": {"count": 2, "payload": json.loads(DOCUMENT)}}, json.loads(body))
+
+    def test_does_not_mistake_strings_of_the_payload_for_raw_payloads(self):
+        payload = {"text": "\0raw-payload-0\0", "payload": RawPayload("[1]")}
+
+        self.assertEqual({"event": "Alerted", "payload": {"text": "\0raw-payload-0\0", "payload": [1]}},
+                         json.loads(encode_event(Event(event="Alerted", payload=payload))))
+
+    def test_raw_payloads_compare_by_content(self):
+        self.assertEqual(RawPayload("{}"), RawPayload(b"{}"))
+        self.assertEqual(hash(RawPayload("{}")), hash(RawPayload(b"{}")))
+
+
+class TestRawPayloadRequests(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def client(self, server, **kwargs):
+        client = Client(url=server.url, transport=InMemoryTransport(server), **kwargs)
+        self.loop.run_until_complete(client.create_pack(ClientPack(name="tests")))
+        return client
+
+    def test_posts_raw_payloads_compressed_or_not(self):
+        for compression in (None, "gzip"):
+            server = FakeFlyteServer(url="http://flyte")
+            client = self.client(server, compression=compression, compression_threshold_in_bytes=0)
+
+            self.loop.run_until_complete(client.post_event(Event(event="Alerted", payload=RawPayload(DOCUMENT))))
+
+            self.assertEqual([{"event": "Alerted", "payload": json.loads(DOCUMENT)}], server.events)
+            self.assertEqual("text/plain; charset=utf-8", server.last_request_headers["Content-Type"])
+
+    def test_completes_batches_with_raw_payloads(self):
+        server = FakeFlyteServer(url="http://flyte", batch_completion=True)
+        client = self.client(server)
+        actions = [Action(command="command", input="", links=[
+            Link(href=f"http://flyte/v1/packs/tests/actions/{id}/result", rel="actionResult")]) for id in "12"]
+
+        errors = self.loop.run_until_complete(client.complete_actions([
+            (actions[0], Event(event="Done", payload=RawPayload(DOCUMENT))),
+            (actions[1], Event(event="Done", payload={"plain": True}))]))
+
+        self.assertEqual([None, None], errors)
+        self.assertEqual(json.loads(DOCUMENT), server.completed["1"]["payload"])
+        self.assertEqual({"plain": True}, server.completed["2"]["payload"])
+
+    def test_handlers_can_return_raw_payloads(self):
+        server = FakeFlyteServer(url="http://flyte")
+        server.add_action("command", "")
+        pack = Pack(
+            pack_def=PackDef(name="tests", commands=[Command(name="command", handler=RawCommandHandler())],
+                             labels={}, event_defs=[], help_url=""),
+            client=Client(url=server.url, transport=InMemoryTransport(server)))
+        pack.continue_running = lambda: server.pending_actions > 0
+
+        self.loop.run_until_complete(pack.start())
+
+        self.assertEqual({"event": "Done", "payload": json.loads(DOCUMENT)}, server.completed["1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+
+from flyte import Client, Pack
+from flyte.pack.classes import PackDef, Command, CommandHandler, Event, EventDef
+from flyte.testing import FakeFlyteServer, InMemoryTransport, TrafficRecorder, TrafficReplayer
+from flyte.client.classes import Event as ClientEvent, Pack as ClientPack
+from flyte.testing.replay import ReplayReport, TrafficSummary, read_trace
+
+ECHOED = EventDef(name="Echoed")
+OBSERVED = EventDef(name="Observed")
+
+
+class EchoCommandHandler(CommandHandler):
+    async def handle(self, request) -> Event:
+        await asyncio.sleep(0.001)
+        return Event(eventDef=ECHOED, payload=request)
+
+
+def create_pack(client: Client, **kwargs) -> Pack:
+    return Pack(pack_def=PackDef(name="tests", labels={}, event_defs=[OBSERVED], help_url="",
+                                 commands=[Command(name="echo", handler=EchoCommandHandler(), output_events=[ECHOED])]),
+                client=client, polling_frequency_in_seconds=0.001, max_concurrency=4, **kwargs)
+
+
+def create_batching_pack(client: Client) -> Pack:
+    return create_pack(client, completion_linger_in_seconds=0.005)
+
+
+class TestTrafficRecordAndReplay(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.dir = tempfile.mkdtemp()
+        self.trace = os.path.join(self.dir, "trace.jsonl.gz")
+
+    def tearDown(self):
+        self.loop.close()
+        shutil.rmtree(self.dir)
+
+    def record(self, actions: int, create=create_pack):
+        server = FakeFlyteServer(url="http://flyte", batch_completion=True)
+        client = Client(url=server.url, transport=TrafficRecorder(InMemoryTransport(server), self.trace))
+        pack = create(client)
+        for i in range(actions):
+            server.add_action("echo", f"input-{i}")
+        pack.continue_running = lambda: len(server.completed) < actions
+
+        async def run():
+            await pack.start()
+            await pack.send_event(Event(eventDef=OBSERVED, payload="done"))
+            await client.close()
+
+        self.loop.run_until_complete(run())
+
+    def test_records_actions_completions_and_events(self):
+        self.record(3)
+
+        records = list(read_trace(self.trace))
+
+        self.assertEqual(["action"] * 3, [r["type"] for r in records if r["type"] == "action"])
+        self.assertEqual({"type": "action", "command": "echo", "input": "input-0", "size": 7},
+                         {k: v for k, v in records[0].items() if k != "t"})
+        completions = [r for r in records if r["type"] == "completion"]
+        self.assertEqual(3, len(completions))
+        self.assertTrue(all(r["event"] == "Echoed" and r["latency"] >= 0 for r in completions))
+        self.assertEqual(("event", "Observed"), (records[-1]["type"], records[-1]["event"]))
+
+    def test_replays_a_trace_against_a_pack_and_reports_both(self):
+        self.record(20)
+
+        report = self.loop.run_until_complete(
+            TrafficReplayer(self.trace, speed=10).run(create_pack, os.path.join(self.dir, "replay.jsonl")))
+
+        self.assertEqual(20, report.recorded.completions)
+        self.assertEqual(20, report.replayed.completions)
+        self.assertEqual(20, report.replayed.actions)
+        self.assertIsNotNone(report.replayed.latency(0.99))
+        self.assertIn("replayed 10x", report.format())
+
+    def test_records_and_replays_completions_sent_in_batches(self):
+        self.record(20, create_batching_pack)
+
+        completions = [r for r in read_trace(self.trace) if r["type"] == "completion"]
+        self.assertEqual(20, len(completions))
+        self.assertTrue(all(r["command"] == "echo" and r["latency"] >= 0 for r in completions))
+
+        report = self.loop.run_until_complete(
+            TrafficReplayer(self.trace, speed=10).run(create_batching_pack, os.path.join(self.dir, "replay.jsonl")))
+
+        self.assertEqual(20, report.replayed.completions)
+
+    def test_records_the_names_of_compressed_events(self):
+        server = FakeFlyteServer(url="http://flyte")
+        client = Client(url=server.url, compression="gzip", compression_threshold_in_bytes=100,
+                        transport=TrafficRecorder(InMemoryTransport(server), self.trace))
+
+        async def run():
+            await client.create_pack(ClientPack(name="tests"))
+            await client.post_event(ClientEvent(event="Large", payload="x" * 200))
+            await client.post_event(ClientEvent(event="Small", payload="x"))
+            await client.close()
+
+        self.loop.run_until_complete(run())
+
+        summary = TrafficSummary.of(list(read_trace(self.trace)))
+        self.assertEqual({"Large": 1, "Small": 1}, summary.events)
+        self.assertIn("event Large", ReplayReport(summary, summary, 1).format())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import asyncio
+import gc
+import os
+import signal
+import threading
+import unittest
+
+import flyte
+from flyte import Client, Pack
+from flyte.pack.classes import PackDef, Command, CommandHandler, Event, EventDef
+from flyte.testing import FakeFlyteServer, InMemoryTransport
+
+ECHOED = EventDef(name="Echoed")
+
+
+class ThreadRecordingCommandHandler(CommandHandler):
+    """synchronous handler, run in the default executor"""
+
+    def __init__(self, on_handle=None):
+        self.threads = []
+        self.on_handle = on_handle
+
+    def handle(self, request) -> Event:
+        self.threads.append(threading.current_thread().name)
+        if self.on_handle is not None:
+            self.on_handle()
+        return Event(eventDef=ECHOED, payload=request)
+
+
+def create_pack(server: FakeFlyteServer, handler: CommandHandler) -> Pack:
+    return Pack(pack_def=PackDef(name="runner", labels={}, event_defs=[], help_url="",
+                                 commands=[Command(name="echo", handler=handler, output_events=[ECHOED])]),
+                client=Client(url=server.url, transport=InMemoryTransport(server)),
+                polling_frequency_in_seconds=0.001, max_concurrency=1)
+
+
+class TestRun(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeFlyteServer(url="http://flyte")
+
+    def test_runs_the_pack_until_it_stops(self):
+        handler = ThreadRecordingCommandHandler()
+        pack = create_pack(self.server, handler)
+        for i in range(3):
+            self.server.add_action("echo", f"input-{i}")
+        pack.continue_running = lambda: self.server.pending_actions > 0
+
+        flyte.run(pack, use_uvloop=False, executor_workers=2)
+
+        self.assertEqual(3, len(self.server.completed))
+        self.assertTrue(all(name.startswith("flyte") for name in handler.threads))
+
+    def test_restores_the_gc_thresholds(self):
+        thresholds = gc.get_threshold()
+        seen = []
+        pack = create_pack(self.server, ThreadRecordingCommandHandler(lambda: seen.append(gc.get_threshold())))
+        self.server.add_action("echo", "input")
+        pack.continue_running = lambda: self.server.pending_actions > 0
+
+        flyte.run(pack, use_uvloop=False, gc_thresholds=(50000, 20, 20))
+
+        self.assertEqual([(50000, 20, 20)], seen)
+        self.assertEqual(thresholds, gc.get_threshold())
+
+    @unittest.skipUnless(hasattr(signal, "SIGUSR1"), "requires SIGUSR1")
+    def test_finishes_the_actions_in_flight_on_a_shutdown_signal(self):
+        pack = create_pack(self.server, ThreadRecordingCommandHandler(lambda: os.kill(os.getpid(), signal.SIGUSR1)))
+        for i in range(5):
+            self.server.add_action("echo", f"input-{i}")
+
+        flyte.run(pack, use_uvloop=False, shutdown_signals=[signal.SIGUSR1])
+
+        self.assertEqual(["1"], list(self.server.completed))
+        self.assertEqual(4, self.server.pending_actions)
+
+    @unittest.skipUnless(hasattr(signal, "SIGUSR1"), "requires SIGUSR1")
+    def test_runs_a_pack_without_commands_until_a_shutdown_signal(self):
+        server = self.server
+        observed = EventDef(name="Observed")
+        pack = Pack(pack_def=PackDef(name="runner", labels={}, event_defs=[observed], help_url="", commands=[]),
+                    client=Client(url=server.url, transport=InMemoryTransport(server)))
+
+        async def lines():
+            for i in range(5):
+                yield f"line-{i}"
+            while len(server.events) < 5:
+                await asyncio.sleep(0.001)
+            os.kill(os.getpid(), signal.SIGUSR1)
+
+        pack.attach_source(lines(), lambda line: Event(eventDef=observed, payload=line))
+
+        flyte.run(pack, use_uvloop=False, shutdown_signals=[signal.SIGUSR1])
+
+        self.assertEqual([f"line-{i}" for i in range(5)], [e["payload"] for e in server.events])
+
+    def test_requires_uvloop_when_asked_to_use_it(self):
+        try:
+            import uvloop  # noqa
+        except ImportError:
+            with self.assertRaises(ImportError):
+                flyte.runner.new_event_loop(use_uvloop=True)
+        else:
+            loop = flyte.runner.new_event_loop(use_uvloop=True)
+            self.assertIsInstance(loop, uvloop.Loop)
+            loop.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import asyncio
+import unittest
+
+from flyte import Client, Pack
+from flyte.pack.classes import PackDef, Command, CommandHandler, Event, EventDef
+from flyte.pack.scheduling import PriorityActionQueue
+from flyte.testing import FakeFlyteServer, InMemoryTransport
+
+
+class RecordingCommandHandler(CommandHandler):
+    def __init__(self, handled: list):
+        self.handled = handled
+
+    async def handle(self, request) -> Event:
+        await asyncio.sleep(0.001)
+        self.handled.append(request)
+        return Event(eventDef=EventDef(name="Done"), payload=request)
+
+
+class TestPriorityActionQueue(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.now = 0
+
+    def tearDown(self):
+        self.loop.close()
+
+    def drain(self, queue, count):
+        return [self.loop.run_until_complete(queue.get()) for _ in range(count)]
+
+    def test_higher_priorities_first_then_fifo(self):
+        queue = PriorityActionQueue(clock=lambda: self.now)
+        for priority, item in [(0, "bulk-1"), (10, "page-1"), (0, "bulk-2"), (10, "page-2")]:
+            self.loop.run_until_complete(queue.put(priority, item))
+
+        self.assertEqual(["page-1", "page-2", "bulk-1", "bulk-2"], self.drain(queue, 4))
+
+    def test_waiting_items_age_ahead_of_newer_higher_priorities(self):
+        queue = PriorityActionQueue(aging_rate_per_second=1, clock=lambda: self.now)
+        self.loop.run_until_complete(queue.put(0, "bulk"))
+        self.now = 10
+        self.loop.run_until_complete(queue.put(5, "page"))
+
+        self.assertEqual(["bulk", "page"], self.drain(queue, 2))
+
+    def test_put_waits_while_the_queue_is_full(self):
+        queue = PriorityActionQueue(maxsize=1)
+
+        async def run():
+            await queue.put(0, "first")
+            second = asyncio.ensure_future(queue.put(0, "second"))
+            await asyncio.sleep(0.01)
+            blocked = not second.done()
+            await queue.get()
+            await second
+            return blocked
+
+        self.assertTrue(self.loop.run_until_complete(run()))
+        self.assertEqual(1, queue.qsize())
+
+
+class TestPackPriorities(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeFlyteServer(url="http://flyte")
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_urgent_commands_jump_ahead_when_saturated(self):
+        handled = []
+        handler = RecordingCommandHandler(handled)
+        pack = Pack(
+            pack_def=PackDef(name="tests", labels={}, event_defs=[], help_url="", commands=[
+                Command(name="report", handler=handler),
+                Command(name="page", handler=handler, priority=10)]),
+            client=Client(url=self.server.url, transport=InMemoryTransport(self.server)),
+            action_queue_size=10)
+        pack.continue_running = lambda: self.server.pending_actions > 0
+        for i in range(4):
+            self.server.add_action("report", f"report-{i}")
+        self.server.add_action("page", "page")
+
+        self.loop.run_until_complete(pack.start())
+
+        self.assertEqual(["page", "report-0", "report-1", "report-2", "report-3"], handled)
+        self.assertEqual(5, len(self.server.completed))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import asyncio
+import unittest
+
+from flyte import Client, Pack
+from flyte.pack.classes import PackDef, Command, CommandHandler, Event, EventDef
+from flyte.testing.soak import ResourceSample, SoakLimits, SoakTest, SoakLeakError, growth
+
+ECHOED = EventDef(name="Echoed")
+OBSERVED = EventDef(name="Observed")
+
+retained = []
+
+
+class EchoCommandHandler(CommandHandler):
+    async def handle(self, request) -> Event:
+        return Event(eventDef=ECHOED, payload=request)
+
+
+class LeakingCommandHandler(CommandHandler):
+    async def handle(self, request) -> Event:
+        retained.append(bytearray(8192))
+        return Event(eventDef=ECHOED, payload=request)
+
+
+def pack_factory(handler: CommandHandler):
+    def create_pack(client: Client) -> Pack:
+        return Pack(pack_def=PackDef(name="soak", labels={}, event_defs=[OBSERVED], help_url="",
+                                     commands=[Command(name="echo", handler=handler, output_events=[ECHOED])]),
+                    client=client, polling_frequency_in_seconds=0.001, max_concurrency=8)
+    return create_pack
+
+
+def sample(actions, tasks):
+    return ResourceSample(actions, None, None, None, None, tasks)
+
+
+class TestGrowth(unittest.TestCase):
+    def test_growth_ignores_ups_and_downs(self):
+        samples = [sample(0, 10), sample(100, 30), sample(200, 10), sample(300, 30), sample(400, 10)]
+
+        self.assertAlmostEqual(0.0, growth(samples, "tasks"))
+
+    def test_growth_of_a_steadily_growing_resource(self):
+        samples = [sample(a, 5 + a // 10) for a in range(0, 500, 100)]
+
+        self.assertAlmostEqual(40.0, growth(samples, "tasks"))
+
+    def test_growth_is_none_without_enough_samples(self):
+        self.assertIsNone(growth([sample(0, 1)], "tasks"))
+        self.assertIsNone(growth([sample(0, 1), sample(1, 1)], "rss_in_bytes"))
+
+
+class TestSoak(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        retained.clear()
+
+    def tearDown(self):
+        self.loop.close()
+        retained.clear()
+
+    def test_a_pack_that_releases_its_resources_passes(self):
+        soak = SoakTest(600, {"echo": "hello"}, event=Event(eventDef=OBSERVED, payload="x"), sample_every=60,
+                        limits=SoakLimits(traced_in_bytes=2 * 1024 * 1024))
+
+        report = self.loop.run_until_complete(soak.run_and_check(pack_factory(EchoCommandHandler())))
+
+        self.assertEqual([], report.leaks)
+        self.assertEqual(600, report.samples[-1].actions)
+        self.assertEqual(600, report.events)
+        self.assertGreaterEqual(len(report.measured), 8)
+        self.assertIn("600 actions, 600 events", report.format())
+
+    def test_a_pack_that_retains_memory_per_action_fails(self):
+        soak = SoakTest(600, {"echo": "hello"}, sample_every=60,
+                        limits=SoakLimits(traced_in_bytes=2 * 1024 * 1024))
+
+        with self.assertRaises(SoakLeakError) as context:
+            self.loop.run_until_complete(soak.run_and_check(pack_factory(LeakingCommandHandler())))
+
+        self.assertIn("traced_in_bytes", context.exception.report.leaks)
+
+
+if __name__ == '__main__':
+    unittest.main()
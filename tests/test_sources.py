@@ -0,0 +1,118 @@
+import asyncio
+import unittest
+
+from flyte import Client, Pack
+from flyte.pack.classes import PackDef, Event, EventDef
+from flyte.testing import FakeFlyteServer, InMemoryTransport
+
+OBSERVED = EventDef(name="Observed")
+
+
+async def items(values, produced: list = None):
+    for value in values:
+        if produced is not None:
+            produced.append(value)
+        yield value
+        await asyncio.sleep(0)
+
+
+def observed(value) -> Event:
+    return Event(eventDef=OBSERVED, payload=value)
+
+
+class GatedClient:
+    """registers packs and blocks posting events until the gate opens"""
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.events = []
+
+    async def create_pack(self, pack):
+        return pack
+
+    async def post_event(self, event):
+        await self.gate.wait()
+        self.events.append(event)
+
+
+class TestAttachSource(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeFlyteServer(url="http://flyte")
+
+    def tearDown(self):
+        self.loop.close()
+
+    def pack(self, client=None) -> Pack:
+        return Pack(pack_def=PackDef(name="tests", commands=[], labels={}, event_defs=[OBSERVED], help_url=""),
+                    client=client or Client(url=self.server.url, transport=InMemoryTransport(self.server)))
+
+    def test_sends_the_events_of_every_source_once_started(self):
+        pack = self.pack()
+        logs = pack.attach_source(items(range(10)), observed, name="logs")
+        queue = pack.attach_source(items(range(100, 105)), observed, senders=2)
+
+        self.loop.run_until_complete(pack.start())
+        self.loop.run_until_complete(asyncio.gather(logs.join(), queue.join()))
+
+        self.assertEqual(15, len(self.server.events))
+        self.assertEqual(["logs", "source-2"], list(pack.metrics()["sources"]))
+        self.assertEqual(10, pack.metrics()["sources"]["logs"]["sent"])
+
+    def test_skips_items_mapped_to_none_and_awaits_async_mappers(self):
+        async def even_only(value):
+            return observed(value) if value % 2 == 0 else None
+
+        pack = self.pack()
+        self.loop.run_until_complete(pack.start())
+        source = pack.attach_source(items(range(6)), even_only)
+        self.loop.run_until_complete(source.join())
+
+        self.assertEqual([0, 2, 4], [e["payload"] for e in self.server.events])
+        self.assertEqual(3, source.stats()["skipped"])
+
+    def test_pauses_the_source_while_the_buffer_is_full(self):
+        client = GatedClient()
+        pack = self.pack(client)
+        produced = []
+        source = pack.attach_source(items(range(50), produced), observed, buffer_size=5)
+
+        async def run():
+            await pack.start()
+            await asyncio.sleep(0.05)
+            paused_at = len(produced)
+            client.gate.set()
+            await source.join()
+            return paused_at
+
+        paused_at = self.loop.run_until_complete(run())
+
+        # the buffer, the item the sender is blocked on and the item waiting for room in the buffer
+        self.assertEqual(7, paused_at)
+        self.assertEqual(50, len(client.events))
+        self.assertGreater(source.stats()["paused_in_seconds"], 0.04)
+        self.assertGreater(source.stats()["lag_in_seconds"], 0)
+
+    def test_counts_failed_sends_and_keeps_reading(self):
+        pack = self.pack()
+        source = pack.attach_source(items(range(3)), observed)
+        self.loop.run_until_complete(source_without_registration(pack, source))
+
+        self.assertEqual(3, source.stats()["failed"])
+
+    def test_rejects_duplicate_names(self):
+        pack = self.pack()
+        pack.attach_source(items([]), observed, name="logs")
+        with self.assertRaises(ValueError):
+            pack.attach_source(items([]), observed, name="logs")
+
+
+async def source_without_registration(pack, source):
+    """starts a source of a pack that was never registered, so sending events fails"""
+    source.start()
+    await source.join()
+
+
+if __name__ == '__main__':
+    unittest.main()
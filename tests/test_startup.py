@@ -0,0 +1,113 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from flyte import Client, Pack
+from flyte.client.errors import FlyteClientError
+from flyte.pack.classes import PackDef, Command, CommandHandler, Event, EventDef
+from flyte.testing import FakeFlyteServer, InMemoryTransport
+
+ECHOED = EventDef(name="Echoed")
+
+
+class EchoCommandHandler(CommandHandler):
+    async def handle(self, request) -> Event:
+        return Event(eventDef=ECHOED, payload=request)
+
+
+class UnavailableTransport(InMemoryTransport):
+    """answers 503 to the first requests, like a flyte api that is still starting"""
+
+    def __init__(self, server, unavailable_requests):
+        super().__init__(server)
+        self.unavailable_requests = unavailable_requests
+
+    async def get(self, url, timeout, headers=None) -> (str, int):
+        if self.unavailable_requests > 0:
+            self.unavailable_requests -= 1
+            return "starting", 503
+        return await super().get(url, timeout, headers)
+
+    async def post(self, url, data, timeout, headers=None) -> (str, int):
+        if self.unavailable_requests > 0:
+            self.unavailable_requests -= 1
+            return "starting", 503
+        return await super().post(url, data, timeout, headers)
+
+
+class TestStartup(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeFlyteServer(url="http://flyte")
+
+    def tearDown(self):
+        self.loop.close()
+
+    def create_pack(self, client, **kwargs) -> Pack:
+        pack = Pack(pack_def=PackDef(name="tests", labels={}, event_defs=[], help_url="",
+                                     commands=[Command(name="echo", handler=EchoCommandHandler(),
+                                                       output_events=[ECHOED])]),
+                    client=client, polling_frequency_in_seconds=0.001, **kwargs)
+        pack.continue_running = lambda: self.server.pending_actions > 0
+        return pack
+
+    def test_probes_the_api_until_it_is_ready_then_registers_and_handles_actions(self):
+        client = Client(url=self.server.url, transport=UnavailableTransport(self.server, 3))
+        pack = self.create_pack(client, startup_timeout_in_seconds=5)
+        action_id = self.server.add_action("echo", "input")
+
+        self.loop.run_until_complete(pack.start())
+
+        self.assertEqual(["tests"], [p["name"] for p in self.server.packs])
+        self.assertEqual("Echoed", self.server.completed[action_id]["event"])
+
+    def test_raises_when_the_api_is_not_ready_within_the_startup_timeout(self):
+        client = Client(url=self.server.url, transport=UnavailableTransport(self.server, 1000))
+        pack = self.create_pack(client, startup_timeout_in_seconds=0.3)
+
+        start = self.loop.time()
+        with self.assertRaises(FlyteClientError) as cm:
+            self.loop.run_until_complete(pack.start())
+
+        self.assertLess(self.loop.time() - start, 1)
+        self.assertIn("flyte api not ready", str(cm.exception))
+        self.assertEqual([], self.server.packs)
+
+    @mock.patch("flyte.pack.pack.register_retry_wait_in_seconds", 0.01)
+    def test_handles_actions_once_registered_after_a_retry(self):
+        # the links are fetched, then the first registration fails
+        transport = UnavailableTransport(self.server, 0)
+        client = Client(url=self.server.url, transport=transport)
+        self.loop.run_until_complete(client.wait_until_ready(1))
+        transport.unavailable_requests = 1
+        pack = self.create_pack(client)
+        action_id = self.server.add_action("echo", "input")
+
+        self.loop.run_until_complete(pack.start())
+
+        self.assertEqual("Echoed", self.server.completed[action_id]["event"])
+
+    def test_warms_up_connections_to_every_node_before_registering(self):
+        async def start():
+            await self.server.start()
+            second = await self.server.add_node()
+            client = Client(url=[self.server.url, second])
+            pack = self.create_pack(client, warm_connections=3, startup_timeout_in_seconds=5)
+            try:
+                await pack.start()
+            finally:
+                await client.close()
+                await self.server.stop()
+
+        server = FakeFlyteServer()
+        self.server = server
+        self.loop.run_until_complete(start())
+
+        # one probe, 3 connections to each of the 2 nodes and the registration
+        self.assertEqual(1 + 6 + 1, server.requests)
+        self.assertEqual(["tests"], [p["name"] for p in server.packs])
+
+
+if __name__ == '__main__':
+    unittest.main()
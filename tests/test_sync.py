@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import unittest
+
+from flyte import Client, Pack
+from flyte.client.classes import Event, Pack as ClientPack
+from flyte.client.errors import FlyteClientError
+from flyte.client.sync import SyncClient
+from flyte.pack.classes import PackDef, Event as PackEvent, EventDef
+from flyte.testing import FakeFlyteServer, InMemoryTransport
+
+
+class TestSyncClient(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeFlyteServer(url="http://flyte")
+        self.client = SyncClient(url=self.server.url, transport=InMemoryTransport(self.server))
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_calls_the_client_on_its_background_loop(self):
+        self.client.create_pack(ClientPack(name="tests"))
+        self.server.add_action("command", "input")
+
+        action = self.client.take_action()
+        self.client.complete_action(action, Event(event="Done"))
+
+        self.assertEqual("command", action.command)
+        self.assertEqual({"1": {"event": "Done", "payload": None}}, self.server.completed)
+
+    def test_posts_events_from_many_threads(self):
+        self.client.create_pack(ClientPack(name="tests"))
+
+        def post():
+            for i in range(25):
+                self.client.post_event(Event(event="Observed", payload=str(i)))
+
+        threads = [threading.Thread(target=post) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(100, len(self.server.events))
+
+    def test_raises_client_errors_in_the_calling_thread(self):
+        with self.assertRaises(FlyteClientError):
+            self.client.post_event(Event(event="Observed"))
+
+    def test_close_is_idempotent(self):
+        self.client.close()
+        self.client.close()
+
+
+class TestPackSendEventThreadsafe(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeFlyteServer(url="http://flyte")
+        self.pack = Pack(
+            pack_def=PackDef(name="tests", commands=[], labels={}, event_defs=[], help_url=""),
+            client=Client(url=self.server.url, transport=InMemoryTransport(self.server)))
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_sends_events_from_other_threads_on_the_pack_loop(self):
+        self.loop.run_until_complete(self.pack.start())
+        event = PackEvent(eventDef=EventDef(name="Observed"), payload="from a thread")
+
+        self.loop.run_until_complete(self.loop.run_in_executor(
+            None, lambda: self.pack.send_event_threadsafe(event).result(1)))
+
+        self.assertEqual([{"event": "Observed", "payload": "from a thread"}], self.server.events)
+
+    def test_requires_a_started_pack(self):
+        with self.assertRaises(RuntimeError):
+            self.pack.send_event_threadsafe(PackEvent(eventDef=EventDef(name="Observed"), payload=""))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import asyncio
+import unittest
+
+from flyte import Client, Pack
+from flyte.client.tracing import Tracer
+from flyte.pack.classes import PackDef, Command, CommandHandler, Event, EventDef
+from flyte.testing import FakeFlyteServer, InMemoryTransport, RecordingTracer
+
+
+class RotaCommandHandler(CommandHandler):
+    def handle(self, request) -> Event:
+        return Event(eventDef=EventDef(name="RotaRetrieved"), payload="Isaac")
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeFlyteServer(url="http://flyte")
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_pack(self, tracer) -> Pack:
+        client = Client(url=self.server.url, transport=InMemoryTransport(self.server), tracer=tracer)
+        pack = Pack(
+            pack_def=PackDef(name="tests", commands=[Command(name="Rota", handler=RotaCommandHandler())],
+                             labels={}, event_defs=[], help_url=""),
+            client=client,
+            tracer=tracer)
+        pack.continue_running = lambda: self.server.pending_actions > 0
+        self.loop.run_until_complete(pack.start())
+        return pack
+
+    def test_default_tracer_does_nothing(self):
+        tracer = Tracer()
+        with tracer.start_as_current_span("span") as span:
+            span.set_attribute("key", "value")
+            headers = {}
+            tracer.inject(headers)
+
+        self.assertEqual({}, headers)
+
+    def test_reports_spans_for_each_stage_of_an_action(self):
+        tracer = RecordingTracer()
+        self.server.add_action("Rota", "{}")
+
+        self.run_pack(tracer)
+
+        action, = tracer.find("flyte.action")
+        self.assertEqual({"flyte.command": "Rota", "flyte.event": "RotaRetrieved"}, action.attributes)
+        children = {s.name for s in tracer.spans if s.parent_id == action.span_id}
+        self.assertEqual({"flyte.decode_input", "flyte.handle", "flyte.map_event", "flyte.serialize_event",
+                          "flyte.complete_action"}, children)
+        self.assertTrue(tracer.find("flyte.take_action"))
+        self.assertTrue(tracer.find("flyte.decode_action"))
+        self.assertTrue(all(s.duration >= 0 for s in tracer.spans))
+
+    def test_propagates_trace_context_in_request_headers(self):
+        tracer = RecordingTracer()
+        self.server.add_action("Rota", "{}")
+
+        self.run_pack(tracer)
+
+        complete, = tracer.find("flyte.complete_action")
+        self.assertEqual(f"00-{0:032x}-{complete.span_id:016x}-01",
+                         self.server.last_request_headers["traceparent"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import asyncio
+import unittest
+
+from flyte import Client, Pack
+from flyte.client.classes import Event as ClientEvent, Pack as ClientPack
+from flyte.client.transport import AiohttpTransport, HttpxTransport
+from flyte.pack.classes import PackDef, Command, CommandHandler, Event, EventDef
+from flyte.testing import FakeFlyteServer, InMemoryTransport
+
+
+class RotaCommandHandler(CommandHandler):
+    def handle(self, request) -> Event:
+        return Event(eventDef=EventDef(name="RotaRetrieved"), payload=f"on call for {request}")
+
+
+def create_pack_def() -> PackDef:
+    return PackDef(
+        name="rota-pack",
+        commands=[Command(name="Rota", handler=RotaCommandHandler(), output_events=[EventDef(name="RotaRetrieved")])],
+        labels={},
+        event_defs=[],
+        help_url="http://github.com/your-repo.git")
+
+
+class TestTransport(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_pack_runs_against_in_memory_transport(self):
+        server = FakeFlyteServer(url="http://flyte")
+        server.add_action("Rota", "ops")
+        client = Client(url=server.url, transport=InMemoryTransport(server))
+        pack = Pack(pack_def=create_pack_def(), client=client)
+        pack.continue_running = lambda: server.pending_actions > 0
+
+        self.loop.run_until_complete(pack.start())
+        self.loop.run_until_complete(pack.send_event(Event(eventDef=EventDef(name="RotaChanged"), payload="ops")))
+
+        self.assertEqual({"1": {"event": "RotaRetrieved", "payload": "on call for ops"}}, server.completed)
+        self.assertEqual([{"event": "RotaChanged", "payload": "ops"}], server.events)
+
+    def test_aiohttp_transport_reuses_one_session(self):
+        server = FakeFlyteServer()
+        transport = AiohttpTransport()
+
+        async def run():
+            await server.start()
+            try:
+                async with Client(url=server.url, transport=transport) as client:
+                    await client.create_pack(ClientPack(name="tests"))
+                    session = transport._session
+                    await client.post_event(ClientEvent(event="tests", payload="tests"))
+                    self.assertIs(session, transport._session)
+                self.assertIsNone(transport._session)
+            finally:
+                await server.stop()
+
+        self.loop.run_until_complete(run())
+
+    def test_aiohttp_transport_must_be_closed_before_changing_loops(self):
+        transport = AiohttpTransport()
+
+        async def open_session():
+            return transport._get_session()
+
+        session = self.loop.run_until_complete(open_session())
+        other_loop = asyncio.new_event_loop()
+        try:
+            with self.assertRaises(RuntimeError):
+                other_loop.run_until_complete(open_session())
+            self.assertIs(session, transport._session)
+
+            self.loop.run_until_complete(transport.close())
+            self.assertTrue(session.closed)
+            self.assertIsNot(session, other_loop.run_until_complete(open_session()))
+            other_loop.run_until_complete(transport.close())
+        finally:
+            other_loop.close()
+
+    def test_httpx_transport_requires_httpx(self):
+        try:
+            import httpx  # noqa
+        except ImportError:
+            with self.assertRaises(ImportError):
+                HttpxTransport()
+        else:
+            self.loop.run_until_complete(HttpxTransport().close())
+
+
+if __name__ == '__main__':
+    unittest.main()